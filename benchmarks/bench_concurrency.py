@@ -0,0 +1,104 @@
+import os
+import sys
+import random
+import sqlite3
+import tempfile
+import threading
+import time
+
+# --- PATH FIX ---
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+# ----------------
+
+from models.database_manager import DatabaseManager
+from benchmarks.bench_gpa import build_database
+
+def percentile(values, fraction):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+def writer(db, num_students, num_courses, batch_size, stop, results, seed):
+    """ Assigns grade batches back to back, each in one transaction, like a registrar import. """
+    rng = random.Random(seed)
+    try:
+        while not stop.is_set():
+            rows = [(rng.randint(1, num_students), rng.randint(1, num_courses), round(rng.uniform(40, 100), 1))
+                    for _ in range(batch_size)]
+            start = time.perf_counter()
+            try:
+                db.assign_grades_bulk(rows)
+                results['write_times'].append(time.perf_counter() - start)
+            except sqlite3.OperationalError as e:
+                results['errors'].append(str(e))
+    finally:
+        DatabaseManager.pool.close_thread_connections()
+
+def reader(db, num_students, stop, results, seed):
+    """ Mixes the reads the GUI makes: a keyset page of grades and the dashboard snapshot. """
+    rng = random.Random(seed)
+    try:
+        while not stop.is_set():
+            start = time.perf_counter()
+            try:
+                if rng.random() < 0.8:
+                    db.connect().execute("""
+                        SELECT G.student_id, S.name, G.course_id, C.name, G.grade_value
+                        FROM Grade G
+                        JOIN Student S ON G.student_id = S.student_id
+                        JOIN Course C ON G.course_id = C.course_id
+                        WHERE (G.student_id, G.course_id) > (?, 0)
+                        ORDER BY G.student_id, G.course_id
+                        LIMIT 200
+                    """, (rng.randint(0, num_students),)).fetchall()
+                else:
+                    db.get_dashboard_snapshot()
+                results['read_times'].append(time.perf_counter() - start)
+            except sqlite3.OperationalError as e:
+                results['errors'].append(str(e))
+    finally:
+        DatabaseManager.pool.close_thread_connections()
+
+def run_profile(profile, num_students, num_courses, grades_per_student, readers, duration, batch_size):
+    DatabaseManager.close_all_connections()
+    DatabaseManager.use_pragma_profile(profile)
+    with tempfile.TemporaryDirectory() as tmp:
+        db = build_database(os.path.join(tmp, "bench.db"), num_students, num_courses, grades_per_student)
+        db.recalculate_all_gpas()
+        DatabaseManager.pool.close_thread_connections()
+
+        results = {'read_times': [], 'write_times': [], 'errors': []}
+        stop = threading.Event()
+        threads = [threading.Thread(target=writer, args=(db, num_students, num_courses, batch_size, stop, results, 1))]
+        threads += [threading.Thread(target=reader, args=(db, num_students, stop, results, 100 + i))
+                    for i in range(readers)]
+        for thread in threads:
+            thread.start()
+        time.sleep(duration)
+        stop.set()
+        for thread in threads:
+            thread.join()
+        DatabaseManager.close_all_connections()
+
+    reads, writes = results['read_times'], results['write_times']
+    print(f"[{profile}]")
+    print(f"  reads:  {len(reads) / duration:8.1f}/s  p50 {percentile(reads, 0.5) * 1000:7.2f} ms"
+          f"  p95 {percentile(reads, 0.95) * 1000:7.2f} ms  max {max(reads, default=0) * 1000:7.2f} ms")
+    print(f"  writes: {len(writes) / duration:8.1f} batches/s of {batch_size}"
+          f"  p50 {percentile(writes, 0.5) * 1000:7.2f} ms  max {max(writes, default=0) * 1000:7.2f} ms")
+    print(f"  lock errors: {len(results['errors'])}")
+
+def run_benchmark(num_students=20000, num_courses=200, grades_per_student=8, readers=4, duration=5.0,
+                  batch_size=2000):
+    print(f"Students: {num_students}, grades: {num_students * grades_per_student}, "
+          f"{readers} reader threads + 1 writer for {duration:.0f}s each")
+    for profile in ('legacy', 'performance'):
+        run_profile(profile, num_students, num_courses, grades_per_student, readers, duration, batch_size)
+
+if __name__ == "__main__":
+    students = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    run_benchmark(num_students=students)
@@ -0,0 +1,64 @@
+import os
+import sys
+import tempfile
+import time
+
+# --- PATH FIX ---
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+# ----------------
+
+from models.database_manager import DatabaseManager
+from benchmarks.bench_gpa import build_database
+
+def best_of(fn, repeats):
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - start)
+    return min(times), result
+
+def python_distribution(db):
+    # The original get_grade_distribution(): every grade fetched and bucketed in Python
+    distribution = {'A': 0, 'B': 0, 'C': 0, 'D': 0, 'F': 0}
+    for (score,) in db.connect().execute("SELECT grade_value FROM Grade"):
+        if score >= 90: distribution['A'] += 1
+        elif score >= 80: distribution['B'] += 1
+        elif score >= 70: distribution['C'] += 1
+        elif score >= 60: distribution['D'] += 1
+        else: distribution['F'] += 1
+    return distribution
+
+def run_benchmark(num_grades=1_000_000, num_courses=200, grades_per_student=8, repeats=5):
+    num_students = num_grades // grades_per_student
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        db = build_database(os.path.join(tmp, "bench.db"), num_students, num_courses, grades_per_student)
+        db.recalculate_all_gpas()
+        build_time = time.perf_counter() - start
+
+        def separate_calls():
+            # What the dashboard did before get_dashboard_snapshot()
+            return (db.get_general_stats(), python_distribution(db), db.get_course_enrollment_stats())
+
+        separate_time, (general, distribution, enrollment) = best_of(separate_calls, repeats)
+        snapshot_time, snapshot = best_of(db.compute_dashboard_snapshot, repeats)
+        materialized_time, materialized = best_of(db.get_dashboard_snapshot, repeats)
+
+        DatabaseManager.close_all_connections()
+
+    same = (general == (snapshot['students'], snapshot['courses'], snapshot['instructors'], snapshot['avg_gpa'])
+            and distribution == snapshot['distribution'] and enrollment == snapshot['enrollment']
+            and materialized == snapshot)
+    print(f"Students: {num_students}, grades: {num_students * grades_per_student} (built in {build_time:.1f}s)")
+    print(f"  stats + Python distribution + enrollment: {separate_time:.3f}s")
+    print(f"  compute_dashboard_snapshot:               {snapshot_time:.3f}s ({separate_time / snapshot_time:.1f}x faster)")
+    print(f"  get_dashboard_snapshot (materialized):    {materialized_time:.4f}s ({separate_time / materialized_time:.0f}x faster)")
+    print(f"  results identical: {same}")
+
+if __name__ == "__main__":
+    grades = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    run_benchmark(num_grades=grades)
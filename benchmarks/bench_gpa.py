@@ -0,0 +1,57 @@
+import os
+import sys
+import random
+import tempfile
+import time
+
+# --- PATH FIX ---
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+# ----------------
+
+from models.database_manager import DatabaseManager
+
+def build_database(db_path, num_students, num_courses, grades_per_student, seed=42):
+    rng = random.Random(seed)
+    db = DatabaseManager(db_path)
+    conn = db.connect()
+    with conn:
+        conn.executemany("INSERT INTO Student (name, email) VALUES (?, ?)",
+                         ((f"Student {i}", f"student{i}@bench.edu") for i in range(num_students)))
+        conn.executemany("INSERT INTO Course (name, credit_hours) VALUES (?, ?)",
+                         ((f"Course {i}", rng.randint(1, 4)) for i in range(num_courses)))
+        grades = []
+        for student_id in range(1, num_students + 1):
+            for course_id in rng.sample(range(1, num_courses + 1), grades_per_student):
+                grades.append((student_id, course_id, round(rng.uniform(40, 100), 1)))
+        conn.executemany("INSERT INTO Grade (student_id, course_id, grade_value) VALUES (?, ?, ?)", grades)
+    return db
+
+def run_benchmark(num_students=5000, num_courses=200, grades_per_student=8):
+    with tempfile.TemporaryDirectory() as tmp:
+        db = build_database(os.path.join(tmp, "bench.db"), num_students, num_courses, grades_per_student)
+        student_ids = [row[0] for row in db.connect().execute("SELECT student_id FROM Student")]
+
+        start = time.perf_counter()
+        for student_id in student_ids:
+            db.calculate_gpa(student_id)
+        loop_time = time.perf_counter() - start
+        loop_result = db.connect().execute("SELECT student_id, gpa, credit_hours FROM Student").fetchall()
+
+        start = time.perf_counter()
+        db.recalculate_all_gpas()
+        bulk_time = time.perf_counter() - start
+        bulk_result = db.connect().execute("SELECT student_id, gpa, credit_hours FROM Student").fetchall()
+
+        DatabaseManager.close_all_connections()
+
+    print(f"Students: {num_students}, grades: {num_students * grades_per_student}")
+    print(f"  per-student calculate_gpa loop: {loop_time:.3f}s")
+    print(f"  recalculate_all_gpas:           {bulk_time:.3f}s ({loop_time / bulk_time:.1f}x faster)")
+    print(f"  results identical: {loop_result == bulk_result}")
+
+if __name__ == "__main__":
+    students = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    run_benchmark(num_students=students)
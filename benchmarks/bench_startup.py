@@ -0,0 +1,41 @@
+import os
+import subprocess
+import sys
+from collections import defaultdict
+
+# main.py is run from the project root
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def run_app():
+    """ Starts main.py under -X importtime and returns its stderr once the dashboard is ready. """
+    env = dict(os.environ)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", os.path.join(parent_dir, "main.py"),
+         "--startup-report", "--quit-after-startup"],
+        cwd=parent_dir, env=env, capture_output=True, text=True, timeout=120)
+    return result.stderr
+
+def import_breakdown(stderr):
+    """ Self time (us) per top-level package, from the -X importtime lines. """
+    totals = defaultdict(int)
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        totals[name.strip().split(".")[0]] += int(self_us)
+    return sorted(totals.items(), key=lambda item: item[1], reverse=True)
+
+def run_benchmark(top=12):
+    stderr = run_app()
+    breakdown = import_breakdown(stderr)
+    print(f"Imports by top-level package (self time, {len(breakdown)} packages):")
+    for package, self_us in breakdown[:top]:
+        print(f"  {package:<24} {self_us / 1000:8.1f} ms")
+    print(f"  {'total':<24} {sum(us for _, us in breakdown) / 1000:8.1f} ms")
+    print()
+    report = stderr[stderr.find("Startup timing"):] if "Startup timing" in stderr else "(no startup report)\n"
+    print(report, end="")
+
+if __name__ == "__main__":
+    run_benchmark()
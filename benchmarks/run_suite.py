@@ -0,0 +1,221 @@
+import argparse
+import json
+import os
+import platform
+import random
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+# --- PATH FIX ---
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+# ----------------
+
+# Headless unless a display platform was chosen explicitly
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from models.database_manager import DatabaseManager
+from models.student import Student
+from models.instructor import Instructor
+from models.course import Course
+from models.grade import Grade
+from database.generate_data import generate_dataset
+
+# name -> (students, courses, grades)
+SIZES = {
+    'small': (1_000, 50, 10_000),
+    'medium': (10_000, 500, 200_000),
+    'large': (100_000, 2_000, 2_000_000),
+}
+
+# Calls timed per sample for the per-call benchmarks (calculate_gpa, assign_grade)
+CALLS_PER_SAMPLE = 100
+
+# Search text typed into each page's search box; every word occurs in the generated names
+SEARCH_TEXT = {'students': "Hassan", 'instructors': "Omar", 'courses': "Data", 'grades': "Sarah"}
+
+def log(message):
+    print(message, file=sys.stderr, flush=True)
+
+def measure(fn, repeats, calls=1):
+    """ Runs fn repeats times; returns per-call timings in seconds. """
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) / calls)
+    return {'min': min(samples), 'median': statistics.median(samples), 'max': max(samples), 'repeats': repeats}
+
+# ---------- Model Benchmarks ----------
+def model_benchmarks(repeats, rng):
+    db = DatabaseManager()
+    cursor = db.connect().cursor()
+    student_ids = [row[0] for row in cursor.execute("SELECT student_id FROM Student")]
+    grade_keys = cursor.execute("SELECT student_id, course_id FROM Grade").fetchall()
+
+    def calculate_gpas():
+        for student_id in rng.sample(student_ids, CALLS_PER_SAMPLE):
+            db.calculate_gpa(student_id)
+
+    def assign_grades():
+        for student_id, course_id in rng.sample(grade_keys, CALLS_PER_SAMPLE):
+            Grade(student_id, course_id, round(rng.uniform(40, 100), 1)).assign_grade()
+
+    return {
+        'model.calculate_gpa': measure(calculate_gpas, repeats, CALLS_PER_SAMPLE),
+        'model.assign_grade': measure(assign_grades, repeats, CALLS_PER_SAMPLE),
+        'model.get_all_students': measure(Student.get_all_students, repeats),
+        'model.get_all_instructors': measure(Instructor.get_all_instructors, repeats),
+        'model.get_all_courses': measure(Course.get_all_courses, repeats),
+        'model.get_all_grades_info': measure(Grade.get_all_grades_info, repeats),
+        'model.get_general_stats': measure(db.get_general_stats, repeats),
+        'model.get_grade_distribution': measure(db.get_grade_distribution, repeats),
+        'model.get_course_enrollment_stats': measure(db.get_course_enrollment_stats, repeats),
+        'model.compute_dashboard_snapshot': measure(db.compute_dashboard_snapshot, repeats),
+        'model.get_dashboard_snapshot': measure(db.get_dashboard_snapshot, repeats),
+    }
+
+# ---------- View Benchmarks ----------
+def view_benchmarks(repeats):
+    """ Times MainApp's loads from the call until the rows (or snapshot) are in the widgets. """
+    from PyQt5.QtWidgets import QApplication
+    from views.interface import MainApp
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    window = MainApp()
+    window.setup_dashboard_charts()
+    pages = {
+        'students': (1, window.load_students_table, 'student_search'),
+        'instructors': (2, window.load_instructors_table, 'instructor_search'),
+        'courses': (3, window.load_courses_table, 'course_search'),
+        'grades': (4, window.load_grades_table, 'grade_search'),
+    }
+
+    def until_loaded(channel, start_load):
+        def run():
+            start_load()
+            deadline = time.perf_counter() + 60
+            while window.data_access.is_busy(channel) and time.perf_counter() < deadline:
+                app.processEvents()
+        return run
+
+    results = {'view.refresh_dashboard': measure(until_loaded('dashboard', window.refresh_dashboard), repeats)}
+    for channel, (index, load, search_box_name) in pages.items():
+        window.ensure_page(index)
+        search_box = getattr(window, search_box_name)
+        results[f'view.load_{channel}_table'] = measure(until_loaded(channel, load), repeats)
+
+        # Filtering is a load with text in the search box; signals are blocked so the debounce timer stays idle
+        search_box.blockSignals(True)
+        search_box.setText(SEARCH_TEXT[channel])
+        results[f'view.search_{channel}'] = measure(until_loaded(channel, load), repeats)
+        search_box.setText("")
+        search_box.blockSignals(False)
+
+    window.close()
+    window.deleteLater()
+    app.processEvents()
+    return results
+
+# ---------- Suite ----------
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=parent_dir,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def run_suite(sizes, repeats=5, views=True, seed=42):
+    report = {
+        'meta': {
+            'commit': git_commit(),
+            'timestamp': time.strftime("%Y-%m-%dT%H:%M:%S"),
+            'python': platform.python_version(),
+            'sqlite': sqlite3.sqlite_version,
+            'platform': platform.platform(),
+            'repeats': repeats,
+            'seed': seed,
+        },
+        'results': [],
+    }
+    for size in sizes:
+        num_students, num_courses, num_grades = SIZES[size]
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = os.path.join(tmp, f"{size}.db")
+            log(f"[{size}] generating {num_students} students, {num_courses} courses, {num_grades} grades")
+            generate_dataset(db_path, num_students, num_courses, num_grades, seed=seed, progress=lambda _: None)
+
+            # The models and MainApp all open DatabaseManager.default_db_path()
+            os.environ['GRADING_DB_PATH'] = db_path
+            DatabaseManager.lookups.clear()
+            try:
+                log(f"[{size}] model benchmarks")
+                results = model_benchmarks(repeats, random.Random(seed))
+                if views:
+                    log(f"[{size}] view benchmarks")
+                    results.update(view_benchmarks(repeats))
+            finally:
+                DatabaseManager.close_all_connections()
+                del os.environ['GRADING_DB_PATH']
+
+        for name, timing in results.items():
+            report['results'].append({'size': size, 'students': num_students, 'courses': num_courses,
+                                      'grades': num_grades, 'name': name, **timing})
+    return report
+
+def compare(report, baseline, threshold):
+    """ Prints median ratios against a baseline report; returns the benchmarks slower by more than threshold. """
+    before = {(r['size'], r['name']): r['median'] for r in baseline['results']}
+    regressions = []
+    print(f"{'benchmark':<40} {'size':<8} {'baseline':>12} {'current':>12} {'ratio':>7}")
+    for result in report['results']:
+        key = (result['size'], result['name'])
+        if key not in before:
+            continue
+        ratio = result['median'] / before[key] if before[key] else float('inf')
+        flag = ""
+        if ratio > 1 + threshold:
+            flag = "  REGRESSION"
+            regressions.append(key)
+        print(f"{result['name']:<40} {result['size']:<8} {before[key] * 1000:10.3f}ms {result['median'] * 1000:10.3f}ms "
+              f"{ratio:6.2f}x{flag}")
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the model and view hot paths; results are JSON.")
+    parser.add_argument("--sizes", default="small,medium", help=f"Comma-separated, from: {', '.join(SIZES)}")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--no-views", action="store_true", help="Skip the MainApp benchmarks (no PyQt5 needed)")
+    parser.add_argument("-o", "--output", help="Write the JSON report here instead of stdout")
+    parser.add_argument("--compare", metavar="BASELINE", help="JSON report from an earlier run to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Slowdown flagged as a regression (0.2 = 20%%)")
+    args = parser.parse_args(argv)
+
+    sizes = [s.strip() for s in args.sizes.split(",") if s.strip()]
+    unknown = [s for s in sizes if s not in SIZES]
+    if unknown:
+        parser.error(f"unknown size(s): {', '.join(unknown)}")
+
+    report = run_suite(sizes, args.repeats, not args.no_views, args.seed)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        log(f"Results written to {args.output}")
+    elif not args.compare:
+        print(json.dumps(report, indent=2))
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            regressions = compare(report, json.load(f), args.threshold)
+        return 1 if regressions else 0
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
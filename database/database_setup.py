@@ -1,4 +1,15 @@
+import os
 import sqlite3
+import sys
+
+# --- PATH FIX ---
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+# ----------------
+
+from models.database_manager import DatabaseManager
 
 def create_database():
     # Connect to the database (it will be created if it doesn't exist)
@@ -72,6 +83,10 @@ def create_database():
     conn.commit()
     conn.close()
 
+    # Indexes, triggers and derived tables come from the app's versioned migrations,
+    # which also drop duplicate grades before the unique (student, course) index
+    DatabaseManager(os.path.abspath("student_grading.db"))
+
     print("Database and tables created successfully!")
 
 # Run directly
@@ -0,0 +1,207 @@
+import argparse
+import itertools
+import os
+import random
+import sys
+import time
+
+# --- PATH FIX ---
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+# ----------------
+
+from models.database_manager import DatabaseManager, LOOKUP_COLUMNS, SEARCH_INDEXES, VERSIONED_TABLES
+
+FIRST_NAMES = ["Safa", "Ali", "Nour", "Omar", "Lina", "Sarah", "Mostafa", "Yara", "Karim", "Mona",
+               "Hassan", "Layla", "Youssef", "Huda", "Tarek", "Reem", "Ziad", "Dina", "Adam", "Salma",
+               "Amir", "Farah", "Khaled", "Rana", "Nabil", "Jana", "Samir", "Hana", "Fadi", "Maya"]
+LAST_NAMES = ["Abdelkarim", "Mohamed", "Hassan", "Ahmed", "Youssef", "Ibrahim", "Mahmoud", "Saleh",
+              "Khalil", "Nasser", "Farouk", "Mansour", "Haddad", "Aziz", "Rashid", "Sabry", "Fawzy",
+              "Kamal", "Zaki", "Hamdy"]
+SUBJECTS = ["Python Programming", "Data Science", "Database Systems", "Machine Learning", "Calculus",
+            "Linear Algebra", "Statistics", "Physics", "Operating Systems", "Networks", "Algorithms",
+            "Software Engineering", "Computer Vision", "Economics", "Technical Writing", "Chemistry"]
+
+# Course credit hours and how common each is
+CREDIT_HOURS = (1, 2, 3, 4)
+CREDIT_WEIGHTS = (5, 10, 70, 15)
+
+# Terms in each year: (season, first day, last day)
+TERM_SEASONS = (('Spring', '01-15', '05-31'), ('Fall', '09-01', '12-20'))
+# Terms over which a student's courses are spread, starting at their entry term
+STUDY_TERMS = 8
+# Average score gained per term, so the GPA trend is not flat
+TERM_DRIFT = 0.15
+
+def course_weights(num_courses, skew):
+    """
+    Zipf-like popularity: the course at rank r gets weight 1 / r**skew, so a few
+    intro courses take most enrollments and the long tail stays small.
+    """
+    return [1.0 / (rank ** skew) for rank in range(1, num_courses + 1)]
+
+def term_rows(first_year, num_years):
+    """ (term_id, name, start_date, end_date) for every term, oldest first. """
+    terms = []
+    for year in range(first_year, first_year + num_years):
+        for season, first_day, last_day in TERM_SEASONS:
+            terms.append((len(terms) + 1, f"{season} {year}", f"{year}-{first_day}", f"{year}-{last_day}"))
+    return terms
+
+def generate_grades(rng, num_students, num_courses, num_grades, skew, num_terms=1):
+    """
+    Yields (student_id, course_id, grade_value, term_id) rows: each student takes
+    a varying number of distinct courses drawn by popularity, spread over the
+    terms following their entry term, and scores depend on the student's
+    ability, the course's difficulty and the term.
+    """
+    # course_ids[r] is the course with popularity rank r + 1
+    course_ids = list(range(1, num_courses + 1))
+    rng.shuffle(course_ids)
+    cumulative = list(itertools.accumulate(course_weights(num_courses, skew)))
+    difficulty = [0.0] + [rng.gauss(0, 5) for _ in range(num_courses)]
+    # Per-grade noise comes from a table of 4096 draws: a gauss() call per grade doubles the runtime
+    noise = [rng.gauss(0, 8) for _ in range(4096)]
+
+    mean_load = num_grades / num_students
+    remaining = num_grades
+    for student_id in range(1, num_students + 1):
+        # Spread what is left over the students still to come, with some per-student variation
+        target = remaining / (num_students - student_id + 1)
+        load = max(0, min(num_courses, remaining, round(rng.gauss(target, mean_load * 0.3))))
+        if student_id == num_students:
+            load = min(num_courses, remaining)
+        remaining -= load
+
+        taken = set()
+        if load > num_courses // 2:
+            # Drawing by weight would mostly hit courses already taken
+            taken.update(rng.sample(course_ids, load))
+        while len(taken) < load:
+            taken.update(rng.choices(course_ids, cum_weights=cumulative, k=load - len(taken)))
+        ability = rng.gauss(75, 8)
+        entry_term = rng.randrange(num_terms)
+        study_terms = min(STUDY_TERMS, num_terms - entry_term)
+        for course_id in taken:
+            term = entry_term + rng.randrange(study_terms)
+            score = ability - difficulty[course_id] + TERM_DRIFT * term + noise[rng.getrandbits(12)]
+            yield student_id, course_id, round(min(100.0, max(0.0, score)), 1), term + 1
+
+def generate_dataset(db_path, num_students=100_000, num_courses=2_000, num_grades=5_000_000,
+                     num_instructors=None, skew=1.1, seed=42, progress=print, first_year=2016, num_years=10):
+    """
+    Creates a new database at db_path filled with a reproducible synthetic dataset
+    covering num_years of terms from first_year; each grade also gets one
+    GradeHistory entry. Secondary indexes and triggers are dropped for the bulk
+    load and recreated afterwards; GPAs, search indexes and dashboard tables are
+    then rebuilt in bulk. Returns {'students', 'instructors', 'courses', 'grades', 'seconds'}.
+    """
+    if os.path.exists(db_path):
+        raise FileExistsError(f"{db_path} already exists; generate into a new file")
+    num_instructors = num_instructors or max(1, num_courses // 10)
+    num_grades = min(num_grades, num_students * num_courses)
+    terms = term_rows(first_year, num_years)
+    rng = random.Random(seed)
+    start = time.perf_counter()
+
+    db = DatabaseManager(db_path)
+    conn = db.connect()
+    cursor = conn.cursor()
+
+    # Every index and trigger, in creation order, to restore after the load
+    cursor.execute("""
+        SELECT type, name, sql FROM sqlite_master
+        WHERE type IN ('index', 'trigger') AND sql IS NOT NULL
+        ORDER BY rowid
+    """)
+    schema = cursor.fetchall()
+    for kind, name, _ in schema:
+        cursor.execute(f"DROP {kind.upper()} {name}")
+
+    # The generated IDs are consistent by construction, and a crash only loses a scratch file
+    cursor.execute("PRAGMA foreign_keys = OFF")
+    cursor.execute("PRAGMA synchronous = OFF")
+    # Room for the index builds to sort in memory
+    cursor.execute("PRAGMA cache_size = -262144")
+    timings = {}
+    with conn:
+        phase = time.perf_counter()
+        cursor.executemany("INSERT INTO Instructor (instructor_id, name, email) VALUES (?, ?, ?)",
+                           ((i, f"Dr. {rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}", f"instructor{i}@univ.edu")
+                            for i in range(1, num_instructors + 1)))
+        cursor.executemany("INSERT INTO Course (course_id, name, credit_hours, instructor_id) VALUES (?, ?, ?, ?)",
+                           ((i, f"{rng.choice(SUBJECTS)} {100 + i}",
+                             rng.choices(CREDIT_HOURS, weights=CREDIT_WEIGHTS)[0], rng.randint(1, num_instructors))
+                            for i in range(1, num_courses + 1)))
+        cursor.executemany("INSERT INTO Student (student_id, name, email, credit_hours, gpa) VALUES (?, ?, ?, 0, 0.0)",
+                           ((i, f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}", f"student{i}@univ.edu")
+                            for i in range(1, num_students + 1)))
+        cursor.executemany("INSERT INTO Term (term_id, name, start_date, end_date) VALUES (?, ?, ?, ?)", terms)
+        timings['people'] = time.perf_counter() - phase
+
+        phase = time.perf_counter()
+        cursor.executemany("INSERT INTO Grade (student_id, course_id, grade_value, term_id) VALUES (?, ?, ?, ?)",
+                           generate_grades(rng, num_students, num_courses, num_grades, skew, len(terms)))
+        grades = cursor.execute("SELECT COUNT(*) FROM Grade").fetchone()[0]
+        # Each grade was recorded when its term ended
+        cursor.execute("""
+            INSERT INTO GradeHistory (student_id, course_id, term_id, grade_value, recorded_at)
+            SELECT G.student_id, G.course_id, G.term_id, G.grade_value, T.end_date
+            FROM Grade G
+            JOIN Term T ON T.term_id = G.term_id
+        """)
+        timings['grades'] = time.perf_counter() - phase
+
+        phase = time.perf_counter()
+        for kind, _, sql in schema:
+            if kind == 'index':
+                cursor.execute(sql)
+        timings['indexes'] = time.perf_counter() - phase
+
+        # Derived data is rebuilt in bulk while the triggers are still off
+        phase = time.perf_counter()
+        db.rebuild_derived_data(cursor)
+        for index in SEARCH_INDEXES:
+            cursor.execute(f"INSERT INTO {index} ({index}) VALUES ('rebuild')")
+        counters = VERSIONED_TABLES + tuple(f"{table}Lookup" for table in LOOKUP_COLUMNS)
+        cursor.executemany("UPDATE DataVersions SET version = version + 1 WHERE table_name = ?",
+                           ((counter,) for counter in counters))
+        for kind, _, sql in schema:
+            if kind == 'trigger':
+                cursor.execute(sql)
+        timings['derived'] = time.perf_counter() - phase
+
+    cursor.execute("ANALYZE")
+    # The pool's connection still carries the load-only PRAGMAs; the next one gets the profile again
+    DatabaseManager.close_all_connections()
+
+    for phase_name, seconds in timings.items():
+        progress(f"  {phase_name:<8} {seconds:6.2f}s")
+    return {'students': num_students, 'instructors': num_instructors, 'courses': num_courses,
+            'grades': grades, 'seconds': time.perf_counter() - start}
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a large synthetic grading database for load testing.")
+    parser.add_argument("output", help="New database file to create")
+    parser.add_argument("--students", type=int, default=100_000)
+    parser.add_argument("--courses", type=int, default=2_000)
+    parser.add_argument("--grades", type=int, default=5_000_000)
+    parser.add_argument("--instructors", type=int, help="Default: one per 10 courses")
+    parser.add_argument("--skew", type=float, default=1.1,
+                        help="Zipf exponent of course popularity; 0 spreads enrollment evenly")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--first-year", type=int, default=2016)
+    parser.add_argument("--years", type=int, default=10, help="Years of terms the grades are spread over")
+    args = parser.parse_args(argv)
+
+    result = generate_dataset(args.output, args.students, args.courses, args.grades,
+                              args.instructors, args.skew, args.seed,
+                              first_year=args.first_year, num_years=args.years)
+    print(f"{result['students']} students, {result['instructors']} instructors, {result['courses']} courses, "
+          f"{result['grades']} grades in {result['seconds']:.1f}s "
+          f"({result['grades'] / result['seconds']:,.0f} grades/s)")
+
+if __name__ == "__main__":
+    main()
@@ -90,7 +90,6 @@ def test_database_integration():
     cursor = conn.cursor()
     cursor.execute("SELECT gpa FROM Student WHERE student_id = ?", (1,))
     updated_gpa = cursor.fetchone()[0]
-    conn.close()
     print(f" Updated GPA for student 1: {updated_gpa}\n")
 
     # ---------- Step 7: Course Summary ----------
@@ -0,0 +1,288 @@
+import argparse
+import csv
+import json
+import os
+import sqlite3
+import sys
+import time
+
+# --- PATH FIX ---
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+# ----------------
+
+# Only the models are imported here: the CLI must run on servers without PyQt5, qtawesome or matplotlib
+from models.csv_importer import IMPORT_CHUNK_SIZE, import_csv
+from models.database_manager import DatabaseManager, PRAGMA_PROFILES
+
+# Failed rows printed after an import; the rest are only counted
+MAX_REPORTED_FAILURES = 20
+
+# Statements listed by --query-stats, slowest total first
+MAX_REPORTED_STATEMENTS = 15
+
+# Streamed by 'export'; students and grades use the columns the importer accepts
+EXPORT_QUERIES = {
+    'students': (('student_id', 'name', 'email', 'credit_hours', 'gpa'), """
+        SELECT student_id, name, email, credit_hours, gpa FROM Student ORDER BY student_id
+    """),
+    'instructors': (('instructor_id', 'name', 'email'), """
+        SELECT instructor_id, name, email FROM Instructor ORDER BY instructor_id
+    """),
+    'courses': (('course_id', 'name', 'credit_hours', 'instructor_id', 'instructor'), """
+        SELECT C.course_id, C.name, C.credit_hours, C.instructor_id, I.name
+        FROM Course C
+        LEFT JOIN Instructor I ON C.instructor_id = I.instructor_id
+        ORDER BY C.course_id
+    """),
+    'grades': (('student_id', 'student', 'course_id', 'course', 'grade_value'), """
+        SELECT G.student_id, S.name, G.course_id, C.name, G.grade_value
+        FROM Grade G
+        JOIN Student S ON G.student_id = S.student_id
+        JOIN Course C ON G.course_id = C.course_id
+        ORDER BY G.student_id, G.course_id
+    """),
+    'history': (('recorded_at', 'term', 'student_id', 'course_id', 'grade_value'), """
+        SELECT H.recorded_at, T.name, H.student_id, H.course_id, H.grade_value
+        FROM GradeHistory H
+        LEFT JOIN Term T ON T.term_id = H.term_id
+        ORDER BY H.history_id
+    """),
+}
+
+def report_timing(label, count, unit, elapsed):
+    """ One timing line per run on stderr, so stdout stays clean for exports and JSON. """
+    rate = f" ({count / elapsed:,.0f} {unit}/s)" if elapsed > 0 else ""
+    print(f"{label}: {count:,} {unit} in {elapsed:.2f}s{rate}", file=sys.stderr)
+
+# ---------- Commands ----------
+def term_id_or_error(db, name):
+    term_id = db.get_term_id(name)
+    if term_id is None:
+        raise ValueError(f"unknown term '{name}'; see 'terms list'")
+    return term_id
+
+def cmd_import(db, args):
+    term_id = term_id_or_error(db, args.term) if args.term else None
+    start = time.perf_counter()
+    report = {'rows': 0, 'written': 0, 'failed_count': 0, 'failed': []}
+    for bytes_read, total_bytes, report in import_csv(args.file, args.kind, db, args.chunk_size, term_id):
+        if args.progress and total_bytes:
+            print(f"\r{bytes_read * 100 // total_bytes}%", end="", file=sys.stderr, flush=True)
+    if args.progress:
+        print(file=sys.stderr)
+    elapsed = time.perf_counter() - start
+
+    for line_number, row, reason in report['failed'][:MAX_REPORTED_FAILURES]:
+        print(f"line {line_number}: {reason}: {row}", file=sys.stderr)
+    if report['failed_count'] > MAX_REPORTED_FAILURES:
+        print(f"... and {report['failed_count'] - MAX_REPORTED_FAILURES} more", file=sys.stderr)
+    print(f"{report['written']} of {report['rows']} rows imported, {report['failed_count']} rejected")
+    report_timing(f"import {args.kind}", report['rows'], "rows", elapsed)
+    # Non-zero so cron and scripts notice rejected rows
+    return 1 if report['failed_count'] else 0
+
+def cmd_gpa_recompute(db, args):
+    start = time.perf_counter()
+    if args.student:
+        updated = db.recalculate_gpas(args.student)
+    elif args.course is not None:
+        updated = db.recalculate_course_gpas(args.course)
+    else:
+        updated = db.recalculate_all_gpas()
+    elapsed = time.perf_counter() - start
+    print(f"{updated} students recomputed")
+    report_timing("gpa recompute", updated, "students", elapsed)
+    return 0
+
+def cmd_gpa_check(db, args):
+    start = time.perf_counter()
+    mismatches = db.check_gpa_consistency(repair=args.repair)
+    elapsed = time.perf_counter() - start
+    for student_id, stored, expected in mismatches[:MAX_REPORTED_FAILURES]:
+        print(f"student {student_id}: stored {stored}, expected {expected}", file=sys.stderr)
+    action = "repaired" if args.repair else "found"
+    print(f"{len(mismatches)} GPA mismatches {action}")
+    students = db.connect().execute("SELECT COUNT(*) FROM StudentGpaTotals").fetchone()[0]
+    report_timing("gpa check", students, "students", elapsed)
+    return 1 if mismatches and not args.repair else 0
+
+def cmd_stats(db, args):
+    start = time.perf_counter()
+    if args.rebuild:
+        db.rebuild_dashboard_stats()
+    snapshot = db.compute_dashboard_snapshot(recompute_terms=True) if args.compute else db.get_dashboard_snapshot()
+    elapsed = time.perf_counter() - start
+
+    if args.json:
+        print(json.dumps(snapshot, indent=2))
+    else:
+        print(f"Students:    {snapshot['students']}")
+        print(f"Courses:     {snapshot['courses']}")
+        print(f"Instructors: {snapshot['instructors']}")
+        print(f"Average GPA: {snapshot['avg_gpa']}")
+        print("Grades:      " + ", ".join(f"{letter} {count}" for letter, count in snapshot['distribution'].items()))
+        for course_name, enrolled in snapshot['enrollment']:
+            print(f"  {course_name}: {enrolled} enrolled")
+        if snapshot['gpa_trend']:
+            print("GPA by term: " + ", ".join(f"{term} {gpa}" for term, gpa in snapshot['gpa_trend']))
+    grades = sum(snapshot['distribution'].values())
+    report_timing("stats", grades, "grades", elapsed)
+    return 0
+
+def cmd_terms_list(db, args):
+    for term_id, name, start_date, end_date in db.get_terms():
+        print(f"{term_id:>5}  {name:<20} {start_date} to {end_date}")
+    return 0
+
+def cmd_terms_add(db, args):
+    for value in (args.start_date, args.end_date):
+        time.strptime(value, "%Y-%m-%d")  # ValueError for anything but YYYY-MM-DD
+    term_id = db.add_term(args.name, args.start_date, args.end_date)
+    print(f"term {term_id} added")
+    return 0
+
+def cmd_trends(db, args):
+    start = time.perf_counter()
+    if args.student is not None:
+        headers = ('term', 'term_gpa', 'cumulative_gpa', 'credits')
+        rows = db.get_gpa_history(args.student)
+    elif args.cohorts:
+        headers = ('cohort', 'term_number', 'students', 'avg_term_gpa')
+        rows = db.get_cohort_trends()
+    else:
+        headers = ('term', 'gpa', f'gpa_last_{args.rolling}_terms', 'grades')
+        rows = db.get_gpa_trend(args.rolling)
+    elapsed = time.perf_counter() - start
+
+    if args.json:
+        print(json.dumps([dict(zip(headers, row)) for row in rows], indent=2))
+    else:
+        writer = csv.writer(sys.stdout)
+        writer.writerow(headers)
+        writer.writerows(rows)
+    report_timing("trends", len(rows), "rows", elapsed)
+    return 0
+
+def cmd_export(db, args):
+    headers, query = EXPORT_QUERIES[args.kind]
+    start = time.perf_counter()
+    out = open(args.output, 'w', newline='', encoding='utf-8') if args.output else sys.stdout
+    try:
+        writer = csv.writer(out)
+        writer.writerow(headers)
+        count = 0
+        # The cursor streams rows, so exports of any size run in constant memory
+        cursor = db.connect().execute(query)
+        while True:
+            rows = cursor.fetchmany(IMPORT_CHUNK_SIZE)
+            if not rows:
+                break
+            writer.writerows(rows)
+            count += len(rows)
+    finally:
+        if args.output:
+            out.close()
+    report_timing(f"export {args.kind}", count, "rows", time.perf_counter() - start)
+    return 0
+
+def print_query_stats(stats):
+    """ The aggregated per-statement numbers from DatabaseManager.get_query_stats(), on stderr. """
+    commits = stats['commits']
+    print(f"\nQueries: {sum(s['count'] for s in stats['statements'])} executions of "
+          f"{len(stats['statements'])} statements, {commits['count']} commits ({commits['total_ms']:.1f} ms)",
+          file=sys.stderr)
+    print(f"{'count':>7} {'total ms':>10} {'mean ms':>9} {'p95 ms':>9} {'rows':>9}  statement", file=sys.stderr)
+    for s in stats['statements'][:MAX_REPORTED_STATEMENTS]:
+        sql = s['sql'] if len(s['sql']) <= 80 else s['sql'][:77] + "..."
+        print(f"{s['count']:>7} {s['total_ms']:>10.1f} {s['mean_ms']:>9.2f} {s['p95_ms']:>9.2f} {s['rows']:>9}  {sql}",
+              file=sys.stderr)
+
+# ---------- Entry Point ----------
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m grading",
+        description="Headless batch jobs for the Student Grading System database.")
+    parser.add_argument("--db", help="Database file (default: the one the GUI uses)")
+    parser.add_argument("--profile", choices=sorted(PRAGMA_PROFILES),
+                        help="SQLite PRAGMA profile (default: $GRADING_DB_PROFILE or 'performance')")
+    parser.add_argument("--query-stats", action="store_true",
+                        help="Print per-statement counts and latencies on stderr after the command")
+    parser.add_argument("--slow-query-ms", type=float, help="Log statements at least this slow")
+    parser.add_argument("--slow-query-log", help="Slow-query log file (default: stderr)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    import_parser = commands.add_parser("import", help="Bulk-import a students or grades CSV")
+    import_parser.add_argument("kind", choices=("students", "grades"))
+    import_parser.add_argument("file")
+    import_parser.add_argument("--chunk-size", type=int, default=IMPORT_CHUNK_SIZE,
+                               help="Rows written per transaction")
+    import_parser.add_argument("--progress", action="store_true", help="Show percent done on stderr")
+    import_parser.add_argument("--term", help="Term name the grades belong to (default: the current term)")
+    import_parser.set_defaults(handler=cmd_import)
+
+    gpa_parser = commands.add_parser("gpa", help="Recompute or verify student GPAs")
+    gpa_commands = gpa_parser.add_subparsers(dest="gpa_command", required=True)
+    recompute_parser = gpa_commands.add_parser("recompute", help="Recompute GPAs from the grades")
+    scope = recompute_parser.add_mutually_exclusive_group()
+    scope.add_argument("--student", type=int, action="append", help="Only this student ID (repeatable)")
+    scope.add_argument("--course", type=int, help="Only students graded in this course ID")
+    recompute_parser.set_defaults(handler=cmd_gpa_recompute)
+    check_parser = gpa_commands.add_parser("check", help="Compare stored GPA totals with a full recompute")
+    check_parser.add_argument("--repair", action="store_true", help="Recompute the mismatched students")
+    check_parser.set_defaults(handler=cmd_gpa_check)
+
+    stats_parser = commands.add_parser("stats", help="Print the dashboard statistics")
+    stats_parser.add_argument("--rebuild", action="store_true", help="Rebuild the summary tables first")
+    stats_parser.add_argument("--compute", action="store_true",
+                              help="Aggregate the base tables instead of reading the summary tables")
+    stats_parser.add_argument("--json", action="store_true", help="Print the snapshot as JSON")
+    stats_parser.set_defaults(handler=cmd_stats)
+
+    terms_parser = commands.add_parser("terms", help="List or add academic terms")
+    terms_commands = terms_parser.add_subparsers(dest="terms_command", required=True)
+    terms_commands.add_parser("list", help="Every term, oldest first").set_defaults(handler=cmd_terms_list)
+    add_term_parser = terms_commands.add_parser("add", help="Add a term")
+    add_term_parser.add_argument("name", help="e.g. 'Fall 2025'")
+    add_term_parser.add_argument("start_date", help="YYYY-MM-DD")
+    add_term_parser.add_argument("end_date", help="YYYY-MM-DD")
+    add_term_parser.set_defaults(handler=cmd_terms_add)
+
+    trends_parser = commands.add_parser("trends", help="GPA per term, as CSV (default: all students)")
+    trend_scope = trends_parser.add_mutually_exclusive_group()
+    trend_scope.add_argument("--student", type=int, help="Term and cumulative GPA of this student ID")
+    trend_scope.add_argument("--cohorts", action="store_true",
+                             help="Average term GPA of each entering cohort by terms since entry")
+    trends_parser.add_argument("--rolling", type=int, default=3, help="Terms in the rolling GPA (default: 3)")
+    trends_parser.add_argument("--json", action="store_true", help="Print JSON instead of CSV")
+    trends_parser.set_defaults(handler=cmd_trends)
+
+    export_parser = commands.add_parser("export", help="Export a table as CSV")
+    export_parser.add_argument("kind", choices=sorted(EXPORT_QUERIES))
+    export_parser.add_argument("-o", "--output", help="Output file (default: stdout)")
+    export_parser.set_defaults(handler=cmd_export)
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.profile:
+        DatabaseManager.use_pragma_profile(args.profile)
+    if args.query_stats or args.slow_query_ms is not None:
+        DatabaseManager.enable_query_stats(args.slow_query_ms, args.slow_query_log)
+    try:
+        db = DatabaseManager(os.path.abspath(args.db) if args.db else None)
+        return args.handler(db, args)
+    except BrokenPipeError:
+        # Output piped into e.g. head; stop quietly instead of failing on the flush at exit
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 0
+    except (OSError, ValueError, sqlite3.Error) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    finally:
+        DatabaseManager.close_all_connections()
+        stats = DatabaseManager.get_query_stats()
+        if args.query_stats and stats is not None:
+            print_query_stats(stats)
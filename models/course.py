@@ -1,4 +1,3 @@
-import sqlite3
 import os
 import sys
 
@@ -9,6 +8,8 @@ if parent_dir not in sys.path:
     sys.path.append(parent_dir)
 # ----------------
 
+from models.database_manager import DatabaseManager
+
 class Course:
     def __init__(self, course_name: str, credit_hours: int, instructor_id: int, course_id: int = None):
         self.__course_id = course_id
@@ -19,11 +20,7 @@ class Course:
     # Helper to get DB path correctly in both script and .exe modes
     @staticmethod
     def get_db_path():
-        if getattr(sys, 'frozen', False):
-            base_path = os.path.dirname(sys.executable)
-        else:
-            base_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
-        return os.path.join(base_path, "student_grading.db")
+        return DatabaseManager.default_db_path()
 
     # ---------- Encapsulation ----------
     def get_course_id(self): return self.__course_id
@@ -40,27 +37,45 @@ class Course:
     # ---------- Database Methods ----------
     @staticmethod
     def connect():
-        return sqlite3.connect(Course.get_db_path())
+        # Pooled connection shared with the other models; do not close it
+        return DatabaseManager.get_connection(Course.get_db_path())
 
     def save_to_db(self):
+        """
+        Inserts or updates this course and returns the persisted
+        (course_id, name, credit_hours, instructor_name, instructor_id) row.
+        """
+        db = DatabaseManager()
         conn = self.connect()
-        cursor = conn.cursor()
+        hours_delta = 0
+        with conn:
+            cursor = conn.cursor()
+            DatabaseManager.begin_immediate(cursor)
 
-        if self.__course_id is not None:
-            cursor.execute("""
-                UPDATE Course
-                SET name = ?, credit_hours = ?, instructor_id = ?
-                WHERE course_id = ?
-            """, (self.__course_name, self.__credit_hours, self.__instructor_id, self.__course_id))
-        else:
-            cursor.execute("""
-                INSERT INTO Course (name, credit_hours, instructor_id)
-                VALUES (?, ?, ?)
-            """, (self.__course_name, self.__credit_hours, self.__instructor_id))
-            self.__course_id = cursor.lastrowid
-
-        conn.commit()
-        conn.close()
+            if self.__course_id is not None:
+                cursor.execute("SELECT credit_hours FROM Course WHERE course_id = ?", (self.__course_id,))
+                previous = cursor.fetchone()
+                if previous is not None:
+                    hours_delta = int(self.__credit_hours) - previous[0]
+                cursor.execute("""
+                    UPDATE Course
+                    SET name = ?, credit_hours = ?, instructor_id = ?
+                    WHERE course_id = ?
+                """, (self.__course_name, self.__credit_hours, self.__instructor_id, self.__course_id))
+            else:
+                cursor.execute("""
+                    INSERT INTO Course (name, credit_hours, instructor_id)
+                    VALUES (?, ?, ?)
+                """, (self.__course_name, self.__credit_hours, self.__instructor_id))
+                self.__course_id = cursor.lastrowid
+
+            # Running GPA totals and per-term stats are weighted by credit hours, so they
+            # are updated in the same transaction as the change
+            if hours_delta:
+                db.recalculate_course_gpas(self.__course_id, cursor)
+                db.reweight_course_term_stats(self.__course_id, hours_delta, cursor)
+        DatabaseManager.lookups.invalidate('Course')
+        return Course.get_course_row(self.__course_id)
 
     @staticmethod
     def get_all_courses():
@@ -72,14 +87,79 @@ class Course:
             LEFT JOIN Instructor I ON C.instructor_id = I.instructor_id
         """
         cursor.execute(query)
-        rows = cursor.fetchall()
-        conn.close()
-        return rows
+        return cursor.fetchall()
 
     @staticmethod
-    def delete_course(course_id: int):
+    def search_course_choices(text, limit=20):
+        """
+        (course_id, name) for the best `limit` courses matching text as a prefix
+        (or by ID), for type-ahead pickers. Served from the shared lookup cache.
+        """
+        path = Course.get_db_path()
+
+        def load():
+            cursor = DatabaseManager.get_connection(path).cursor()
+            ids = [int(text)] if text.strip().isdecimal() else []
+            ids += DatabaseManager.search_ids(cursor, 'CourseSearch', text, limit)
+            return tuple(DatabaseManager.fetch_ranked(
+                cursor, "SELECT course_id, name FROM Course WHERE course_id IN ({ids})", ids)[:limit])
+        key = (path, 'course_search', text.strip().lower(), limit)
+        return DatabaseManager.lookups.get_or_load(key, ('Course',), load, DatabaseManager(path).get_lookup_versions)
+
+    @staticmethod
+    def get_course_row(course_id):
+        """ One course in the shape get_courses_page() returns, or None if it does not exist. """
+        conn = Course.connect()
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT C.course_id, C.name, C.credit_hours, I.name, C.instructor_id 
+            FROM Course C
+            LEFT JOIN Instructor I ON C.instructor_id = I.instructor_id
+            WHERE C.course_id = ?
+        """, (course_id,))
+        return cursor.fetchone()
+
+    @staticmethod
+    def get_courses_page(after_id=0, limit=200):
+        """ Keyset-paginated courses: the next `limit` rows with an ID above after_id. """
         conn = Course.connect()
         cursor = conn.cursor()
-        cursor.execute("DELETE FROM Course WHERE course_id = ?", (course_id,))
-        conn.commit()
-        conn.close()
\ No newline at end of file
+        cursor.execute("""
+            SELECT C.course_id, C.name, C.credit_hours, I.name, C.instructor_id 
+            FROM Course C
+            LEFT JOIN Instructor I ON C.instructor_id = I.instructor_id
+            WHERE C.course_id > ?
+            ORDER BY C.course_id
+            LIMIT ?
+        """, (after_id or 0, limit))
+        return cursor.fetchall()
+
+    @staticmethod
+    def search_courses(text, limit=200):
+        """ Courses whose name matches text, best match first. """
+        cursor = Course.connect().cursor()
+        ids = DatabaseManager.search_ids(cursor, 'CourseSearch', text, limit)
+        return DatabaseManager.fetch_ranked(cursor, """
+            SELECT C.course_id, C.name, C.credit_hours, I.name, C.instructor_id 
+            FROM Course C
+            LEFT JOIN Instructor I ON C.instructor_id = I.instructor_id
+            WHERE C.course_id IN ({ids})
+        """, ids)
+
+    @staticmethod
+    def delete_course(course_id: int):
+        db = DatabaseManager()
+        conn = Course.connect()
+        with conn:
+            cursor = conn.cursor()
+            DatabaseManager.begin_immediate(cursor)
+            cursor.execute("SELECT student_id FROM Grade WHERE course_id = ?", (course_id,))
+            affected_students = [row[0] for row in cursor.fetchall()]
+            # Foreign keys are enforced, so the course's grades have to go first
+            cursor.execute("DELETE FROM Grade WHERE course_id = ?", (course_id,))
+            # Needs the Course row for the credit hours its history was counted with
+            db.withdraw_course_term_stats(course_id, cursor)
+            cursor.execute("DELETE FROM Course WHERE course_id = ?", (course_id,))
+            # Grades of a deleted course no longer count towards GPA
+            db.recalculate_gpas(affected_students, cursor)
+        DatabaseManager.lookups.invalidate('Course')
\ No newline at end of file
@@ -0,0 +1,101 @@
+import csv
+import os
+import sys
+
+# --- PATH FIX ---
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+# ----------------
+
+from models.database_manager import DatabaseManager
+
+# Rows written per transaction while importing
+IMPORT_CHUNK_SIZE = 2000
+
+# Rejected rows kept in an import report; the rest are only counted
+MAX_FAILURE_SAMPLES = 100
+
+# Accepted header names for each import kind, mapped to the bulk API's columns
+IMPORT_COLUMNS = {
+    'students': [('name',), ('email',)],
+    'grades': [('student_id',), ('course_id',), ('grade_value', 'grade')],
+}
+
+def _counted_lines(raw_file, counter):
+    """ Decodes a binary file line by line, keeping a running count of bytes read. """
+    for raw_line in raw_file:
+        counter[0] += len(raw_line)
+        yield raw_line.decode('utf-8-sig')
+
+def _column_indexes(header, kind):
+    normalized = [h.strip().lower() for h in header]
+    indexes = []
+    for aliases in IMPORT_COLUMNS[kind]:
+        match = next((normalized.index(a) for a in aliases if a in normalized), None)
+        if match is None:
+            raise ValueError(f"CSV is missing the '{aliases[0]}' column")
+        indexes.append(match)
+    return indexes
+
+def iter_csv_chunks(path, kind, chunk_size=IMPORT_CHUNK_SIZE):
+    """
+    Streams a CSV file with a header row and yields
+    (rows, line_numbers, bytes_read, total_bytes) per chunk, where
+    line_numbers[i] is the file line rows[i] starts on, so the whole
+    file is never held in memory.
+    """
+    total_bytes = os.path.getsize(path)
+    counter = [0]
+    with open(path, 'rb') as raw_file:
+        reader = csv.reader(_counted_lines(raw_file, counter))
+        header = next(reader, None)
+        if header is None:
+            return
+        indexes = _column_indexes(header, kind)
+
+        chunk = []
+        line_numbers = []
+        # reader.line_num is the last line consumed, so a record starts one line after the previous one ended
+        last_line = reader.line_num
+        for record in reader:
+            start_line = last_line + 1
+            last_line = reader.line_num
+            if not any(field.strip() for field in record):
+                continue
+            chunk.append(tuple(record[i] if i < len(record) else '' for i in indexes))
+            line_numbers.append(start_line)
+            if len(chunk) >= chunk_size:
+                yield chunk, line_numbers, counter[0], total_bytes
+                chunk = []
+                line_numbers = []
+        if chunk:
+            yield chunk, line_numbers, counter[0], total_bytes
+
+def import_csv(path, kind, db=None, chunk_size=IMPORT_CHUNK_SIZE, term_id=None):
+    """
+    Imports a 'students' (name, email) or 'grades' (student_id, course_id, grade)
+    CSV in batched transactions; grades go to term_id, or the current term if None.
+    This is a generator: after each committed chunk it yields (bytes_read,
+    total_bytes, report) so callers can show progress or stop early. report is
+    {'rows': int, 'written': int, 'failed_count': int, 'failed': [(line_number, row, reason)]},
+    where 'failed' holds only the first MAX_FAILURE_SAMPLES rejected rows.
+    """
+    if kind not in IMPORT_COLUMNS:
+        raise ValueError(f"Unknown import kind '{kind}'")
+    db = db or DatabaseManager()
+    if kind == 'students':
+        bulk_insert = db.add_students_bulk
+    else:
+        bulk_insert = lambda rows: db.assign_grades_bulk(rows, term_id)
+
+    report = {'rows': 0, 'written': 0, 'failed_count': 0, 'failed': []}
+    for rows, line_numbers, bytes_read, total_bytes in iter_csv_chunks(path, kind, chunk_size):
+        result = bulk_insert(rows)
+        report['rows'] += len(rows)
+        report['written'] += result['written']
+        report['failed_count'] += len(result['failed'])
+        room = MAX_FAILURE_SAMPLES - len(report['failed'])
+        report['failed'].extend((line_numbers[index], row, reason) for index, row, reason in result['failed'][:room])
+        yield bytes_read, total_bytes, report
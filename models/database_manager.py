@@ -1,22 +1,538 @@
 import sqlite3
 import os
+import re
 import sys
+import threading
+import time
+from collections import OrderedDict, deque
+
+# 4.0-scale grade points of a single grade value, e.g. GRADE_POINTS_OF_SQL.format(value="new.grade_value")
+GRADE_POINTS_OF_SQL = """
+    CASE
+        WHEN {value} >= 90 THEN 4.0
+        WHEN {value} >= 80 THEN 3.0
+        WHEN {value} >= 70 THEN 2.0
+        WHEN {value} >= 60 THEN 1.0
+        ELSE 0.0
+    END
+"""
+
+# 4.0-scale grade points for a Grade row aliased as G, for set-based SQL
+GRADE_POINTS_SQL = GRADE_POINTS_OF_SQL.format(value="G.grade_value")
+
+# Letter buckets for the dashboard, counted in one pass over a Grade row aliased as G
+GRADE_LETTERS = ('A', 'B', 'C', 'D', 'F')
+GRADE_BUCKETS_SQL = """
+    COUNT(CASE WHEN G.grade_value >= 90 THEN 1 END),
+    COUNT(CASE WHEN G.grade_value >= 80 AND G.grade_value < 90 THEN 1 END),
+    COUNT(CASE WHEN G.grade_value >= 70 AND G.grade_value < 80 THEN 1 END),
+    COUNT(CASE WHEN G.grade_value >= 60 AND G.grade_value < 70 THEN 1 END),
+    COUNT(CASE WHEN G.grade_value < 60 THEN 1 END)
+"""
+
+# Letter bucket of a single grade value, e.g. GRADE_LETTER_SQL.format(value="new.grade_value")
+GRADE_LETTER_SQL = """
+    CASE
+        WHEN {value} >= 90 THEN 'A'
+        WHEN {value} >= 80 THEN 'B'
+        WHEN {value} >= 70 THEN 'C'
+        WHEN {value} >= 60 THEN 'D'
+        WHEN {value} < 60 THEN 'F'
+    END
+"""
+
+# Term whose dates include today, if any
+CURRENT_TERM_SQL = """
+    SELECT term_id FROM Term
+    WHERE date('now', 'localtime') BETWEEN start_date AND end_date
+    ORDER BY start_date DESC LIMIT 1
+"""
+
+# One grade per (student, course): insert or overwrite the existing value.
+# Parameters are (student_id, course_id, grade_value, term_id). With a NULL term_id
+# a new grade goes into the current term and an overwrite keeps the grade's own term.
+# ?4 is the raw term_id in both branches; excluded.term_id has the current-term fallback applied.
+GRADE_UPSERT_SQL = f"""
+    INSERT INTO Grade (student_id, course_id, grade_value, term_id)
+    VALUES (?1, ?2, ?3, COALESCE(?4, ({CURRENT_TERM_SQL})))
+    ON CONFLICT (student_id, course_id) DO UPDATE SET grade_value = excluded.grade_value,
+        term_id = COALESCE(?4, Grade.term_id)
+"""
+
+# The grade each (student, course, term) ended the term with: the latest GradeHistory
+# entry, whose bare columns SQLite returns alongside MAX(). grade_value is NULL when
+# the grade was deleted. {filter} narrows the scan, e.g. "AND student_id = ?".
+TERM_GRADES_SQL = """
+    SELECT student_id, course_id, term_id, grade_value, MAX(history_id) AS history_id
+    FROM GradeHistory
+    WHERE term_id IS NOT NULL {filter}
+    GROUP BY student_id, course_id, term_id
+"""
+
+# Credit-weighted grade points per (student, term), from the grades each term ended with
+STUDENT_TERM_POINTS_SQL = f"""
+    SELECT E.student_id, E.term_id,
+           SUM({GRADE_POINTS_OF_SQL.format(value="E.grade_value")} * C.credit_hours) AS points,
+           SUM(C.credit_hours) AS credits
+    FROM ({TERM_GRADES_SQL}) E
+    JOIN Course C ON C.course_id = E.course_id
+    WHERE E.grade_value IS NOT NULL
+    GROUP BY E.student_id, E.term_id
+"""
+
+# Stay under SQLITE_MAX_VARIABLE_NUMBER on older SQLite builds
+SQL_CHUNK_SIZE = 500
+
+# Tables whose writes are counted in DataVersions
+VERSIONED_TABLES = ('Student', 'Instructor', 'Course', 'Grade', 'Term')
+
+# Columns the cached lookup lists read, per table. Their own DataVersions counter
+# ("<table>Lookup") only moves on inserts, deletes and updates of these columns,
+# so GPA and credit-hour updates from grade writes leave cached lookups valid.
+LOOKUP_COLUMNS = {
+    'Student': ('name', 'email'),
+    'Instructor': ('name', 'email'),
+    'Course': ('name',),
+}
+
+# FTS5 search index -> (source table, key column, indexed columns).
+# The indexes are external-content tables kept in sync by triggers.
+SEARCH_INDEXES = {
+    'StudentSearch': ('Student', 'student_id', ('name', 'email')),
+    'InstructorSearch': ('Instructor', 'instructor_id', ('name', 'email')),
+    'CourseSearch': ('Course', 'course_id', ('name',)),
+}
+
+# Named PRAGMA sets the pool applies to each connection it opens, in order
+PRAGMA_PROFILES = {
+    # Readers keep working while a grade batch commits (WAL), commits skip the
+    # per-transaction fsync (synchronous=NORMAL is durable at checkpoints in WAL),
+    # and a locked database is waited on instead of failing straight away.
+    'performance': {
+        'busy_timeout': 5000,       # ms
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'cache_size': -32000,       # Negative means KiB: about 32 MB of page cache per connection
+        'mmap_size': 268435456,     # 256 MB of the file read through memory mapping
+        'temp_store': 'MEMORY',
+        'foreign_keys': 'ON',
+    },
+    # SQLite's own defaults, which every connection used before profiles existed
+    'legacy': {
+        'journal_mode': 'DELETE',
+        'synchronous': 'FULL',
+        'foreign_keys': 'OFF',
+    },
+}
+
+# Profile for new connections; override with the GRADING_DB_PROFILE environment variable
+DEFAULT_PRAGMA_PROFILE = os.environ.get('GRADING_DB_PROFILE', 'performance')
+
+class QueryStats:
+    """
+    Per-statement counters filled in by instrumented connections: executions,
+    total and p95 latency (execute plus fetching the rows), rows returned, and
+    commits. Statements slower than slow_query_ms are also written to the
+    slow-query log: the file at slow_log_path, or stderr.
+    """
+    # Latest latencies kept per statement for the percentile
+    SAMPLES_PER_STATEMENT = 1000
+
+    def __init__(self, slow_query_ms=None, slow_log_path=None):
+        self.slow_query_ms = slow_query_ms
+        self.slow_log_path = slow_log_path
+        self._lock = threading.Lock()
+        self._statements = {}  # normalized SQL -> {'count', 'seconds', 'max', 'rows', 'samples'}
+        self._commits = {'count': 0, 'seconds': 0.0}
+        self._keys = {}        # SQL string as executed -> normalized SQL
+
+    def _key(self, sql):
+        key = self._keys.get(sql)
+        if key is None:
+            key = " ".join(sql.split())
+            if len(self._keys) < 4096:
+                self._keys[sql] = key
+        return key
+
+    def record(self, sql, seconds, rows):
+        key = self._key(sql)
+        with self._lock:
+            entry = self._statements.get(key)
+            if entry is None:
+                entry = self._statements[key] = {'count': 0, 'seconds': 0.0, 'max': 0.0, 'rows': 0,
+                                                 'samples': deque(maxlen=self.SAMPLES_PER_STATEMENT)}
+            entry['count'] += 1
+            entry['seconds'] += seconds
+            entry['max'] = max(entry['max'], seconds)
+            entry['rows'] += rows
+            entry['samples'].append(seconds)
+        if self.slow_query_ms is not None and seconds * 1000 >= self.slow_query_ms:
+            self._log_slow(key, seconds, rows)
+
+    def record_commit(self, seconds):
+        with self._lock:
+            self._commits['count'] += 1
+            self._commits['seconds'] += seconds
+
+    def _log_slow(self, key, seconds, rows):
+        line = f"{time.strftime('%Y-%m-%d %H:%M:%S')} {seconds * 1000:.1f} ms, {rows} rows: {key}\n"
+        try:
+            if self.slow_log_path:
+                with self._lock, open(self.slow_log_path, 'a', encoding='utf-8') as log:
+                    log.write(line)
+            else:
+                sys.stderr.write("Slow query: " + line)
+        except OSError as e:
+            # stderr, so the CLI's stdout (e.g. an export) stays clean
+            print(f"Could not write slow-query log: {e}", file=sys.stderr)
+
+    def get_stats(self):
+        """
+        {'statements': [{'sql', 'count', 'total_ms', 'mean_ms', 'p95_ms', 'max_ms', 'rows'}]
+        sorted by total time, 'commits': {'count', 'total_ms'}}.
+        """
+        with self._lock:
+            entries = [(key, dict(entry, samples=sorted(entry['samples']))) for key, entry in self._statements.items()]
+            commits = dict(self._commits)
+
+        statements = []
+        for key, entry in entries:
+            samples = entry['samples']
+            statements.append({
+                'sql': key,
+                'count': entry['count'],
+                'total_ms': entry['seconds'] * 1000,
+                'mean_ms': entry['seconds'] * 1000 / entry['count'],
+                'p95_ms': samples[min(len(samples) - 1, int(len(samples) * 0.95))] * 1000,
+                'max_ms': entry['max'] * 1000,
+                'rows': entry['rows'],
+            })
+        statements.sort(key=lambda s: s['total_ms'], reverse=True)
+        return {'statements': statements,
+                'commits': {'count': commits['count'], 'total_ms': commits['seconds'] * 1000}}
+
+    def reset(self):
+        with self._lock:
+            self._statements.clear()
+            self._commits = {'count': 0, 'seconds': 0.0}
+
+class InstrumentedCursor(sqlite3.Cursor):
+    """
+    Reports each statement to the connection's QueryStats once its rows have
+    been fetched (or the cursor moves on), so the time covers the whole read.
+    """
+    _pending = None  # [sql, seconds so far, rows so far] for the statement being read
+
+    def execute(self, sql, parameters=()):
+        self._finish()
+        start = time.perf_counter()
+        try:
+            return super().execute(sql, parameters)
+        finally:
+            self._pending = [sql, time.perf_counter() - start, 0]
+
+    def executemany(self, sql, seq_of_parameters):
+        self._finish()
+        start = time.perf_counter()
+        try:
+            return super().executemany(sql, seq_of_parameters)
+        finally:
+            self._pending = [sql, time.perf_counter() - start, 0]
+            self._finish()
+
+    def fetchone(self):
+        start = time.perf_counter()
+        row = super().fetchone()
+        self._fetched(start, 0 if row is None else 1, row is None)
+        return row
+
+    def fetchmany(self, size=None):
+        size = self.arraysize if size is None else size
+        start = time.perf_counter()
+        rows = super().fetchmany(size)
+        self._fetched(start, len(rows), len(rows) < size)
+        return rows
+
+    def fetchall(self):
+        start = time.perf_counter()
+        rows = super().fetchall()
+        self._fetched(start, len(rows), True)
+        return rows
+
+    def __next__(self):
+        start = time.perf_counter()
+        try:
+            row = super().__next__()
+        except StopIteration:
+            self._fetched(start, 0, True)
+            raise
+        self._fetched(start, 1, False)
+        return row
+
+    def close(self):
+        self._finish()
+        super().close()
+
+    def __del__(self):
+        self._finish()
+
+    def _fetched(self, start, rows, exhausted):
+        pending = self._pending
+        if pending is not None:
+            pending[1] += time.perf_counter() - start
+            pending[2] += rows
+            if exhausted:
+                self._finish()
+
+    def _finish(self):
+        pending = self._pending
+        if pending is not None:
+            self._pending = None
+            stats = getattr(self.connection, 'query_stats', None)
+            if stats is not None:
+                stats.record(*pending)
+
+class InstrumentedConnection(sqlite3.Connection):
+    """ Connection whose statements all run through InstrumentedCursor. Set query_stats after connecting. """
+    query_stats = None
+
+    def cursor(self, factory=InstrumentedCursor):
+        return super().cursor(factory)
+
+    # The C shortcuts would bypass cursor()
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+    def commit(self):
+        start = time.perf_counter()
+        try:
+            super().commit()
+        finally:
+            if self.query_stats is not None:
+                self.query_stats.record_commit(time.perf_counter() - start)
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # 'with conn:' commits (or rolls back) here without going through commit()
+        if exc_type is not None or not self.in_transaction:
+            return super().__exit__(exc_type, exc_value, traceback)
+        start = time.perf_counter()
+        try:
+            return super().__exit__(exc_type, exc_value, traceback)
+        finally:
+            if self.query_stats is not None:
+                self.query_stats.record_commit(time.perf_counter() - start)
+
+def _query_stats_from_environment():
+    """
+    GRADING_QUERY_STATS=1 instruments every pooled connection from startup.
+    GRADING_SLOW_QUERY_MS (which implies it) also logs statements at least that
+    slow, to the GRADING_SLOW_QUERY_LOG file or to stderr.
+    """
+    slow_query_ms = os.environ.get('GRADING_SLOW_QUERY_MS')
+    if slow_query_ms:
+        try:
+            slow_query_ms = float(slow_query_ms)
+        except ValueError:
+            # Runs at import time, so a typo must not stop every entry point from starting
+            print(f"Ignoring GRADING_SLOW_QUERY_MS={slow_query_ms!r}: not a number of milliseconds", file=sys.stderr)
+            slow_query_ms = None
+    else:
+        slow_query_ms = None
+    if not os.environ.get('GRADING_QUERY_STATS') and slow_query_ms is None:
+        return None
+    return QueryStats(slow_query_ms, os.environ.get('GRADING_SLOW_QUERY_LOG'))
+
+class ConnectionPool:
+    """
+    Keeps one long-lived SQLite connection per (thread, database file).
+    Connections are opened with a prepared-statement cache, so repeated
+    queries from the models skip both connect() and re-parsing, and get
+    the pool's PRAGMA profile applied once when they are opened.
+    """
+    def __init__(self, cached_statements=256, pragmas=None, query_stats=None):
+        self.cached_statements = cached_statements
+        self.pragmas = dict(PRAGMA_PROFILES[DEFAULT_PRAGMA_PROFILE] if pragmas is None else pragmas)
+        # When set, new connections are instrumented and report to it
+        self.query_stats = query_stats
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections = []
+        self._stats = {'opened': 0, 'reused': 0, 'closed': 0}
+
+    def get_connection(self, db_path):
+        conns = getattr(self._local, 'connections', None)
+        if conns is None:
+            conns = self._local.connections = {}
+
+        conn = conns.get(db_path)
+        if conn is not None:
+            try:
+                conn.in_transaction  # Raises if the connection was closed behind our back
+                with self._lock:
+                    self._stats['reused'] += 1
+                return conn
+            except sqlite3.ProgrammingError:
+                self._forget(conn)
+
+        # check_same_thread is off only so close_all() can run from any thread;
+        # each connection is still handed out to a single thread.
+        query_stats = self.query_stats
+        conn = sqlite3.connect(db_path, cached_statements=self.cached_statements, check_same_thread=False,
+                               factory=sqlite3.Connection if query_stats is None else InstrumentedConnection)
+        if query_stats is not None:
+            conn.query_stats = query_stats
+        self._apply_pragmas(conn)
+        conns[db_path] = conn
+        with self._lock:
+            self._connections.append(conn)
+            self._stats['opened'] += 1
+        return conn
+
+    def _apply_pragmas(self, conn):
+        for name, value in self.pragmas.items():
+            conn.execute(f"PRAGMA {name} = {value}").fetchall()
+
+    def set_pragmas(self, pragmas):
+        """ Applies to connections opened from now on; existing connections keep their settings. """
+        self.pragmas = dict(pragmas)
+
+    def _forget(self, conn):
+        with self._lock:
+            if conn in self._connections:
+                self._connections.remove(conn)
+                self._stats['closed'] += 1
+
+    def close_thread_connections(self):
+        """ Closes the calling thread's connections, e.g. when a worker thread finishes. """
+        conns = getattr(self._local, 'connections', None) or {}
+        for conn in conns.values():
+            self._forget(conn)
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        conns.clear()
+
+    def close_all(self):
+        with self._lock:
+            for conn in self._connections:
+                try:
+                    conn.close()
+                except sqlite3.Error:
+                    pass
+                self._stats['closed'] += 1
+            self._connections = []
+
+    def get_stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+            stats['open'] = len(self._connections)
+        return stats
+
+class LookupCache:
+    """
+    Size-bounded LRU cache for lookup queries, such as the id/name lists the
+    dialogs fill their pickers from. Each entry records the tables it was read
+    from, and the model write paths call invalidate() with the table they changed.
+    Writes made by other connections (another app instance, the command line)
+    are caught by comparing the tables' lookup counters (see LOOKUP_COLUMNS)
+    before each hit.
+    """
+    def __init__(self, max_entries=64):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # key -> (tables, value, data versions), least recently used first
+        self._generations = {}         # table -> number of invalidations so far
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'invalidations': 0}
+
+    def get_or_load(self, key, tables, loader, data_versions=None):
+        """
+        The cached value for key, or loader()'s result, which is cached unless a write raced it.
+        data_versions(tables) returns the tables' version counters; when given, an
+        entry is only served while they are unchanged since it was loaded.
+        """
+        # Read before loading, so a write that lands during the load makes the entry stale
+        versions = data_versions(tables) if data_versions is not None else None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[2] == versions:
+                self._entries.move_to_end(key)
+                self._stats['hits'] += 1
+                return entry[1]
+            self._stats['misses'] += 1
+            generations = [self._generations.get(table, 0) for table in tables]
+
+        value = loader()
+
+        with self._lock:
+            # A table invalidated while loading may have changed under the loader
+            if generations == [self._generations.get(table, 0) for table in tables]:
+                self._entries[key] = (tuple(tables), value, versions)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self._stats['evictions'] += 1
+        return value
+
+    def invalidate(self, *tables):
+        with self._lock:
+            for table in tables:
+                self._generations[table] = self._generations.get(table, 0) + 1
+            stale = [key for key, (entry_tables, _, _) in self._entries.items()
+                     if any(table in entry_tables for table in tables)]
+            for key in stale:
+                del self._entries[key]
+            self._stats['invalidations'] += len(stale)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+            stats['entries'] = len(self._entries)
+        return stats
 
 class DatabaseManager:
+    # Shared by every DatabaseManager instance and by all model classes
+    pool = ConnectionPool(query_stats=_query_stats_from_environment())
+    lookups = LookupCache()
+    _ready_paths = set()
+
+    # Bumped whenever a step is added to _migrate(); stored in PRAGMA user_version
+    SCHEMA_VERSION = 8
+
+    # When True, grade writes apply a delta to StudentGpaTotals instead of
+    # re-reading all of the student's grades through calculate_gpa()
+    incremental_gpa = True
+
     def __init__(self, db_name=None):
         if db_name is None:
             self.db_name = self.get_db_path()
         else:
             self.db_name = db_name
-            
-        self.create_tables()
+
+        # Schema only needs to be ensured once per database file per process
+        if self.db_name not in DatabaseManager._ready_paths:
+            self.create_tables()
 
     def get_db_path(self):
+        return DatabaseManager.default_db_path()
+
+    @staticmethod
+    def default_db_path():
         """
         Determines the path to the database file.
+        - If GRADING_DB_PATH is set, use that file (e.g. a generated load-testing database).
         - If running as an .exe (frozen), store it next to the executable.
         - If running as a script, store it in the project root folder.
         """
+        if os.environ.get('GRADING_DB_PATH'):
+            return os.path.abspath(os.environ['GRADING_DB_PATH'])
         if getattr(sys, 'frozen', False):
             base_path = os.path.dirname(sys.executable)
         else:
@@ -26,7 +542,72 @@ class DatabaseManager:
         return os.path.join(base_path, "student_grading.db")
 
     def connect(self):
-        return sqlite3.connect(self.db_name)
+        """ Returns this thread's pooled connection. Callers must not close it. """
+        return DatabaseManager.pool.get_connection(self.db_name)
+
+    @staticmethod
+    def get_connection(db_path):
+        return DatabaseManager.pool.get_connection(db_path)
+
+    @staticmethod
+    def begin_immediate(cursor):
+        """
+        Starts the write transaction with the write lock held, so values read before
+        the write cannot be changed by another writer in between. Call it first
+        inside 'with conn:'; it joins a transaction that is already open.
+        """
+        if not cursor.connection.in_transaction:
+            cursor.execute("BEGIN IMMEDIATE")
+
+    @staticmethod
+    def get_connection_stats():
+        """ Open/reuse/close counters, to confirm connections are being reused. """
+        return DatabaseManager.pool.get_stats()
+
+    @staticmethod
+    def use_pragma_profile(profile):
+        """
+        Selects the PRAGMA profile (a PRAGMA_PROFILES name or a {pragma: value}
+        dict) for connections opened from now on. Call it before the first
+        connection to a database, or after close_all_connections().
+        """
+        DatabaseManager.pool.set_pragmas(PRAGMA_PROFILES[profile] if isinstance(profile, str) else profile)
+
+    @staticmethod
+    def get_connection_settings(db_path):
+        """ The PRAGMA values in effect on this thread's connection, to confirm a profile took. """
+        conn = DatabaseManager.pool.get_connection(db_path)
+        return {name: conn.execute(f"PRAGMA {name}").fetchone()[0] for name in PRAGMA_PROFILES['performance']}
+
+    @staticmethod
+    def enable_query_stats(slow_query_ms=None, slow_log_path=None):
+        """
+        Instruments connections opened from now on (see QueryStats) and returns
+        the collector. Like use_pragma_profile(), call it before the first
+        connection or after close_all_connections().
+        """
+        DatabaseManager.pool.query_stats = QueryStats(slow_query_ms, slow_log_path)
+        return DatabaseManager.pool.query_stats
+
+    @staticmethod
+    def get_query_stats():
+        """ QueryStats.get_stats() of the instrumented connections, or None when instrumentation is off. """
+        stats = DatabaseManager.pool.query_stats
+        return None if stats is None else stats.get_stats()
+
+    @staticmethod
+    def reset_query_stats():
+        if DatabaseManager.pool.query_stats is not None:
+            DatabaseManager.pool.query_stats.reset()
+
+    @staticmethod
+    def get_lookup_cache_stats():
+        """ Hit/miss/eviction counters of the shared lookup cache. """
+        return DatabaseManager.lookups.get_stats()
+
+    @staticmethod
+    def close_all_connections():
+        DatabaseManager.pool.close_all()
 
     def create_tables(self):
         conn = self.connect()
@@ -70,104 +651,560 @@ class DatabaseManager:
                 FOREIGN KEY (course_id) REFERENCES Course(course_id)
             )
         """)
+
+        # Running GPA totals per student, maintained incrementally on grade writes
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS StudentGpaTotals (
+                student_id INTEGER PRIMARY KEY,
+                weighted_points REAL NOT NULL DEFAULT 0.0,
+                credits INTEGER NOT NULL DEFAULT 0,
+                FOREIGN KEY (student_id) REFERENCES Student(student_id)
+            )
+        """)
+
+        # Dashboard figures, kept current by the triggers from _create_dashboard_triggers()
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS DashboardStats (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                students INTEGER NOT NULL DEFAULT 0,
+                courses INTEGER NOT NULL DEFAULT 0,
+                instructors INTEGER NOT NULL DEFAULT 0,
+                gpa_total REAL NOT NULL DEFAULT 0.0,
+                gpa_count INTEGER NOT NULL DEFAULT 0
+            )
+        """)
+
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS GradeBucketCounts (
+                bucket TEXT PRIMARY KEY,
+                grade_count INTEGER NOT NULL DEFAULT 0
+            )
+        """)
+
+        # Write counter per table, bumped by triggers; lets the UI skip reloading unchanged data
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS DataVersions (
+                table_name TEXT PRIMARY KEY,
+                version INTEGER NOT NULL DEFAULT 0
+            )
+        """)
+
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS CourseEnrollmentCounts (
+                course_id INTEGER PRIMARY KEY,
+                enrolled INTEGER NOT NULL DEFAULT 0,
+                FOREIGN KEY (course_id) REFERENCES Course(course_id)
+            )
+        """)
+
+        # Academic terms; Grade.term_id (added by _migrate) and GradeHistory refer to them
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS Term (
+                term_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT UNIQUE NOT NULL,
+                start_date TEXT NOT NULL,
+                end_date TEXT NOT NULL
+            )
+        """)
+
+        # Every grade ever written, appended by triggers on Grade; never updated or deleted.
+        # No foreign keys to Student or Course, so the history outlives deleted rows.
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS GradeHistory (
+                history_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                student_id INTEGER NOT NULL,
+                course_id INTEGER NOT NULL,
+                term_id INTEGER,
+                grade_value REAL,
+                recorded_at TEXT NOT NULL DEFAULT (strftime('%Y-%m-%d %H:%M:%f', 'now')),
+                FOREIGN KEY (term_id) REFERENCES Term(term_id)
+            )
+        """)
+
+        # Grade points and credits per term, kept current by the triggers from _create_history_triggers()
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS TermGpaStats (
+                term_id INTEGER PRIMARY KEY,
+                weighted_points REAL NOT NULL DEFAULT 0.0,
+                credits INTEGER NOT NULL DEFAULT 0,
+                grades INTEGER NOT NULL DEFAULT 0,
+                FOREIGN KEY (term_id) REFERENCES Term(term_id)
+            )
+        """)
         
         conn.commit()
-        conn.close()
+        self._migrate(conn)
+        DatabaseManager._ready_paths.add(self.db_name)
+
+    def _migrate(self, conn):
+        """ Applies schema changes that CREATE TABLE IF NOT EXISTS cannot, tracked by PRAGMA user_version. """
+        cursor = conn.cursor()
+        cursor.execute("PRAGMA user_version")
+        version = cursor.fetchone()[0]
+        if version >= self.SCHEMA_VERSION:
+            return
+
+        with conn:
+            if version < 1:
+                # Keep only the latest grade per (student, course) so the unique index can be built
+                cursor.execute("""
+                    DELETE FROM Grade
+                    WHERE grade_id NOT IN (
+                        SELECT MAX(grade_id) FROM Grade GROUP BY student_id, course_id
+                    )
+                """)
+
+                # Grade lookups by (student, course) and GPA scans by student
+                cursor.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_grade_student_course ON Grade (student_id, course_id)")
+                # Per-course enrollment counts and recomputes, answered from the index alone
+                cursor.execute("CREATE INDEX IF NOT EXISTS idx_grade_course ON Grade (course_id, student_id, grade_value)")
+                cursor.execute("CREATE INDEX IF NOT EXISTS idx_course_instructor ON Course (instructor_id)")
+
+                # Seed the running totals from the surviving grades
+                self._store_gpa_totals(cursor, self._fetch_gpa_totals(cursor, None))
+
+            if version < 2:
+                self._create_search_indexes(cursor)
+
+            if version < 3:
+                self._create_dashboard_triggers(cursor)
+                self._rebuild_dashboard_stats(cursor)
+
+            if version < 4:
+                self._create_data_version_triggers(cursor)
+
+            if version < 5:
+                # Rows left behind by deletes made while foreign keys were not enforced;
+                # the summary triggers adjust the dashboard tables for the deleted grades
+                cursor.execute("""
+                    DELETE FROM Grade
+                    WHERE student_id NOT IN (SELECT student_id FROM Student)
+                       OR course_id NOT IN (SELECT course_id FROM Course)
+                """)
+                cursor.execute("""
+                    UPDATE Course SET instructor_id = NULL
+                    WHERE instructor_id NOT IN (SELECT instructor_id FROM Instructor)
+                """)
+                cursor.execute("DELETE FROM StudentGpaTotals WHERE student_id NOT IN (SELECT student_id FROM Student)")
+
+            if version < 6:
+                cursor.execute("ALTER TABLE Grade ADD COLUMN term_id INTEGER REFERENCES Term(term_id)")
+                cursor.execute("CREATE INDEX IF NOT EXISTS idx_term_start ON Term (start_date)")
+                # Covers the per-(student, course, term) lookups of the triggers and of TERM_GRADES_SQL
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_grade_history_key
+                    ON GradeHistory (student_id, course_id, term_id, history_id, grade_value)
+                """)
+                # Existing grades start the history; their term is unknown
+                cursor.execute("""
+                    INSERT INTO GradeHistory (student_id, course_id, term_id, grade_value)
+                    SELECT student_id, course_id, term_id, grade_value FROM Grade ORDER BY grade_id
+                """)
+                self._create_history_triggers(cursor)
+                self._create_data_version_triggers(cursor)
+
+            if version < 7:
+                # One course's history, e.g. to reweight its term stats when its credit hours change
+                cursor.execute("CREATE INDEX IF NOT EXISTS idx_grade_history_course ON GradeHistory (course_id)")
+
+            if version < 8:
+                self._create_lookup_version_triggers(cursor)
+
+            cursor.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+
+    @staticmethod
+    def _create_search_indexes(cursor):
+        """ Creates the FTS5 search indexes and their sync triggers, then indexes existing rows. """
+        for index, (table, key, columns) in SEARCH_INDEXES.items():
+            column_list = ", ".join(columns)
+            new_values = ", ".join(f"new.{c}" for c in columns)
+            old_values = ", ".join(f"old.{c}" for c in columns)
+            try:
+                # prefix='2 3' keeps short prefix queries (as typed in a search box) off a full term scan
+                cursor.execute(f"""
+                    CREATE VIRTUAL TABLE IF NOT EXISTS {index}
+                    USING fts5({column_list}, content='{table}', content_rowid='{key}', prefix='2 3')
+                """)
+            except sqlite3.OperationalError as e:
+                # SQLite built without FTS5; search_ids() falls back to LIKE
+                print(f"Search index unavailable: {e}")
+                return
+
+            cursor.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS {index}_ai AFTER INSERT ON {table} BEGIN
+                    INSERT INTO {index} (rowid, {column_list}) VALUES (new.{key}, {new_values});
+                END
+            """)
+            cursor.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS {index}_ad AFTER DELETE ON {table} BEGIN
+                    INSERT INTO {index} ({index}, rowid, {column_list}) VALUES ('delete', old.{key}, {old_values});
+                END
+            """)
+            cursor.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS {index}_au AFTER UPDATE OF {column_list} ON {table} BEGIN
+                    INSERT INTO {index} ({index}, rowid, {column_list}) VALUES ('delete', old.{key}, {old_values});
+                    INSERT INTO {index} (rowid, {column_list}) VALUES (new.{key}, {new_values});
+                END
+            """)
+            cursor.execute(f"INSERT INTO {index} ({index}) VALUES ('rebuild')")
+
+    @staticmethod
+    def _create_dashboard_triggers(cursor):
+        """ Triggers that keep DashboardStats, GradeBucketCounts and CourseEnrollmentCounts current. """
+        new_bucket = GRADE_LETTER_SQL.format(value="new.grade_value")
+        old_bucket = GRADE_LETTER_SQL.format(value="old.grade_value")
+        # Average GPA only counts students with a GPA above zero
+        new_gpa = "(CASE WHEN new.gpa > 0 THEN new.gpa ELSE 0 END)"
+        old_gpa = "(CASE WHEN old.gpa > 0 THEN old.gpa ELSE 0 END)"
+        new_rated = "(CASE WHEN new.gpa > 0 THEN 1 ELSE 0 END)"
+        old_rated = "(CASE WHEN old.gpa > 0 THEN 1 ELSE 0 END)"
+
+        triggers = {
+            'dashboard_student_ai': f"""
+                AFTER INSERT ON Student BEGIN
+                    UPDATE DashboardStats SET students = students + 1,
+                        gpa_total = gpa_total + {new_gpa}, gpa_count = gpa_count + {new_rated};
+                END""",
+            'dashboard_student_ad': f"""
+                AFTER DELETE ON Student BEGIN
+                    UPDATE DashboardStats SET students = students - 1,
+                        gpa_total = gpa_total - {old_gpa}, gpa_count = gpa_count - {old_rated};
+                END""",
+            'dashboard_student_au': f"""
+                AFTER UPDATE OF gpa ON Student WHEN old.gpa IS NOT new.gpa BEGIN
+                    UPDATE DashboardStats SET gpa_total = gpa_total - {old_gpa} + {new_gpa},
+                        gpa_count = gpa_count - {old_rated} + {new_rated};
+                END""",
+            'dashboard_instructor_ai': """
+                AFTER INSERT ON Instructor BEGIN
+                    UPDATE DashboardStats SET instructors = instructors + 1;
+                END""",
+            'dashboard_instructor_ad': """
+                AFTER DELETE ON Instructor BEGIN
+                    UPDATE DashboardStats SET instructors = instructors - 1;
+                END""",
+            'dashboard_course_ai': """
+                AFTER INSERT ON Course BEGIN
+                    UPDATE DashboardStats SET courses = courses + 1;
+                    INSERT OR REPLACE INTO CourseEnrollmentCounts (course_id, enrolled)
+                    VALUES (new.course_id, (SELECT COUNT(*) FROM Grade WHERE course_id = new.course_id));
+                END""",
+            'dashboard_course_ad': """
+                AFTER DELETE ON Course BEGIN
+                    UPDATE DashboardStats SET courses = courses - 1;
+                    DELETE FROM CourseEnrollmentCounts WHERE course_id = old.course_id;
+                END""",
+            'dashboard_grade_ai': f"""
+                AFTER INSERT ON Grade BEGIN
+                    UPDATE GradeBucketCounts SET grade_count = grade_count + 1 WHERE bucket = {new_bucket};
+                    UPDATE CourseEnrollmentCounts SET enrolled = enrolled + 1 WHERE course_id = new.course_id;
+                END""",
+            'dashboard_grade_ad': f"""
+                AFTER DELETE ON Grade BEGIN
+                    UPDATE GradeBucketCounts SET grade_count = grade_count - 1 WHERE bucket = {old_bucket};
+                    UPDATE CourseEnrollmentCounts SET enrolled = enrolled - 1 WHERE course_id = old.course_id;
+                END""",
+            # Also fired by the DO UPDATE branch of GRADE_UPSERT_SQL
+            'dashboard_grade_au': f"""
+                AFTER UPDATE OF grade_value, course_id ON Grade BEGIN
+                    UPDATE GradeBucketCounts SET grade_count = grade_count - 1 WHERE bucket = {old_bucket};
+                    UPDATE GradeBucketCounts SET grade_count = grade_count + 1 WHERE bucket = {new_bucket};
+                    UPDATE CourseEnrollmentCounts SET enrolled = enrolled - 1 WHERE course_id = old.course_id;
+                    UPDATE CourseEnrollmentCounts SET enrolled = enrolled + 1 WHERE course_id = new.course_id;
+                END""",
+        }
+        for name, body in triggers.items():
+            cursor.execute(f"CREATE TRIGGER IF NOT EXISTS {name} {body}")
+
+    @staticmethod
+    def _create_history_triggers(cursor):
+        """
+        Triggers that append every Grade write to GradeHistory, keep GradeHistory
+        append-only, and keep TermGpaStats equal to the grades each term ended with.
+        """
+        new_points = GRADE_POINTS_OF_SQL.format(value="new.grade_value")
+        old_points = GRADE_POINTS_OF_SQL.format(value="G.grade_value")
+        add_to_term = """
+            ON CONFLICT (term_id) DO UPDATE SET weighted_points = weighted_points + excluded.weighted_points,
+                credits = credits + excluded.credits, grades = grades + excluded.grades"""
+
+        triggers = {
+            'grade_history_ai': """
+                AFTER INSERT ON Grade BEGIN
+                    INSERT INTO GradeHistory (student_id, course_id, term_id, grade_value)
+                    VALUES (new.student_id, new.course_id, new.term_id, new.grade_value);
+                END""",
+            # Moving a grade to another student or course withdraws it from the old one
+            'grade_history_au': """
+                AFTER UPDATE OF student_id, course_id, grade_value, term_id ON Grade
+                WHEN old.student_id IS NOT new.student_id OR old.course_id IS NOT new.course_id
+                    OR old.grade_value IS NOT new.grade_value OR old.term_id IS NOT new.term_id
+                BEGIN
+                    INSERT INTO GradeHistory (student_id, course_id, term_id, grade_value)
+                    SELECT old.student_id, old.course_id, old.term_id, NULL
+                    WHERE old.student_id IS NOT new.student_id OR old.course_id IS NOT new.course_id;
+                    INSERT INTO GradeHistory (student_id, course_id, term_id, grade_value)
+                    VALUES (new.student_id, new.course_id, new.term_id, new.grade_value);
+                END""",
+            'grade_history_ad': """
+                AFTER DELETE ON Grade BEGIN
+                    INSERT INTO GradeHistory (student_id, course_id, term_id, grade_value)
+                    VALUES (old.student_id, old.course_id, old.term_id, NULL);
+                END""",
+            'grade_history_bu': """
+                BEFORE UPDATE ON GradeHistory BEGIN
+                    SELECT RAISE(ABORT, 'GradeHistory is append-only');
+                END""",
+            'grade_history_bd': """
+                BEFORE DELETE ON GradeHistory BEGIN
+                    SELECT RAISE(ABORT, 'GradeHistory is append-only');
+                END""",
+            # The entry replaces the grade the (student, course) had so far in the term, if any
+            'term_stats_history_ai': f"""
+                AFTER INSERT ON GradeHistory WHEN new.term_id IS NOT NULL BEGIN
+                    INSERT INTO TermGpaStats (term_id, weighted_points, credits, grades)
+                    SELECT new.term_id, -({old_points}) * C.credit_hours, -C.credit_hours, -1
+                    FROM GradeHistory G
+                    JOIN Course C ON C.course_id = G.course_id
+                    WHERE G.history_id = (
+                        SELECT MAX(history_id) FROM GradeHistory
+                        WHERE student_id = new.student_id AND course_id = new.course_id
+                          AND term_id = new.term_id AND history_id < new.history_id
+                    ) AND G.grade_value IS NOT NULL
+                    {add_to_term};
+                    INSERT INTO TermGpaStats (term_id, weighted_points, credits, grades)
+                    SELECT new.term_id, ({new_points}) * C.credit_hours, C.credit_hours, 1
+                    FROM Course C
+                    WHERE C.course_id = new.course_id AND new.grade_value IS NOT NULL
+                    {add_to_term};
+                END""",
+        }
+        for name, body in triggers.items():
+            cursor.execute(f"CREATE TRIGGER IF NOT EXISTS {name} {body}")
+
+    @staticmethod
+    def _create_data_version_triggers(cursor):
+        """ Bumps DataVersions for a table on every insert, update or delete, whoever the writer is. """
+        for table in VERSIONED_TABLES:
+            cursor.execute("INSERT OR IGNORE INTO DataVersions (table_name, version) VALUES (?, 0)", (table,))
+            for suffix, event in (('ai', 'INSERT'), ('au', 'UPDATE'), ('ad', 'DELETE')):
+                cursor.execute(f"""
+                    CREATE TRIGGER IF NOT EXISTS data_version_{table}_{suffix} AFTER {event} ON {table} BEGIN
+                        UPDATE DataVersions SET version = version + 1 WHERE table_name = '{table}';
+                    END
+                """)
+
+    @staticmethod
+    def _create_lookup_version_triggers(cursor):
+        """ Bumps a table's lookup counter only when a row or one of its LOOKUP_COLUMNS changes. """
+        for table, columns in LOOKUP_COLUMNS.items():
+            counter = f"{table}Lookup"
+            cursor.execute("INSERT OR IGNORE INTO DataVersions (table_name, version) VALUES (?, 0)", (counter,))
+            for suffix, event in (('ai', 'INSERT'), ('au', f"UPDATE OF {', '.join(columns)}"), ('ad', 'DELETE')):
+                cursor.execute(f"""
+                    CREATE TRIGGER IF NOT EXISTS lookup_version_{table}_{suffix} AFTER {event} ON {table} BEGIN
+                        UPDATE DataVersions SET version = version + 1 WHERE table_name = '{counter}';
+                    END
+                """)
+
+    def get_lookup_versions(self, tables):
+        """ Lookup counters of the given tables, for LookupCache.get_or_load(). """
+        return self.get_data_versions(tuple(f"{table}Lookup" for table in tables))
+
+    def get_data_versions(self, tables=VERSIONED_TABLES):
+        """ {table: version} for the given tables; a version changes whenever its table is written. """
+        cursor = self.connect().cursor()
+        cursor.execute("SELECT table_name, version FROM DataVersions")
+        versions = dict(cursor.fetchall())
+        return {table: versions.get(table, 0) for table in tables}
 
     # ---------- Student Methods ----------
     def add_student(self, name, email, credit_hours=0):
+        conn = self.connect()
+        with conn:
+            conn.execute("""
+                INSERT INTO Student (name, email, credit_hours)
+                VALUES (?, ?, ?)
+            """, (name, email, credit_hours))
+        DatabaseManager.lookups.invalidate('Student')
+
+    def add_students_bulk(self, rows):
+        """
+        Inserts many (name, email) rows with one executemany in a single transaction.
+        Rows with a missing field or an email that is already taken are skipped and reported.
+        Returns {'written': int, 'failed': [(row_index, row, reason)]}.
+        """
         conn = self.connect()
         cursor = conn.cursor()
-        cursor.execute("""
-            INSERT INTO Student (name, email, credit_hours)
-            VALUES (?, ?, ?)
-        """, (name, email, credit_hours))
-        conn.commit()
-        conn.close()
+
+        candidates = []
+        failures = []
+        for index, row in enumerate(rows):
+            try:
+                name, email = (str(v).strip() for v in row)
+            except (TypeError, ValueError) as e:
+                failures.append((index, row, f"Malformed row: {e}"))
+                continue
+            if not name or not email:
+                failures.append((index, row, "Name and email are required"))
+            else:
+                candidates.append((index, row, name, email))
+
+        valid = []
+        with conn:
+            # Check and insert under the write lock, so a concurrent insert of the
+            # same email cannot fail the whole executemany
+            DatabaseManager.begin_immediate(cursor)
+            taken = set()
+            emails = list({c[3] for c in candidates})
+            for start in range(0, len(emails), SQL_CHUNK_SIZE):
+                chunk = emails[start:start + SQL_CHUNK_SIZE]
+                marks = ", ".join("?" * len(chunk))
+                cursor.execute(f"SELECT email FROM Student WHERE email IN ({marks})", chunk)
+                taken.update(r[0] for r in cursor.fetchall())
+
+            for index, row, name, email in candidates:
+                if email in taken:
+                    failures.append((index, row, f"Email '{email}' already exists"))
+                else:
+                    taken.add(email)
+                    valid.append((name, email))
+
+            cursor.executemany("INSERT INTO Student (name, email, credit_hours, gpa) VALUES (?, ?, 0, 0.0)", valid)
+        if valid:
+            DatabaseManager.lookups.invalidate('Student')
+
+        failures.sort(key=lambda f: f[0])
+        return {'written': len(valid), 'failed': failures}
 
     def get_all_students(self):
         conn = self.connect()
         cursor = conn.cursor()
         cursor.execute("SELECT * FROM Student")
-        students = cursor.fetchall()
-        conn.close()
-        return students
+        return cursor.fetchall()
 
     def get_student_by_id(self, student_id):
         conn = self.connect()
         cursor = conn.cursor()
         cursor.execute("SELECT * FROM Student WHERE student_id = ?", (student_id,))
-        student = cursor.fetchone()
-        conn.close()
-        return student
+        return cursor.fetchone()
 
     def update_student(self, student_id, name=None, email=None, credit_hours=None):
         conn = self.connect()
-        cursor = conn.cursor()
-        if name:
-            cursor.execute("UPDATE Student SET name = ? WHERE student_id = ?", (name, student_id))
-        if email:
-            cursor.execute("UPDATE Student SET email = ? WHERE student_id = ?", (email, student_id))
-        if credit_hours is not None:
-            cursor.execute("UPDATE Student SET credit_hours = ? WHERE student_id = ?", (credit_hours, student_id))
-        conn.commit()
-        conn.close()
+        with conn:
+            cursor = conn.cursor()
+            if name:
+                cursor.execute("UPDATE Student SET name = ? WHERE student_id = ?", (name, student_id))
+            if email:
+                cursor.execute("UPDATE Student SET email = ? WHERE student_id = ?", (email, student_id))
+            if credit_hours is not None:
+                cursor.execute("UPDATE Student SET credit_hours = ? WHERE student_id = ?", (credit_hours, student_id))
+        if name or email:
+            DatabaseManager.lookups.invalidate('Student')
 
     def delete_student(self, student_id):
+        """ Deletes the student together with their grades and GPA totals. """
         conn = self.connect()
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM Student WHERE student_id = ?", (student_id,))
-        conn.commit()
-        conn.close()
+        with conn:
+            conn.execute("DELETE FROM Grade WHERE student_id = ?", (student_id,))
+            conn.execute("DELETE FROM StudentGpaTotals WHERE student_id = ?", (student_id,))
+            conn.execute("DELETE FROM Student WHERE student_id = ?", (student_id,))
+        DatabaseManager.lookups.invalidate('Student')
 
     # ---------- Instructor Methods ----------
     def add_instructor(self, name, email):
         conn = self.connect()
-        cursor = conn.cursor()
-        cursor.execute("""
-            INSERT INTO Instructor (name, email)
-            VALUES (?, ?)
-        """, (name, email))
-        conn.commit()
-        conn.close()
+        with conn:
+            conn.execute("""
+                INSERT INTO Instructor (name, email)
+                VALUES (?, ?)
+            """, (name, email))
+        DatabaseManager.lookups.invalidate('Instructor')
 
     def get_all_instructors(self):
         conn = self.connect()
         cursor = conn.cursor()
         cursor.execute("SELECT * FROM Instructor")
-        instructors = cursor.fetchall()
-        conn.close()
-        return instructors
+        return cursor.fetchall()
 
     # ---------- Course Methods ----------
     def add_course(self, name, credit_hours, instructor_id=None):
         conn = self.connect()
-        cursor = conn.cursor()
-        cursor.execute("""
-            INSERT INTO Course (name, credit_hours, instructor_id)
-            VALUES (?, ?, ?)
-        """, (name, credit_hours, instructor_id))
-        conn.commit()
-        conn.close()
+        with conn:
+            conn.execute("""
+                INSERT INTO Course (name, credit_hours, instructor_id)
+                VALUES (?, ?, ?)
+            """, (name, credit_hours, instructor_id))
+        DatabaseManager.lookups.invalidate('Course')
 
     def get_all_courses(self):
         conn = self.connect()
         cursor = conn.cursor()
         cursor.execute("SELECT * FROM Course")
-        courses = cursor.fetchall()
-        conn.close()
-        return courses
+        return cursor.fetchall()
 
     # ---------- Grade Methods ----------
-    def add_grade(self, student_id, course_id, grade_value):
+    def add_grade(self, student_id, course_id, grade_value, term_id=None):
+        conn = self.connect()
+        with conn:
+            conn.execute(GRADE_UPSERT_SQL, (student_id, course_id, grade_value, term_id))
+
+    def assign_grades_bulk(self, rows, term_id=None):
+        """
+        Upserts many (student_id, course_id, grade_value) rows with one executemany
+        in a single transaction, then recomputes GPA once per affected student.
+        The grades belong to term_id, or to the current term when it is None.
+        Invalid rows are skipped and reported instead of aborting the batch.
+        Returns {'written': int, 'failed': [(row_index, row, reason)], 'students_updated': int}.
+        """
         conn = self.connect()
         cursor = conn.cursor()
-        cursor.execute("""
-            INSERT INTO Grade (student_id, course_id, grade_value)
-            VALUES (?, ?, ?)
-        """, (student_id, course_id, grade_value))
-        conn.commit()
-        conn.close()
+
+        parsed = []
+        failures = []
+        for index, row in enumerate(rows):
+            try:
+                student_id, course_id, grade_value = row
+                parsed.append((index, row, int(student_id), int(course_id), float(grade_value)))
+            except (TypeError, ValueError) as e:
+                failures.append((index, row, f"Malformed row: {e}"))
+
+        valid = []
+        with conn:
+            # Validate under the write lock, so a student or course deleted by another
+            # connection cannot fail the whole executemany
+            DatabaseManager.begin_immediate(cursor)
+            known_students = self._existing_ids(cursor, "Student", "student_id", {p[2] for p in parsed})
+            known_courses = self._existing_ids(cursor, "Course", "course_id", {p[3] for p in parsed})
+
+            for index, row, student_id, course_id, grade_value in parsed:
+                if not 0.0 <= grade_value <= 100.0:
+                    failures.append((index, row, "Grade must be between 0 and 100"))
+                elif student_id not in known_students:
+                    failures.append((index, row, f"Unknown student ID {student_id}"))
+                elif course_id not in known_courses:
+                    failures.append((index, row, f"Unknown course ID {course_id}"))
+                else:
+                    valid.append((student_id, course_id, grade_value, term_id))
+
+            affected = list(dict.fromkeys(v[0] for v in valid))
+            cursor.executemany(GRADE_UPSERT_SQL, valid)
+            self._store_gpa_totals(cursor, self._fetch_gpa_totals(cursor, affected))
+
+        failures.sort(key=lambda f: f[0])
+        return {'written': len(valid), 'failed': failures, 'students_updated': len(affected)}
+
+    @staticmethod
+    def _existing_ids(cursor, table, column, ids):
+        """ Subset of ids present in table.column, looked up through the primary key in chunks. """
+        ids = list(ids)
+        found = set()
+        for start in range(0, len(ids), SQL_CHUNK_SIZE):
+            chunk = ids[start:start + SQL_CHUNK_SIZE]
+            marks = ", ".join("?" * len(chunk))
+            cursor.execute(f"SELECT {column} FROM {table} WHERE {column} IN ({marks})", chunk)
+            found.update(row[0] for row in cursor.fetchall())
+        return found
 
     def get_grades_by_student(self, student_id):
         conn = self.connect()
@@ -178,14 +1215,19 @@ class DatabaseManager:
             JOIN Course ON Grade.course_id = Course.course_id
             WHERE Grade.student_id = ?
         """, (student_id,))
-        grades = cursor.fetchall()
-        conn.close()
-        return grades
+        return cursor.fetchall()
 
     # ---------- GPA Calculation (Weighted) ----------
-    def calculate_gpa(self, student_id, course_id=None):
-        from models.grade import Grade 
+    @staticmethod
+    def grade_points(grade_val):
+        """ Points on the 4.0 scale for a single numeric grade. """
+        if grade_val >= 90: return 4.0
+        elif grade_val >= 80: return 3.0
+        elif grade_val >= 70: return 2.0
+        elif grade_val >= 60: return 1.0
+        else: return 0.0
 
+    def calculate_gpa(self, student_id, course_id=None):
         conn = self.connect()
         cursor = conn.cursor()
 
@@ -198,39 +1240,384 @@ class DatabaseManager:
         cursor.execute(query, (student_id,))
         records = cursor.fetchall()
 
-        if not records:
-            cursor.execute("UPDATE Student SET gpa = 0.0, credit_hours = 0 WHERE student_id = ?", (student_id,))
-            conn.commit()
-            conn.close()
-            return 0.0
-
         total_weighted_points = 0
         total_credits = 0
 
         for grade_val, credit_hours in records:
-            if grade_val >= 90: points = 4.0
-            elif grade_val >= 80: points = 3.0
-            elif grade_val >= 70: points = 2.0
-            elif grade_val >= 60: points = 1.0
-            else: points = 0.0
-            
-            total_weighted_points += (points * credit_hours)
+            total_weighted_points += (self.grade_points(grade_val) * credit_hours)
             total_credits += credit_hours
 
-        if total_credits > 0:
-            final_gpa = round(total_weighted_points / total_credits, 2)
-        else:
-            final_gpa = 0.0
+        with conn:
+            final_gpa = self._store_gpa_totals(conn.cursor(), [(student_id, total_weighted_points, total_credits)])[0]
+        return final_gpa
+
+    # ---------- Bulk GPA Recalculation (Set-Based) ----------
+    def recalculate_all_gpas(self):
+        """ Recomputes GPA and credit hours for every student in one aggregate pass. """
+        conn = self.connect()
+        with conn:
+            cursor = conn.cursor()
+            return len(self._store_gpa_totals(cursor, self._fetch_gpa_totals(cursor, None)))
+
+    def recalculate_gpas(self, student_ids, cursor=None):
+        """
+        Recomputes GPA and credit hours for the given students only.
+        Given a cursor, runs inside the caller's transaction.
+        """
+        student_ids = list(dict.fromkeys(student_ids))
+        if not student_ids:
+            return 0
+        if cursor is None:
+            conn = self.connect()
+            with conn:
+                return self.recalculate_gpas(student_ids, conn.cursor())
+        return len(self._store_gpa_totals(cursor, self._fetch_gpa_totals(cursor, student_ids)))
+
+    def recalculate_course_gpas(self, course_id, cursor=None):
+        """
+        Recomputes GPA for every student graded in a course (e.g. after its credit
+        hours change). Given a cursor, runs inside the caller's transaction.
+        """
+        if cursor is None:
+            conn = self.connect()
+            with conn:
+                return self.recalculate_course_gpas(course_id, conn.cursor())
+        cursor.execute("SELECT student_id FROM Grade WHERE course_id = ?", (course_id,))
+        return self.recalculate_gpas([row[0] for row in cursor.fetchall()], cursor)
+
+    def _fetch_gpa_totals(self, cursor, student_ids):
+        """ Returns (student_id, weighted_points, credits) rows, from scratch. None means all students. """
+        query = """
+            SELECT S.student_id, COALESCE(T.points, 0), COALESCE(T.credits, 0)
+            FROM Student S
+            LEFT JOIN (
+                SELECT G.student_id AS student_id,
+                       SUM({points} * C.credit_hours) AS points,
+                       SUM(C.credit_hours) AS credits
+                FROM Grade G
+                JOIN Course C ON G.course_id = C.course_id
+                {inner_filter}
+                GROUP BY G.student_id
+            ) T ON T.student_id = S.student_id
+            {outer_filter}
+        """
+
+        if student_ids is None:
+            cursor.execute(query.format(points=GRADE_POINTS_SQL, inner_filter="", outer_filter=""))
+            return cursor.fetchall()
+
+        totals = []
+        for start in range(0, len(student_ids), SQL_CHUNK_SIZE):
+            chunk = list(student_ids[start:start + SQL_CHUNK_SIZE])
+            marks = ", ".join("?" * len(chunk))
+            cursor.execute(query.format(points=GRADE_POINTS_SQL,
+                                        inner_filter=f"WHERE G.student_id IN ({marks})",
+                                        outer_filter=f"WHERE S.student_id IN ({marks})"),
+                           chunk + chunk)
+            totals.extend(cursor.fetchall())
+        return totals
+
+    def _store_gpa_totals(self, cursor, totals):
+        """
+        Writes GPA, credit hours and the running totals for each
+        (student_id, weighted_points, credits) row. Runs inside the caller's transaction.
+        """
+        # One rounding rule for every path so they all store identical values
+        gpas = [round(points / credits, 2) if credits > 0 else 0.0 for _, points, credits in totals]
+        cursor.executemany("UPDATE Student SET gpa = ?, credit_hours = ? WHERE student_id = ?",
+                           [(gpa, row[2], row[0]) for gpa, row in zip(gpas, totals)])
+        cursor.executemany("""
+            INSERT OR REPLACE INTO StudentGpaTotals (student_id, weighted_points, credits)
+            VALUES (?, ?, ?)
+        """, totals)
+        return gpas
+
+    # ---------- Incremental GPA Maintenance ----------
+    def apply_grade_delta(self, cursor, student_id, course_id, old_value, new_value):
+        """
+        Updates a student's running totals for one grade change instead of
+        re-reading all their grades. old_value is None for a new grade and
+        new_value is None for a deleted one. Runs inside the caller's transaction.
+        """
+        cursor.execute("SELECT credit_hours FROM Course WHERE course_id = ?", (course_id,))
+        course = cursor.fetchone()
+
+        points_delta = 0.0
+        credits_delta = 0
+        if course is not None:
+            hours = course[0]
+            if old_value is not None:
+                points_delta -= self.grade_points(old_value) * hours
+                credits_delta -= hours
+            if new_value is not None:
+                points_delta += self.grade_points(new_value) * hours
+                credits_delta += hours
 
         cursor.execute("""
-            UPDATE Student 
-            SET gpa = ?, credit_hours = ? 
+            UPDATE StudentGpaTotals
+            SET weighted_points = weighted_points + ?, credits = credits + ?
             WHERE student_id = ?
-        """, (final_gpa, total_credits, student_id))
-        
-        conn.commit()
-        conn.close()
-        return final_gpa
+        """, (points_delta, credits_delta, student_id))
+
+        if cursor.rowcount == 0:
+            # No running totals yet (e.g. rows written before incremental mode): seed them
+            totals = self._fetch_gpa_totals(cursor, [student_id])
+        else:
+            cursor.execute("SELECT student_id, weighted_points, credits FROM StudentGpaTotals WHERE student_id = ?",
+                           (student_id,))
+            totals = cursor.fetchall()
+        return self._store_gpa_totals(cursor, totals)[0] if totals else 0.0
+
+    def check_gpa_consistency(self, repair=False, tolerance=1e-6):
+        """
+        Compares the incremental running totals against a full recompute.
+        Returns a list of (student_id, (points, credits) stored, (points, credits) expected)
+        for every mismatch; with repair=True the mismatched students are recomputed.
+        """
+        cursor = self.connect().cursor()
+        expected = {row[0]: (row[1], row[2]) for row in self._fetch_gpa_totals(cursor, None)}
+        cursor.execute("SELECT student_id, weighted_points, credits FROM StudentGpaTotals")
+        stored = {row[0]: (row[1], row[2]) for row in cursor.fetchall()}
+
+        mismatches = []
+        for student_id, (points, credits) in expected.items():
+            actual = stored.get(student_id, (0.0, 0))
+            if abs(actual[0] - points) > tolerance or actual[1] != credits:
+                mismatches.append((student_id, actual, (points, credits)))
+
+        if repair and mismatches:
+            self.recalculate_gpas([m[0] for m in mismatches])
+        return mismatches
+
+    # ---------- Terms and Grade History ----------
+    def add_term(self, name, start_date, end_date):
+        """ Adds a term running from start_date to end_date (ISO 'YYYY-MM-DD'). Returns its term_id. """
+        conn = self.connect()
+        with conn:
+            cursor = conn.execute("INSERT INTO Term (name, start_date, end_date) VALUES (?, ?, ?)",
+                                  (name, start_date, end_date))
+        return cursor.lastrowid
+
+    def get_terms(self):
+        """ (term_id, name, start_date, end_date) for every term, oldest first. """
+        cursor = self.connect().cursor()
+        cursor.execute("SELECT term_id, name, start_date, end_date FROM Term ORDER BY start_date, term_id")
+        return cursor.fetchall()
+
+    def get_term_id(self, name):
+        cursor = self.connect().cursor()
+        cursor.execute("SELECT term_id FROM Term WHERE name = ?", (name,))
+        row = cursor.fetchone()
+        return row[0] if row else None
+
+    def get_grade_history(self, student_id):
+        """
+        Every grade written for a student, oldest first, as
+        (recorded_at, term name, course_id, course name, grade_value);
+        grade_value is None where the grade was deleted.
+        """
+        cursor = self.connect().cursor()
+        cursor.execute("""
+            SELECT H.recorded_at, T.name, H.course_id, C.name, H.grade_value
+            FROM GradeHistory H
+            LEFT JOIN Term T ON T.term_id = H.term_id
+            LEFT JOIN Course C ON C.course_id = H.course_id
+            WHERE H.student_id = ?
+            ORDER BY H.history_id
+        """, (student_id,))
+        return cursor.fetchall()
+
+    def get_gpa_history(self, student_id):
+        """
+        A student's GPA per term, oldest first, as (term name, term GPA,
+        cumulative GPA, credits). Each term counts the grades it ended with, so a
+        course retaken in a later term counts in both terms.
+        """
+        cursor = self.connect().cursor()
+        cursor.execute(f"""
+            SELECT T.name,
+                   ROUND(S.points / S.credits, 2),
+                   ROUND(SUM(S.points) OVER running / SUM(S.credits) OVER running, 2),
+                   S.credits
+            FROM ({STUDENT_TERM_POINTS_SQL.format(filter="AND student_id = ?")}) S
+            JOIN Term T ON T.term_id = S.term_id
+            WINDOW running AS (ORDER BY T.start_date, T.term_id ROWS UNBOUNDED PRECEDING)
+            ORDER BY T.start_date, T.term_id
+        """, (student_id,))
+        return cursor.fetchall()
+
+    def get_gpa_trend(self, rolling_terms=3):
+        """
+        Credit-weighted GPA of all grades per term, oldest first, read from the
+        trigger-maintained TermGpaStats table. Returns (term name, GPA, GPA over
+        the last rolling_terms terms, grades) rows.
+        """
+        cursor = self.connect().cursor()
+        cursor.execute("""
+            SELECT T.name,
+                   ROUND(S.weighted_points / S.credits, 2),
+                   ROUND(SUM(S.weighted_points) OVER recent / SUM(S.credits) OVER recent, 2),
+                   S.grades
+            FROM TermGpaStats S
+            JOIN Term T ON T.term_id = S.term_id
+            WHERE S.credits > 0
+            WINDOW recent AS (ORDER BY T.start_date, T.term_id ROWS BETWEEN ? PRECEDING AND CURRENT ROW)
+            ORDER BY T.start_date, T.term_id
+        """, (max(0, rolling_terms - 1),))
+        return cursor.fetchall()
+
+    def get_cohort_trends(self):
+        """
+        Average term GPA of each entering cohort (students whose first graded term
+        is the same) over their terms since entry. Returns (cohort term name,
+        term number starting at 1, students, average term GPA) rows, oldest cohort first.
+        """
+        cursor = self.connect().cursor()
+        cursor.execute(f"""
+            WITH ranked AS (
+                SELECT S.points / S.credits AS term_gpa,
+                       FIRST_VALUE(S.term_id) OVER by_student AS cohort_id,
+                       ROW_NUMBER() OVER by_student AS term_number
+                FROM ({STUDENT_TERM_POINTS_SQL.format(filter="")}) S
+                JOIN Term T ON T.term_id = S.term_id
+                WINDOW by_student AS (PARTITION BY S.student_id ORDER BY T.start_date, T.term_id)
+            )
+            SELECT T.name, R.term_number, COUNT(*), ROUND(AVG(R.term_gpa), 2)
+            FROM ranked R
+            JOIN Term T ON T.term_id = R.cohort_id
+            GROUP BY R.cohort_id, R.term_number
+            ORDER BY T.start_date, T.term_id, R.term_number
+        """)
+        return cursor.fetchall()
+
+    def rebuild_term_stats(self, cursor=None):
+        """
+        Recomputes TermGpaStats from GradeHistory, e.g. after a course's credit hours
+        changed. Given a cursor, runs inside the caller's transaction.
+        """
+        if cursor is None:
+            conn = self.connect()
+            with conn:
+                self._rebuild_term_stats(conn.cursor())
+        else:
+            self._rebuild_term_stats(cursor)
+
+    def reweight_course_term_stats(self, course_id, hours_delta, cursor=None):
+        """
+        Applies a change of hours_delta in a course's credit hours to TermGpaStats,
+        touching only that course's history. Given a cursor, runs inside the
+        caller's transaction.
+        """
+        if cursor is None:
+            conn = self.connect()
+            with conn:
+                return self.reweight_course_term_stats(course_id, hours_delta, conn.cursor())
+        cursor.execute(f"""
+            INSERT INTO TermGpaStats (term_id, weighted_points, credits, grades)
+            SELECT E.term_id, SUM({GRADE_POINTS_OF_SQL.format(value="E.grade_value")}) * ?, COUNT(*) * ?, 0
+            FROM ({TERM_GRADES_SQL.format(filter="AND course_id = ?")}) E
+            WHERE E.grade_value IS NOT NULL
+            GROUP BY E.term_id
+            ON CONFLICT (term_id) DO UPDATE SET weighted_points = weighted_points + excluded.weighted_points,
+                credits = credits + excluded.credits
+        """, (hours_delta, hours_delta, course_id))
+
+    def withdraw_course_term_stats(self, course_id, cursor=None):
+        """
+        Takes a course's history out of TermGpaStats before the course is deleted,
+        since TermGpaStats only counts history whose course still exists. The
+        course's grades must already be deleted (their triggers withdraw each
+        grade from its current term); this withdraws the grades left in other terms.
+        Given a cursor, runs inside the caller's transaction.
+        """
+        if cursor is None:
+            conn = self.connect()
+            with conn:
+                return self.withdraw_course_term_stats(course_id, conn.cursor())
+        cursor.execute(f"""
+            INSERT INTO TermGpaStats (term_id, weighted_points, credits, grades)
+            SELECT E.term_id, -SUM({GRADE_POINTS_OF_SQL.format(value="E.grade_value")} * C.credit_hours),
+                   -SUM(C.credit_hours), -COUNT(*)
+            FROM ({TERM_GRADES_SQL.format(filter="AND course_id = ?")}) E
+            JOIN Course C ON C.course_id = E.course_id
+            WHERE E.grade_value IS NOT NULL
+            GROUP BY E.term_id
+            ON CONFLICT (term_id) DO UPDATE SET weighted_points = weighted_points + excluded.weighted_points,
+                credits = credits + excluded.credits, grades = grades + excluded.grades
+        """, (course_id,))
+
+    @staticmethod
+    def _aggregate_term_points(cursor):
+        """ (term_id, weighted_points, credits, grades) per term, from GradeHistory. """
+        cursor.execute(f"""
+            SELECT term_id, SUM(points), SUM(credits), SUM(grades)
+            FROM (
+                SELECT E.term_id,
+                       {GRADE_POINTS_OF_SQL.format(value="E.grade_value")} * C.credit_hours AS points,
+                       C.credit_hours AS credits, 1 AS grades
+                FROM ({TERM_GRADES_SQL.format(filter="")}) E
+                JOIN Course C ON C.course_id = E.course_id
+                WHERE E.grade_value IS NOT NULL
+            )
+            GROUP BY term_id
+        """)
+        return cursor.fetchall()
+
+    def _rebuild_term_stats(self, cursor, term_points=None):
+        """ Runs inside the caller's transaction; term_points is _aggregate_term_points() if already fetched. """
+        if term_points is None:
+            term_points = self._aggregate_term_points(cursor)
+        cursor.execute("DELETE FROM TermGpaStats")
+        cursor.executemany("INSERT INTO TermGpaStats (term_id, weighted_points, credits, grades) VALUES (?, ?, ?, ?)",
+                           term_points)
+
+    @staticmethod
+    def _gpa_trend(cursor, term_points):
+        """ (term name, GPA) per term with grades, oldest first, from (term_id, points, credits, ...) rows. """
+        totals = {row[0]: (row[1], row[2]) for row in term_points}
+        cursor.execute("SELECT term_id, name FROM Term ORDER BY start_date, term_id")
+        return [(name, round(totals[term_id][0] / totals[term_id][1], 2))
+                for term_id, name in cursor.fetchall() if totals.get(term_id, (0, 0))[1] > 0]
+
+    # ---------- Search ----------
+    @staticmethod
+    def fts_match_query(text):
+        """ Turns search-box text into an FTS5 query where every word is a quoted prefix term. """
+        return " ".join(f'"{word}"*' for word in re.findall(r"\w+", text))
+
+    @staticmethod
+    def search_ids(cursor, index, text, limit=200):
+        """
+        Keys of the rows in index's source table matching every word of text as a
+        prefix, best match (FTS5 bm25 rank) first.
+        """
+        match = DatabaseManager.fts_match_query(text)
+        if not match:
+            return []
+        try:
+            cursor.execute(f"SELECT rowid FROM {index} WHERE {index} MATCH ? ORDER BY rank LIMIT ?",
+                           (match, limit))
+        except sqlite3.OperationalError:
+            # No FTS5 index in this database: unranked substring scan
+            table, key, columns = SEARCH_INDEXES[index]
+            condition = " OR ".join(f"{c} LIKE ?" for c in columns)
+            cursor.execute(f"SELECT {key} FROM {table} WHERE {condition} ORDER BY {key} LIMIT ?",
+                           [f"%{text.strip()}%"] * len(columns) + [limit])
+        return [row[0] for row in cursor.fetchall()]
+
+    @staticmethod
+    def fetch_ranked(cursor, query, ids):
+        """
+        Runs query (which must select the key first and contain one '{ids}' IN-list
+        placeholder) for ids, returning rows in the order of ids.
+        """
+        ids = list(dict.fromkeys(ids))
+        by_id = {}
+        for start in range(0, len(ids), SQL_CHUNK_SIZE):
+            chunk = ids[start:start + SQL_CHUNK_SIZE]
+            cursor.execute(query.format(ids=", ".join("?" * len(chunk))), chunk)
+            by_id.update((row[0], row) for row in cursor.fetchall())
+        return [by_id[i] for i in ids if i in by_id]
 
     # ---------- Dashboard Statistics Methods ----------
     def get_general_stats(self):
@@ -250,26 +1637,13 @@ class DatabaseManager:
         avg_gpa = cursor.fetchone()[0]
         avg_gpa = round(avg_gpa, 2) if avg_gpa else 0.0
 
-        conn.close()
         return total_students, total_courses, total_instructors, avg_gpa
 
     def get_grade_distribution(self):
         conn = self.connect()
         cursor = conn.cursor()
-        cursor.execute("SELECT grade_value FROM Grade")
-        grades = cursor.fetchall()
-        conn.close()
-
-        distribution = {'A': 0, 'B': 0, 'C': 0, 'D': 0, 'F': 0}
-        for g in grades:
-            score = g[0]
-            if score >= 90: distribution['A'] += 1
-            elif score >= 80: distribution['B'] += 1
-            elif score >= 70: distribution['C'] += 1
-            elif score >= 60: distribution['D'] += 1
-            else: distribution['F'] += 1
-        
-        return distribution
+        cursor.execute(f"SELECT {GRADE_BUCKETS_SQL} FROM Grade G")
+        return dict(zip(GRADE_LETTERS, cursor.fetchone()))
 
     def get_course_enrollment_stats(self):
         conn = self.connect()
@@ -282,7 +1656,147 @@ class DatabaseManager:
             GROUP BY C.course_id
         """
         cursor.execute(query)
-        data = cursor.fetchall()
-        conn.close()
-        
-        return data
\ No newline at end of file
+        return cursor.fetchall()
+
+    def get_dashboard_snapshot(self):
+        """
+        Everything the dashboard shows, read from the trigger-maintained summary
+        tables, so the cost does not grow with the number of grades or students.
+        Returns the same dict as compute_dashboard_snapshot().
+        """
+        conn = self.connect()
+        cursor = conn.cursor()
+        own_transaction = not conn.in_transaction
+        if own_transaction:
+            cursor.execute("BEGIN")
+        try:
+            cursor.execute("SELECT students, courses, instructors, gpa_total, gpa_count FROM DashboardStats")
+            total_students, total_courses, total_instructors, gpa_total, gpa_count = cursor.fetchone()
+
+            cursor.execute("SELECT bucket, grade_count FROM GradeBucketCounts")
+            bucket_counts = dict(cursor.fetchall())
+
+            cursor.execute("""
+                SELECT C.name, E.enrolled
+                FROM Course C
+                JOIN CourseEnrollmentCounts E ON E.course_id = C.course_id
+                ORDER BY C.course_id
+            """)
+            enrollment = cursor.fetchall()
+
+            cursor.execute("SELECT term_id, weighted_points, credits FROM TermGpaStats")
+            gpa_trend = self._gpa_trend(cursor, cursor.fetchall())
+        finally:
+            if own_transaction:
+                conn.commit()
+
+        return {
+            'students': total_students,
+            'courses': total_courses,
+            'instructors': total_instructors,
+            'avg_gpa': round(gpa_total / gpa_count, 2) if gpa_count else 0.0,
+            'distribution': {letter: bucket_counts.get(letter, 0) for letter in GRADE_LETTERS},
+            'enrollment': enrollment,
+            'gpa_trend': gpa_trend,
+        }
+
+    def rebuild_dashboard_stats(self):
+        """
+        Recomputes the dashboard summary tables from the base tables, e.g. after
+        they were edited with the triggers disabled. Returns the rebuilt snapshot.
+        """
+        conn = self.connect()
+        with conn:
+            self._rebuild_dashboard_stats(conn.cursor())
+        return self.get_dashboard_snapshot()
+
+    def rebuild_derived_data(self, cursor=None):
+        """
+        Recomputes every student's GPA running totals and the dashboard summary
+        tables from the base tables, e.g. after a bulk load with the triggers off.
+        Given a cursor, runs inside the caller's transaction.
+        """
+        if cursor is None:
+            conn = self.connect()
+            with conn:
+                return self.rebuild_derived_data(conn.cursor())
+        self._store_gpa_totals(cursor, self._fetch_gpa_totals(cursor, None))
+        self._rebuild_dashboard_stats(cursor)
+
+    def _rebuild_dashboard_stats(self, cursor):
+        """ Runs inside the caller's transaction. """
+        term_points = self._aggregate_term_points(cursor)
+        snapshot = self._aggregate_dashboard(cursor, term_points)
+        cursor.execute("DELETE FROM DashboardStats")
+        cursor.execute("""
+            INSERT INTO DashboardStats (id, students, courses, instructors, gpa_total, gpa_count)
+            SELECT 1, ?, ?, ?, COALESCE(SUM(gpa), 0.0), COUNT(*) FROM Student WHERE gpa > 0
+        """, (snapshot['students'], snapshot['courses'], snapshot['instructors']))
+
+        cursor.execute("DELETE FROM GradeBucketCounts")
+        cursor.executemany("INSERT INTO GradeBucketCounts (bucket, grade_count) VALUES (?, ?)",
+                           snapshot['distribution'].items())
+
+        cursor.execute("DELETE FROM CourseEnrollmentCounts")
+        cursor.execute("""
+            INSERT INTO CourseEnrollmentCounts (course_id, enrolled)
+            SELECT C.course_id, (SELECT COUNT(*) FROM Grade G WHERE G.course_id = C.course_id)
+            FROM Course C
+        """)
+        self._rebuild_term_stats(cursor, term_points)
+
+    def compute_dashboard_snapshot(self, recompute_terms=False):
+        """
+        Everything the dashboard shows, aggregated from the base tables in one read
+        transaction: a single aggregate statement for the counts, average GPA and
+        grade distribution, plus the per-course enrollment query. The per-term GPA
+        comes from TermGpaStats unless recompute_terms re-aggregates the whole
+        GradeHistory. Returns {'students', 'courses', 'instructors', 'avg_gpa',
+        'distribution', 'enrollment', 'gpa_trend'}.
+        """
+        conn = self.connect()
+        cursor = conn.cursor()
+        # Both statements see the same snapshot of the database
+        own_transaction = not conn.in_transaction
+        if own_transaction:
+            cursor.execute("BEGIN")
+        try:
+            return self._aggregate_dashboard(cursor, self._aggregate_term_points(cursor) if recompute_terms else None)
+        finally:
+            if own_transaction:
+                conn.commit()
+
+    @staticmethod
+    def _aggregate_dashboard(cursor, term_points=None):
+        cursor.execute(f"""
+            SELECT
+                (SELECT COUNT(*) FROM Student),
+                (SELECT COUNT(*) FROM Course),
+                (SELECT COUNT(*) FROM Instructor),
+                (SELECT AVG(gpa) FROM Student WHERE gpa > 0),
+                {GRADE_BUCKETS_SQL}
+            FROM Grade G
+        """)
+        total_students, total_courses, total_instructors, avg_gpa, *buckets = cursor.fetchone()
+
+        # One idx_grade_course range count per course; cheaper than joining and grouping every grade
+        cursor.execute("""
+            SELECT C.name, (SELECT COUNT(*) FROM Grade G WHERE G.course_id = C.course_id)
+            FROM Course C
+            ORDER BY C.course_id
+        """)
+        enrollment = cursor.fetchall()
+
+        if term_points is None:
+            cursor.execute("SELECT term_id, weighted_points, credits FROM TermGpaStats")
+            term_points = cursor.fetchall()
+
+        return {
+            'students': total_students,
+            'courses': total_courses,
+            'instructors': total_instructors,
+            'avg_gpa': round(avg_gpa, 2) if avg_gpa else 0.0,
+            'distribution': dict(zip(GRADE_LETTERS, buckets)),
+            'enrollment': enrollment,
+            'gpa_trend': DatabaseManager._gpa_trend(cursor, term_points),
+        }
\ No newline at end of file
@@ -1,4 +1,3 @@
-import sqlite3
 import os
 import sys
 
@@ -9,12 +8,15 @@ if parent_dir not in sys.path:
     sys.path.append(parent_dir)
 # ----------------
 
-from models.database_manager import DatabaseManager
+from models.database_manager import DatabaseManager, GRADE_UPSERT_SQL, SQL_CHUNK_SIZE
 
 class Grade:
-    def __init__(self, student_id: int, course_id: int, grade_value: float = None, grade: float = None):
+    def __init__(self, student_id: int, course_id: int, grade_value: float = None, grade: float = None,
+                 term_id: int = None):
         self.student_id = student_id
         self.course_id = course_id
+        # None records the grade in the current term (see GRADE_UPSERT_SQL)
+        self.term_id = term_id
         if grade_value is not None:
             self.grade_value = float(grade_value)
         elif grade is not None:
@@ -25,44 +27,59 @@ class Grade:
     # Helper to get DB path
     @staticmethod
     def get_db_path():
-        if getattr(sys, 'frozen', False):
-            base_path = os.path.dirname(sys.executable)
-        else:
-            base_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
-        return os.path.join(base_path, "student_grading.db")
+        return DatabaseManager.default_db_path()
+
+    @staticmethod
+    def connect():
+        # Pooled connection shared with the other models; do not close it
+        return DatabaseManager.get_connection(Grade.get_db_path())
 
     def assign_grade(self):
-        conn = sqlite3.connect(self.get_db_path())
-        cursor = conn.cursor()
+        """ Inserts or updates this grade. Returns the previous grade value, or None if it is new. """
+        db = DatabaseManager() # DatabaseManager handles its own path now
+        conn = self.connect()
+        with conn:
+            cursor = conn.cursor()
+            # The old value and the delta applied from it must not be split by another writer
+            DatabaseManager.begin_immediate(cursor)
 
-        cursor.execute("SELECT * FROM Grade WHERE student_id = ? AND course_id = ?", 
-                       (self.student_id, self.course_id))
-        existing = cursor.fetchone()
+            # Index seek on idx_grade_student_course; the old value feeds the GPA delta
+            cursor.execute("SELECT grade_value FROM Grade WHERE student_id = ? AND course_id = ?", 
+                           (self.student_id, self.course_id))
+            existing = cursor.fetchone()
 
-        if existing:
-            cursor.execute("""
-                UPDATE Grade 
-                SET grade_value = ? 
-                WHERE student_id = ? AND course_id = ?
-            """, (self.grade_value, self.student_id, self.course_id))
-        else:
-            cursor.execute("""
-                INSERT INTO Grade (student_id, course_id, grade_value) 
-                VALUES (?, ?, ?)
-            """, (self.student_id, self.course_id, self.grade_value))
+            cursor.execute(GRADE_UPSERT_SQL, (self.student_id, self.course_id, self.grade_value, self.term_id))
 
-        conn.commit()
-        conn.close()
+            old_value = existing[0] if existing else None
+            if DatabaseManager.incremental_gpa:
+                db.apply_grade_delta(cursor, self.student_id, self.course_id, old_value, self.grade_value)
 
-        try:
-            db = DatabaseManager() # DatabaseManager handles its own path now
-            db.calculate_gpa(self.student_id, self.course_id)
-        except Exception as e:
-            print(f"Warning: GPA Calculation issue: {e}")
+        if not DatabaseManager.incremental_gpa:
+            try:
+                db.calculate_gpa(self.student_id, self.course_id)
+            except Exception as e:
+                print(f"Warning: GPA Calculation issue: {e}")
+        return old_value
+
+    def save_to_db(self):
+        """
+        Assigns this grade and returns the persisted
+        (student_id, student_name, course_id, course_name, grade_value) row.
+        """
+        self.assign_grade()
+        return Grade.get_grade_row(self.student_id, self.course_id)
+
+    @staticmethod
+    def assign_grades_bulk(rows, term_id=None):
+        """
+        Assigns a whole roster of (student_id, course_id, grade_value) rows in one
+        transaction. See DatabaseManager.assign_grades_bulk for the returned report.
+        """
+        return DatabaseManager().assign_grades_bulk(rows, term_id)
 
     @staticmethod
     def get_all_grades_info():
-        conn = sqlite3.connect(Grade.get_db_path())
+        conn = Grade.connect()
         cursor = conn.cursor()
         query = """
             SELECT G.student_id, S.name, G.course_id, C.name, G.grade_value
@@ -71,23 +88,89 @@ class Grade:
             JOIN Course C ON G.course_id = C.course_id
         """
         cursor.execute(query)
-        rows = cursor.fetchall()
-        conn.close()
-        return rows
+        return cursor.fetchall()
 
     @staticmethod
-    def delete_grade(student_id, course_id):
-        conn = sqlite3.connect(Grade.get_db_path())
+    def get_grade_row(student_id, course_id):
+        """ One grade in the shape get_grades_page() returns, or None if it does not exist. """
+        conn = Grade.connect()
         cursor = conn.cursor()
-        cursor.execute("DELETE FROM Grade WHERE student_id = ? AND course_id = ?", (student_id, course_id))
-        conn.commit()
-        conn.close()
-        
-        try:
-            db = DatabaseManager()
-            db.calculate_gpa(student_id, course_id)
-        except:
-            pass
+        cursor.execute("""
+            SELECT G.student_id, S.name, G.course_id, C.name, G.grade_value
+            FROM Grade G
+            JOIN Student S ON G.student_id = S.student_id
+            JOIN Course C ON G.course_id = C.course_id
+            WHERE G.student_id = ? AND G.course_id = ?
+        """, (student_id, course_id))
+        return cursor.fetchone()
+
+    @staticmethod
+    def get_grades_page(after_key=None, limit=200):
+        """
+        Keyset-paginated grades in (student_id, course_id) order, walking the
+        idx_grade_student_course index. after_key is the (student_id, course_id)
+        of the last row already loaded, or None for the first page.
+        """
+        after_student, after_course = after_key or (0, 0)
+        conn = Grade.connect()
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT G.student_id, S.name, G.course_id, C.name, G.grade_value
+            FROM Grade G
+            JOIN Student S ON G.student_id = S.student_id
+            JOIN Course C ON G.course_id = C.course_id
+            WHERE (G.student_id, G.course_id) > (?, ?)
+            ORDER BY G.student_id, G.course_id
+            LIMIT ?
+        """, (after_student, after_course, limit))
+        return cursor.fetchall()
+
+    @staticmethod
+    def search_grades(text, limit=200):
+        """
+        Grades whose student or course name matches text. Students are looked up
+        first, each through the idx_grade_student_course / idx_grade_course index.
+        """
+        cursor = Grade.connect().cursor()
+        query = """
+            SELECT G.student_id, S.name, G.course_id, C.name, G.grade_value
+            FROM Grade G
+            JOIN Student S ON G.student_id = S.student_id
+            JOIN Course C ON G.course_id = C.course_id
+            WHERE G.{column} IN ({ids})
+            ORDER BY G.student_id, G.course_id
+            LIMIT ?
+        """
+        rows = []
+        for index, column in (('StudentSearch', 'student_id'), ('CourseSearch', 'course_id')):
+            ids = DatabaseManager.search_ids(cursor, index, text, SQL_CHUNK_SIZE)
+            if ids and len(rows) < limit:
+                cursor.execute(query.format(column=column, ids=", ".join("?" * len(ids))),
+                               ids + [limit - len(rows)])
+                rows.extend(cursor.fetchall())
+        # A grade can match on both its student and its course
+        return list(dict.fromkeys(rows))
+
+    @staticmethod
+    def delete_grade(student_id, course_id):
+        db = DatabaseManager()
+        conn = Grade.connect()
+        with conn:
+            cursor = conn.cursor()
+            DatabaseManager.begin_immediate(cursor)
+            cursor.execute("SELECT grade_value FROM Grade WHERE student_id = ? AND course_id = ?",
+                           (student_id, course_id))
+            existing = cursor.fetchone()
+            cursor.execute("DELETE FROM Grade WHERE student_id = ? AND course_id = ?", (student_id, course_id))
+
+            if DatabaseManager.incremental_gpa and existing:
+                db.apply_grade_delta(cursor, student_id, course_id, existing[0], None)
+
+        if not DatabaseManager.incremental_gpa:
+            try:
+                db.calculate_gpa(student_id, course_id)
+            except:
+                pass
 
     def calculate_grade_points(self):
         """ Calculates points for GPA (4.0 Scale) """
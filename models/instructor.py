@@ -1,4 +1,3 @@
-import sqlite3
 import os
 import sys
 
@@ -28,11 +27,7 @@ class Instructor(Person):
     # Helper to get DB path correctly
     @staticmethod
     def get_db_path():
-        if getattr(sys, 'frozen', False):
-            base_path = os.path.dirname(sys.executable)
-        else:
-            base_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
-        return os.path.join(base_path, "student_grading.db")
+        return DatabaseManager.default_db_path()
 
     # ---------- Encapsulation ----------
     def get_instructor_id(self):
@@ -42,44 +37,84 @@ class Instructor(Person):
         self.instructor_id = instructor_id
 
     # ---------- Database Integration ----------
+    @staticmethod
+    def connect():
+        # Pooled connection shared with the other models; do not close it
+        return DatabaseManager.get_connection(Instructor.get_db_path())
+
     def save_to_db(self):
-        conn = sqlite3.connect(self.get_db_path())
-        cursor = conn.cursor()
-        
-        if self.instructor_id is not None:
-            # Update Existing Instructor
-            cursor.execute("UPDATE Instructor SET name = ?, email = ? WHERE instructor_id = ?",
-                           (self.name, self.email, self.instructor_id))
-            print(f"Instructor ID {self.instructor_id} updated successfully!")
-        else:
-            # Insert New Instructor
-            cursor.execute("""
-                INSERT INTO Instructor (name, email)
-                VALUES (?, ?)
-            """, (self.name, self.email))
-            
-            self.instructor_id = cursor.lastrowid 
-            print(f"New Instructor added with ID: {self.instructor_id}")
-            
-        conn.commit()
-        conn.close()
+        """ Inserts or updates this instructor and returns the persisted (instructor_id, name, email) row. """
+        conn = self.connect()
+        with conn:
+            cursor = conn.cursor()
+
+            if self.instructor_id is not None:
+                # Update Existing Instructor
+                cursor.execute("UPDATE Instructor SET name = ?, email = ? WHERE instructor_id = ?",
+                               (self.name, self.email, self.instructor_id))
+                print(f"Instructor ID {self.instructor_id} updated successfully!")
+            else:
+                # Insert New Instructor
+                cursor.execute("""
+                    INSERT INTO Instructor (name, email)
+                    VALUES (?, ?)
+                """, (self.name, self.email))
+                
+                self.instructor_id = cursor.lastrowid 
+                print(f"New Instructor added with ID: {self.instructor_id}")
+
+            cursor.execute("SELECT * FROM Instructor WHERE instructor_id = ?", (self.instructor_id,))
+            row = cursor.fetchone()
+        DatabaseManager.lookups.invalidate('Instructor')
+        return row
 
     @staticmethod
     def get_all_instructors():
-        conn = sqlite3.connect(Instructor.get_db_path())
+        conn = Instructor.connect()
         cursor = conn.cursor()
         cursor.execute("SELECT * FROM Instructor")
-        instructors = cursor.fetchall()
-        conn.close()
-        return instructors
+        return cursor.fetchall()
     
     @staticmethod
-    def delete_instructor(instructor_id):
-        conn = sqlite3.connect(Instructor.get_db_path())
+    def get_instructor_choices():
+        """ (instructor_id, name) for every instructor, from the shared lookup cache. """
+        path = Instructor.get_db_path()
+
+        def load():
+            cursor = DatabaseManager.get_connection(path).cursor()
+            cursor.execute("SELECT instructor_id, name FROM Instructor ORDER BY instructor_id")
+            return tuple(cursor.fetchall())
+        return DatabaseManager.lookups.get_or_load((path, 'instructor_choices'), ('Instructor',), load,
+                                                   DatabaseManager(path).get_lookup_versions)
+
+    @staticmethod
+    def get_instructors_page(after_id=0, limit=200):
+        """ Keyset-paginated instructors: the next `limit` rows with an ID above after_id. """
+        conn = Instructor.connect()
         cursor = conn.cursor()
-        cursor.execute("DELETE FROM Instructor WHERE instructor_id = ?", (instructor_id,))
-        conn.commit()
-        conn.close()
+        cursor.execute("""
+            SELECT * FROM Instructor
+            WHERE instructor_id > ?
+            ORDER BY instructor_id
+            LIMIT ?
+        """, (after_id or 0, limit))
+        return cursor.fetchall()
+
+    @staticmethod
+    def search_instructors(text, limit=200):
+        """ Instructors whose name or email matches text, best match first. """
+        cursor = Instructor.connect().cursor()
+        ids = DatabaseManager.search_ids(cursor, 'InstructorSearch', text, limit)
+        return DatabaseManager.fetch_ranked(cursor, "SELECT * FROM Instructor WHERE instructor_id IN ({ids})", ids)
+
+    @staticmethod
+    def delete_instructor(instructor_id):
+        conn = Instructor.connect()
+        with conn:
+            # Their courses stay, unassigned; foreign keys are enforced
+            conn.execute("UPDATE Course SET instructor_id = NULL WHERE instructor_id = ?", (instructor_id,))
+            conn.execute("DELETE FROM Instructor WHERE instructor_id = ?", (instructor_id,))
+        DatabaseManager.lookups.invalidate('Instructor')
         print(f"Instructor with ID {instructor_id} deleted successfully!")
 
     # ---------- Additional Methods ----------
@@ -89,33 +124,14 @@ class Instructor(Person):
         Assign or update a student's grade for a specific course,
         then automatically update the student's GPA.
         """
-        # Note: DatabaseManager handles the path internally now
-        db = DatabaseManager()
-        conn = db.connect()
-        cursor = conn.cursor()
+        # Grade.assign_grade keeps the student's GPA in sync (incrementally or by full recompute)
+        grade = Grade(student_id=student_id, course_id=course_id, grade_value=grade_value)
+        previous_value = grade.assign_grade()
 
-        # Check if grade already exists
-        cursor.execute("""
-            SELECT grade_id FROM Grade WHERE student_id=? AND course_id=?
-        """, (student_id, course_id))
-        existing_grade = cursor.fetchone()
-
-        if existing_grade:
-            cursor.execute("""
-                UPDATE Grade SET grade_value=? WHERE student_id=? AND course_id=?
-            """, (grade_value, student_id, course_id))
+        if previous_value is not None:
             print(f"Updated grade for student {student_id} in course {course_id} to {grade_value}.")
         else:
-            cursor.execute("""
-                INSERT INTO Grade (student_id, course_id, grade_value)
-                VALUES (?, ?, ?)
-            """, (student_id, course_id, grade_value))
             print(f"Assigned grade {grade_value} to student {student_id} in course {course_id}.")
 
-        conn.commit()
-        # Automatically recalculate GPA after updating grade
-        db.calculate_gpa(student_id, course_id)
-        conn.close()
-
     def display_info(self):
         return f"Instructor: {self.name}, Email: {self.email}, ID: {self.instructor_id}"
\ No newline at end of file
@@ -1,7 +1,5 @@
-import sqlite3
-import os
-import sys
 from models.person import Person
+from models.database_manager import DatabaseManager
 
 class Student(Person):
     def __init__(self, name: str, email: str, student_id: int = None, credit_hours: int = 0, gpa: float = 0.0):
@@ -11,12 +9,9 @@ class Student(Person):
         self.gpa = gpa
         self.db_path = self.get_db_path()
 
-    def get_db_path(self):
-        if getattr(sys, 'frozen', False):
-            base_path = os.path.dirname(sys.executable)
-        else:
-            base_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
-        return os.path.join(base_path, "student_grading.db")
+    @staticmethod
+    def get_db_path():
+        return DatabaseManager.default_db_path()
 
     def get_student_id(self):
         return self.student_id
@@ -31,64 +26,99 @@ class Student(Person):
         return self.credit_hours
 
     def save_to_db(self):
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        """
+        Inserts or updates this student. Returns the persisted
+        (student_id, name, email, credit_hours, gpa) row, or None if the email is taken.
+        """
+        # Pooled connection shared with the other models; do not close it
+        conn = DatabaseManager.get_connection(self.db_path)
+        with conn:
+            cursor = conn.cursor()
+
+            if self.student_id:
+                cursor.execute("""
+                    UPDATE Student 
+                    SET name = ?, email = ?
+                    WHERE student_id = ?
+                """, (self.name, self.email, self.student_id))
+                print(f"Student ID {self.student_id} updated.")
+            else:
+                cursor.execute("SELECT student_id FROM Student WHERE email = ?", (self.email,))
+                if cursor.fetchone():
+                    print(f"Student with email '{self.email}' already exists.")
+                    return None
+
+                cursor.execute("""
+                    INSERT INTO Student (name, email, credit_hours, gpa)
+                    VALUES (?, ?, 0, 0.0)
+                """, (self.name, self.email))
+                
+                self.student_id = cursor.lastrowid
+                print(f"New student '{self.name}' saved with ID {self.student_id}.")
 
-        if self.student_id:
-            cursor.execute("""
-                UPDATE Student 
-                SET name = ?, email = ?
-                WHERE student_id = ?
-            """, (self.name, self.email, self.student_id))
-            print(f"Student ID {self.student_id} updated.")
-        else:
-            cursor.execute("SELECT student_id FROM Student WHERE email = ?", (self.email,))
-            if cursor.fetchone():
-                print(f"Student with email '{self.email}' already exists.")
-                conn.close()
-                return
-
-            cursor.execute("""
-                INSERT INTO Student (name, email, credit_hours, gpa)
-                VALUES (?, ?, 0, 0.0)
-            """, (self.name, self.email))
-            
-            self.student_id = cursor.lastrowid
-            print(f"New student '{self.name}' saved with ID {self.student_id}.")
-
-        conn.commit()
-        conn.close()
+            cursor.execute("SELECT student_id, name, email, credit_hours, gpa FROM Student WHERE student_id = ?",
+                           (self.student_id,))
+            row = cursor.fetchone()
+        DatabaseManager.lookups.invalidate('Student')
+        return row
 
     @staticmethod
     def get_all_students():
-        # Helper to get DB path statically
-        if getattr(sys, 'frozen', False):
-            base = os.path.dirname(sys.executable)
-        else:
-            base = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
-        path = os.path.join(base, "student_grading.db")
-
-        conn = sqlite3.connect(path)
+        path = Student.get_db_path()
+
+        conn = DatabaseManager.get_connection(path)
         cursor = conn.cursor()
         cursor.execute("SELECT student_id, name, email, credit_hours, gpa FROM Student")
-        students = cursor.fetchall()
-        conn.close()
-        return students
+        return cursor.fetchall()
 
     @staticmethod
-    def delete_student(student_id: int):
-        # Helper to get DB path statically
-        if getattr(sys, 'frozen', False):
-            base = os.path.dirname(sys.executable)
-        else:
-            base = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
-        path = os.path.join(base, "student_grading.db")
-
-        conn = sqlite3.connect(path)
+    def search_student_choices(text, limit=20):
+        """
+        (student_id, name, email) for the best `limit` students matching text as a
+        prefix (or by ID), for type-ahead pickers. Served from the shared lookup cache.
+        """
+        path = Student.get_db_path()
+
+        def load():
+            cursor = DatabaseManager.get_connection(path).cursor()
+            ids = [int(text)] if text.strip().isdecimal() else []
+            ids += DatabaseManager.search_ids(cursor, 'StudentSearch', text, limit)
+            return tuple(DatabaseManager.fetch_ranked(
+                cursor, "SELECT student_id, name, email FROM Student WHERE student_id IN ({ids})", ids)[:limit])
+        key = (path, 'student_search', text.strip().lower(), limit)
+        return DatabaseManager.lookups.get_or_load(key, ('Student',), load, DatabaseManager(path).get_lookup_versions)
+
+    @staticmethod
+    def get_students_page(after_id=0, limit=200):
+        """ Keyset-paginated students: the next `limit` rows with an ID above after_id. """
+        conn = DatabaseManager.get_connection(Student.get_db_path())
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT student_id, name, email, credit_hours, gpa FROM Student
+            WHERE student_id > ?
+            ORDER BY student_id
+            LIMIT ?
+        """, (after_id or 0, limit))
+        return cursor.fetchall()
+
+    @staticmethod
+    def search_students(text, limit=200):
+        """ Students whose ID is text, then those whose name or email matches it, best match first. """
+        conn = DatabaseManager.get_connection(Student.get_db_path())
         cursor = conn.cursor()
-        cursor.execute("DELETE FROM Student WHERE student_id = ?", (student_id,))
-        conn.commit()
-        conn.close()
+        ids = [int(text)] if text.strip().isdecimal() else []
+        ids += DatabaseManager.search_ids(cursor, 'StudentSearch', text, limit)
+        return DatabaseManager.fetch_ranked(cursor, """
+            SELECT student_id, name, email, credit_hours, gpa FROM Student
+            WHERE student_id IN ({ids})
+        """, ids)[:limit]
+
+    @staticmethod
+    def delete_student(student_id: int):
+        path = Student.get_db_path()
+
+        # Grades and GPA totals go too; foreign keys are enforced
+        DatabaseManager(path).delete_student(student_id)
         print(f"Student ID {student_id} deleted.")
 
     def display_info(self):
@@ -0,0 +1,193 @@
+import os
+import random
+import sys
+import tempfile
+import unittest
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from models.database_manager import DatabaseManager
+from models.course import Course
+from models.grade import Grade
+
+class GradeHistoryTestCase(unittest.TestCase):
+    """ A fresh database with a past term and a current term, used by the models through GRADING_DB_PATH. """
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp.name, "grading.db")
+        self.previous_path = os.environ.get('GRADING_DB_PATH')
+        os.environ['GRADING_DB_PATH'] = self.db_path
+        self.db = DatabaseManager(self.db_path)
+
+        today = date.today()
+        self.past_term = self.db.add_term("Past", (today - timedelta(days=200)).isoformat(),
+                                          (today - timedelta(days=100)).isoformat())
+        self.current_term = self.db.add_term("Current", (today - timedelta(days=30)).isoformat(),
+                                             (today + timedelta(days=60)).isoformat())
+
+    def tearDown(self):
+        if self.previous_path is None:
+            os.environ.pop('GRADING_DB_PATH', None)
+        else:
+            os.environ['GRADING_DB_PATH'] = self.previous_path
+        DatabaseManager.lookups.clear()
+        DatabaseManager.close_all_connections()
+        DatabaseManager._ready_paths.discard(self.db_path)
+        self.tmp.cleanup()
+
+    def add_student(self, name):
+        self.db.add_student(name, f"{name.lower().replace(' ', '.')}@example.com")
+        return self.db.connect().execute("SELECT MAX(student_id) FROM Student").fetchone()[0]
+
+    def add_course(self, name, credit_hours):
+        self.db.add_course(name, credit_hours)
+        return self.db.connect().execute("SELECT MAX(course_id) FROM Course").fetchone()[0]
+
+    def term_stats(self):
+        cursor = self.db.connect().cursor()
+        cursor.execute("""
+            SELECT term_id, weighted_points, credits, grades FROM TermGpaStats
+            WHERE weighted_points != 0 OR credits != 0 OR grades != 0
+        """)
+        return sorted(cursor.fetchall())
+
+class GradeEditTermTest(GradeHistoryTestCase):
+    def test_editing_a_past_grade_keeps_its_term(self):
+        student = self.add_student("Student 1")
+        course_1 = self.add_course("Course 1", 3)
+        course_2 = self.add_course("Course 2", 3)
+        Grade(student, course_1, 95, term_id=self.past_term).assign_grade()
+        Grade(student, course_2, 85, term_id=self.past_term).assign_grade()
+
+        # A correction without a term, as the GUI's edit dialog makes it
+        Grade(student, course_1, 55).assign_grade()
+
+        cursor = self.db.connect().cursor()
+        cursor.execute("SELECT term_id, grade_value FROM Grade WHERE student_id = ? AND course_id = ?",
+                       (student, course_1))
+        self.assertEqual(cursor.fetchone(), (self.past_term, 55.0))
+        self.assertEqual(self.db.get_gpa_history(student), [("Past", 1.5, 1.5, 6)])
+        self.assertEqual(self.term_stats(), [(self.past_term, 9.0, 6, 2)])
+
+    def test_new_grade_without_a_term_goes_into_the_current_term(self):
+        student = self.add_student("Student 1")
+        course = self.add_course("Course 1", 3)
+        Grade(student, course, 95).assign_grade()
+
+        cursor = self.db.connect().cursor()
+        cursor.execute("SELECT term_id FROM Grade WHERE student_id = ?", (student,))
+        self.assertEqual(cursor.fetchone(), (self.current_term,))
+        self.assertEqual(self.term_stats(), [(self.current_term, 12.0, 3, 1)])
+
+class CourseDeleteTermStatsTest(GradeHistoryTestCase):
+    def test_deleting_a_course_withdraws_all_its_terms(self):
+        student_1 = self.add_student("Student 1")
+        student_2 = self.add_student("Student 2")
+        course = self.add_course("Course 1", 3)
+        other_course = self.add_course("Course 2", 4)
+        Grade(student_1, course, 95, term_id=self.past_term).assign_grade()
+        Grade(student_2, course, 75, term_id=self.past_term).assign_grade()
+        Grade(student_2, other_course, 85, term_id=self.past_term).assign_grade()
+        # Retaken in the current term: the past term still counts the grade it ended with
+        Grade(student_1, course, 65, term_id=self.current_term).assign_grade()
+
+        Course.delete_course(course)
+
+        cursor = self.db.connect().cursor()
+        self.assertEqual(self.term_stats(), sorted(row for row in self.db._aggregate_term_points(cursor) if row[3]))
+        self.assertEqual(self.term_stats(), [(self.past_term, 12.0, 4, 1)])
+
+class SummaryTablesInvariantTest(GradeHistoryTestCase):
+    """ The trigger-maintained summary tables must match a full recompute after every write path. """
+    def setUp(self):
+        super().setUp()
+        self.rng = random.Random(2026)
+        self.students = [self.add_student(f"Student {i}") for i in range(1, 7)]
+        self.courses = [self.add_course(f"Course {i}", self.rng.randint(1, 4)) for i in range(1, 5)]
+        self.terms = [None, self.past_term, self.current_term]
+
+    def assert_summaries_consistent(self, step):
+        cursor = self.db.connect().cursor()
+        expected_terms = sorted(row for row in self.db._aggregate_term_points(cursor) if any(row[1:]))
+        self.assertEqual(self.term_stats(), expected_terms, f"TermGpaStats after {step}")
+
+        # Compared before rounding: a running sum and a fresh AVG() can round a x.xx5 average differently
+        cursor.execute("SELECT gpa_total, gpa_count FROM DashboardStats")
+        gpa_total, gpa_count = cursor.fetchone()
+        cursor.execute("SELECT COALESCE(SUM(gpa), 0.0), COUNT(*) FROM Student WHERE gpa > 0")
+        expected_total, expected_count = cursor.fetchone()
+        self.assertEqual(gpa_count, expected_count, f"DashboardStats.gpa_count after {step}")
+        self.assertAlmostEqual(gpa_total, expected_total, places=6, msg=f"DashboardStats.gpa_total after {step}")
+
+        stored = self.db.get_dashboard_snapshot()
+        expected = self.db.compute_dashboard_snapshot(recompute_terms=True)
+        del stored['avg_gpa'], expected['avg_gpa']
+        self.assertEqual(stored, expected, f"dashboard summary tables after {step}")
+
+    def grade_keys(self):
+        return self.db.connect().execute("SELECT student_id, course_id FROM Grade").fetchall()
+
+    def assign_grade(self):
+        term_id = self.rng.choice(self.terms)
+        Grade(self.rng.choice(self.students), self.rng.choice(self.courses), self.rng.randint(40, 100),
+              term_id=term_id).assign_grade()
+
+    def edit_grade(self):
+        keys = self.grade_keys()
+        if keys:
+            student_id, course_id = self.rng.choice(keys)
+            term_sql = "SELECT term_id FROM Grade WHERE student_id = ? AND course_id = ?"
+            term_before = self.db.connect().execute(term_sql, (student_id, course_id)).fetchone()
+            # No term, as the GUI's edit dialog saves it; the grade stays in its term
+            Grade(student_id, course_id, self.rng.randint(40, 100)).assign_grade()
+            self.assertEqual(self.db.connect().execute(term_sql, (student_id, course_id)).fetchone(), term_before)
+
+    def delete_grade(self):
+        keys = self.grade_keys()
+        if keys:
+            Grade.delete_grade(*self.rng.choice(keys))
+
+    def assign_grades_bulk(self):
+        rows = [(self.rng.choice(self.students), self.rng.choice(self.courses), self.rng.randint(40, 100))
+                for _ in range(5)]
+        Grade.assign_grades_bulk(rows, self.rng.choice(self.terms))
+
+    def edit_course_hours(self):
+        course_id = self.rng.choice(self.courses)
+        Course(f"Course {course_id}", self.rng.randint(1, 4), None, course_id=course_id).save_to_db()
+
+    def delete_course(self):
+        if len(self.courses) > 1:
+            course_id = self.courses.pop(self.rng.randrange(len(self.courses)))
+            Course.delete_course(course_id)
+
+    def delete_student(self):
+        if len(self.students) > 1:
+            self.db.delete_student(self.students.pop(self.rng.randrange(len(self.students))))
+
+    def test_each_write_path(self):
+        writes = [self.assign_grade, self.edit_grade, self.delete_grade, self.assign_grades_bulk,
+                  self.edit_course_hours, self.delete_course, self.delete_student]
+        for _ in range(10):
+            self.assign_grade()
+        for write in writes:
+            for _ in range(3):
+                write()
+                self.assert_summaries_consistent(write.__name__)
+                self.assign_grade()
+
+    def test_random_write_sequence(self):
+        writes = [self.assign_grade] * 4 + [self.edit_grade] * 3 + [self.delete_grade, self.assign_grades_bulk,
+                                                                     self.edit_course_hours]
+        for step in range(150):
+            write = self.rng.choice(writes)
+            if step in (60, 110):
+                write = self.delete_course
+            elif step in (40, 90):
+                write = self.delete_student
+            write()
+            self.assert_summaries_consistent(f"step {step} ({write.__name__})")
+
+if __name__ == "__main__":
+    unittest.main()
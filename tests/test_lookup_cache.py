@@ -0,0 +1,55 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from models.database_manager import DatabaseManager
+from models.grade import Grade
+from models.student import Student
+
+class LookupVersionsTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp.name, "grading.db")
+        self.previous_path = os.environ.get('GRADING_DB_PATH')
+        os.environ['GRADING_DB_PATH'] = self.db_path
+        self.db = DatabaseManager(self.db_path)
+        self.db.add_student("Ada Lovelace", "ada@example.com")
+        self.db.add_course("Analysis", 3)
+        DatabaseManager.lookups.clear()
+
+    def tearDown(self):
+        if self.previous_path is None:
+            os.environ.pop('GRADING_DB_PATH', None)
+        else:
+            os.environ['GRADING_DB_PATH'] = self.previous_path
+        DatabaseManager.lookups.clear()
+        DatabaseManager.close_all_connections()
+        DatabaseManager._ready_paths.discard(self.db_path)
+        self.tmp.cleanup()
+
+    def hits(self):
+        return DatabaseManager.get_lookup_cache_stats()['hits']
+
+    def test_grade_writes_keep_student_lookups_cached(self):
+        Student.search_student_choices("ada")
+        # Recomputes the student's GPA and credit hours through an UPDATE of Student
+        Grade(1, 1, 95).assign_grade()
+
+        hits = self.hits()
+        self.assertEqual(Student.search_student_choices("ada"), ((1, "Ada Lovelace", "ada@example.com"),))
+        self.assertEqual(self.hits(), hits + 1)
+
+    def test_renames_from_another_connection_reach_the_cache(self):
+        Student.search_student_choices("ada")
+        # Bypasses the model's invalidate(), like another app instance would
+        conn = DatabaseManager.pool.get_connection(self.db_path)
+        with conn:
+            conn.execute("UPDATE Student SET name = 'Ada King' WHERE student_id = 1")
+
+        self.assertEqual(Student.search_student_choices("ada"), ((1, "Ada King", "ada@example.com"),))
+
+if __name__ == "__main__":
+    unittest.main()
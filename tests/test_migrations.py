@@ -0,0 +1,70 @@
+import os
+import sqlite3
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from models.database_manager import DatabaseManager
+
+# The schema database_setup.py created before DatabaseManager tracked a user_version
+BASELINE_SCHEMA = """
+    CREATE TABLE Student (
+        student_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        email TEXT UNIQUE NOT NULL,
+        credit_hours INTEGER DEFAULT 0,
+        gpa REAL DEFAULT 0.0
+    );
+    CREATE TABLE Instructor (
+        instructor_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        email TEXT UNIQUE NOT NULL,
+        department TEXT
+    );
+    CREATE TABLE Course (
+        course_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        credit_hours INTEGER NOT NULL,
+        instructor_id INTEGER,
+        FOREIGN KEY (instructor_id) REFERENCES Instructor(instructor_id)
+    );
+    CREATE TABLE Grade (
+        grade_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        student_id INTEGER,
+        course_id INTEGER,
+        grade_value REAL,
+        FOREIGN KEY (student_id) REFERENCES Student(student_id),
+        FOREIGN KEY (course_id) REFERENCES Course(course_id)
+    );
+"""
+
+class BaselineMigrationTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp.name, "baseline.db")
+        conn = sqlite3.connect(self.db_path)
+        conn.executescript(BASELINE_SCHEMA)
+        conn.execute("INSERT INTO Student (name, email) VALUES ('Student 1', 's1@example.com')")
+        conn.execute("INSERT INTO Course (name, credit_hours) VALUES ('Course 1', 3)")
+        conn.execute("INSERT INTO Grade (student_id, course_id, grade_value) VALUES (1, 1, 95)")
+        conn.commit()
+        conn.close()
+
+    def tearDown(self):
+        DatabaseManager.close_all_connections()
+        DatabaseManager._ready_paths.discard(self.db_path)
+        self.tmp.cleanup()
+
+    def test_duplicate_free_baseline_seeds_gpa_totals(self):
+        db = DatabaseManager(self.db_path)
+
+        self.assertEqual(db.check_gpa_consistency(), [])
+        cursor = db.connect().cursor()
+        cursor.execute("SELECT weighted_points, credits FROM StudentGpaTotals WHERE student_id = 1")
+        self.assertEqual(cursor.fetchone(), (12.0, 3))
+        self.assertEqual(db.get_student_by_id(1)[4], 4.0)
+
+if __name__ == "__main__":
+    unittest.main()
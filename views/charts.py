@@ -0,0 +1,60 @@
+# Imported on first use by MainApp.setup_dashboard_charts(): matplotlib is the
+# slowest import in the app, so the window is shown before it loads
+import math
+
+from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.figure import Figure
+
+class MplCanvas(FigureCanvas):
+    def __init__(self, parent=None, width=5, height=4, dpi=100):
+        fig = Figure(figsize=(width, height), dpi=dpi)
+        self.axes = fig.add_subplot(111)
+        fig.patch.set_facecolor('#ffffff')
+        super(MplCanvas, self).__init__(fig)
+
+def set_bar_heights(axes, bars, values):
+    """ Moves existing bars to new heights and rescales the y axis the way bar() would. """
+    for bar, value in zip(bars, values):
+        bar.set_height(value)
+    axes.set_ylim(0, max(values, default=0) * 1.05 or 1)
+
+def update_pie(pie, sizes, labels):
+    """
+    Re-angles the wedges and moves the labels of a pie drawn with
+    axes.pie(..., autopct='%1.1f%%'). pie is its (wedges, texts, autotexts)
+    result. Returns False, changing nothing, when the slice count differs or
+    the sizes sum to zero; the caller redraws the pie from scratch then.
+    """
+    wedges, texts, autotexts = pie
+    total = sum(sizes)
+    if len(sizes) != len(wedges) or not total:
+        return False
+    theta1 = 0.0
+    for wedge, text, autotext, size, label in zip(wedges, texts, autotexts, sizes, labels):
+        frac = size / total
+        theta2 = theta1 + frac
+        # Same placement as Axes.pie(): labels at 1.1 radii, percentages at 0.6
+        angle = math.pi * (theta1 + theta2)
+        center_x, center_y = wedge.center
+        wedge.set_theta1(360 * theta1)
+        wedge.set_theta2(360 * theta2)
+        label_x = center_x + 1.1 * wedge.r * math.cos(angle)
+        text.set_position((label_x, center_y + 1.1 * wedge.r * math.sin(angle)))
+        text.set_horizontalalignment('left' if label_x > 0 else 'right')
+        text.set_text(label)
+        autotext.set_position((center_x + 0.6 * wedge.r * math.cos(angle), center_y + 0.6 * wedge.r * math.sin(angle)))
+        autotext.set_text(f"{100 * frac:.1f}%")
+        theta1 = theta2
+    return True
+
+# Term names labelled on the trend chart's x axis; the others are skipped
+MAX_TREND_TICKS = 8
+
+def set_trend(axes, line, labels, values):
+    """ Moves an existing line to one point per term, with GPA on a fixed 0-4 scale. """
+    positions = list(range(len(values)))
+    line.set_data(positions, values)
+    step = max(1, math.ceil(len(labels) / MAX_TREND_TICKS))
+    axes.set_xticks(positions[::step], labels[::step])
+    axes.set_xlim(-0.5, max(len(values) - 0.5, 0.5))
+    axes.set_ylim(0, 4)
@@ -1,24 +1,26 @@
 import sys
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                              QHBoxLayout, QPushButton, QLabel, QStackedWidget, QFrame, 
-                             QGraphicsDropShadowEffect, QLineEdit, QTableWidget, 
-                             QTableWidgetItem, QHeaderView, QAbstractItemView,
-                             QDialog, QDialogButtonBox, QMessageBox, QComboBox, QSpinBox, QDoubleSpinBox)
-from PyQt5.QtCore import Qt, QSize
+                             QGraphicsDropShadowEffect, QLineEdit, QTableView,
+                             QHeaderView, QAbstractItemView,
+                             QDialog, QDialogButtonBox, QMessageBox, QComboBox, QSpinBox, QDoubleSpinBox,
+                             QFileDialog, QProgressDialog, QProgressBar)
+from PyQt5.QtCore import Qt, QSize, QTimer, pyqtSignal
 from PyQt5.QtGui import QColor
 import qtawesome as qta 
 
-# --- Matplotlib Imports ---
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-import matplotlib.pyplot as plt
-
 # --- Backend Imports (Your Models) ---
 from models.student import Student
 from models.instructor import Instructor
 from models.course import Course
 from models.grade import Grade
 from models.database_manager import DatabaseManager
+from views.workers import CsvImportWorker, DataAccess
+from views.table_models import PagedTableModel, RowTableModel
+from views.pickers import RecordPicker
+
+# Pause in typing (ms) before a search box runs its query
+SEARCH_DEBOUNCE_MS = 250
 
 # =======================================================
 # 1. Custom Card Helpers (UI Elements)
@@ -103,13 +105,6 @@ class ChartCard(QFrame):
         self.shadow.setColor(QColor(192, 192, 255, 0))
         super().leaveEvent(event)
 
-class MplCanvas(FigureCanvas):
-    def __init__(self, parent=None, width=5, height=4, dpi=100):
-        fig = Figure(figsize=(width, height), dpi=dpi)
-        self.axes = fig.add_subplot(111)
-        fig.patch.set_facecolor('#ffffff')
-        super(MplCanvas, self).__init__(fig)
-
 # =======================================================
 # 4. Dialogs (Reusable Popups)
 # =======================================================
@@ -343,14 +338,14 @@ class AddCourseDialog(QDialog):
         self.hours_input.setSuffix(" Hours")
         
         self.instructor_combo = QComboBox()
-        self.load_instructors() 
+        self.instructor_combo.setEnabled(False)
+        self.instructor_combo.addItem("Loading instructors...")
+        self.current_instructor = None
 
         if self.is_edit_mode:
             self.name_input.setText(course_data['name'])
             self.hours_input.setValue(int(course_data['hours']))
-            index = self.instructor_combo.findText(course_data['instructor_name'])
-            if index >= 0:
-                self.instructor_combo.setCurrentIndex(index)
+            self.current_instructor = course_data['instructor_name']
 
         layout.addWidget(QLabel("Course Name:"))
         layout.addWidget(self.name_input)
@@ -369,6 +364,8 @@ class AddCourseDialog(QDialog):
             QPushButton:hover { background-color: #a0a0ff; }
         """)
         self.save_button.clicked.connect(self.accept)
+        # Enabled once the instructor choices have loaded; until then get_data() has no instructor
+        self.save_button.setEnabled(False)
 
         self.cancel_button = QPushButton("Cancel")
         self.cancel_button.setCursor(Qt.PointingHandCursor)
@@ -385,13 +382,41 @@ class AddCourseDialog(QDialog):
         layout.addLayout(buttons_layout)
         self.setLayout(layout)
 
+        # Choices load in the background on the main window's DataAccess, if there is one
+        self.data_access = getattr(parent, 'data_access', None)
+        self.channel = f"instructor-choices-{id(self)}"
+        self.load_instructors()
+
     def load_instructors(self):
+        if self.data_access is None:
+            self.show_instructors(Instructor.get_instructor_choices())
+        else:
+            self.data_access.submit(Instructor.get_instructor_choices, channel=self.channel,
+                                    on_result=self.show_instructors,
+                                    on_error=self.show_instructors_error)
+
+    def show_instructors(self, instructors):
+        self.instructor_combo.clear()
+        self.instructor_map = {i_name: i_id for i_id, i_name in instructors}
+        self.instructor_combo.addItems([i_name for _, i_name in instructors])
+        self.instructor_combo.setEnabled(True)
+        if self.current_instructor:
+            index = self.instructor_combo.findText(self.current_instructor)
+            if index >= 0:
+                self.instructor_combo.setCurrentIndex(index)
+        self.save_button.setEnabled(True)
+
+    def show_instructors_error(self, error):
+        # Saving without the choices would drop or unassign the instructor, so Save stays disabled
         self.instructor_combo.clear()
-        instructors = Instructor.get_all_instructors()
-        for inst in instructors:
-            i_id, i_name = inst[0], inst[1]
-            self.instructor_map[i_name] = i_id
-            self.instructor_combo.addItem(i_name)
+        self.instructor_combo.addItem("Could not load instructors")
+        self.instructor_combo.setToolTip(str(error))
+
+    def hideEvent(self, event):
+        # Choices arriving after the dialog closed have nowhere to go
+        if self.data_access is not None:
+            self.data_access.cancel(self.channel)
+        super().hideEvent(event)
 
     def get_data(self):
         name = self.name_input.text()
@@ -404,8 +429,6 @@ class AddGradeDialog(QDialog):
     def __init__(self, parent=None, grade_data=None):
         super().__init__(parent)
         self.is_edit_mode = bool(grade_data)
-        self.student_map = {}
-        self.course_map = {}
 
         if self.is_edit_mode:
             self.setWindowTitle("Edit Grade")
@@ -440,24 +463,26 @@ class AddGradeDialog(QDialog):
         title_lbl.setStyleSheet("font-size: 20px; color: rgb(192, 192, 255); margin-bottom: 10px; font-weight: bold;")
         layout.addWidget(title_lbl)
 
-        self.student_combo = QComboBox()
-        self.course_combo = QComboBox()
+        # Pickers search in the background on the main window's DataAccess, if there is one
+        data_access = getattr(parent, 'data_access', None)
+        self.student_picker = RecordPicker(self.student_matches, data_access)
+        self.student_picker.setPlaceholderText("Type a student name, email or ID...")
+        self.course_picker = RecordPicker(self.course_matches, data_access)
+        self.course_picker.setPlaceholderText("Type a course name or ID...")
         self.grade_input = QDoubleSpinBox()
         self.grade_input.setRange(0.0, 100.0)
-        
-        self.load_data() 
 
         if self.is_edit_mode:
-            self.student_combo.setCurrentText(grade_data['student_name'])
-            self.student_combo.setEnabled(False) 
-            self.course_combo.setCurrentText(grade_data['course_name'])
-            self.course_combo.setEnabled(False)
+            self.student_picker.set_record(grade_data['student_id'], grade_data['student_name'])
+            self.student_picker.setEnabled(False) 
+            self.course_picker.set_record(grade_data['course_id'], grade_data['course_name'])
+            self.course_picker.setEnabled(False)
             self.grade_input.setValue(float(grade_data['grade']))
 
         layout.addWidget(QLabel("Select Student:"))
-        layout.addWidget(self.student_combo)
+        layout.addWidget(self.student_picker)
         layout.addWidget(QLabel("Select Course:"))
-        layout.addWidget(self.course_combo)
+        layout.addWidget(self.course_picker)
         layout.addWidget(QLabel("Grade (0-100):"))
         layout.addWidget(self.grade_input)
 
@@ -487,40 +512,62 @@ class AddGradeDialog(QDialog):
         layout.addLayout(buttons_layout)
         self.setLayout(layout)
 
-    def load_data(self):
-        self.student_combo.clear()
-        students = Student.get_all_students()
-        for s in students:
-            s_id, s_name = s[0], s[1]
-            self.student_map[s_name] = s_id
-            self.student_combo.addItem(s_name)
-
-        self.course_combo.clear()
-        courses = Course.get_all_courses()
-        for c in courses:
-            c_id, c_name = c[0], c[1]
-            self.course_map[c_name] = c_id
-            self.course_combo.addItem(c_name)
+    # Labels include the email / ID so students and courses that share a name stay distinct
+    @staticmethod
+    def student_matches(text, limit):
+        return [(s_id, f"{s_name} ({email})") for s_id, s_name, email in Student.search_student_choices(text, limit)]
+
+    @staticmethod
+    def course_matches(text, limit):
+        return [(c_id, f"{c_name} (#{c_id})") for c_id, c_name in Course.search_course_choices(text, limit)]
+
+    def accept(self):
+        if self.student_picker.record_id() is None or self.course_picker.record_id() is None:
+            QMessageBox.warning(self, "Missing Data", "Please pick a student and a course from the suggestions.")
+            return
+        super().accept()
 
     def get_data(self):
-        s_name = self.student_combo.currentText()
-        c_name = self.course_combo.currentText()
         grade = self.grade_input.value()
-        
-        s_id = self.student_map.get(s_name)
-        c_id = self.course_map.get(c_name)
-        return s_id, c_id, grade
+        return self.student_picker.record_id(), self.course_picker.record_id(), grade
 
 
 # =======================================================
 # 5. Main Application Class
 # =======================================================
 class MainApp(QMainWindow):
-    def __init__(self):
+    # Emitted each time the dashboard charts finish drawing a snapshot
+    dashboard_ready = pyqtSignal()
+
+    def __init__(self, profiler=None):
         super().__init__()
         self.setWindowTitle("Student Grading System")
         self.setGeometry(100, 100, 1200, 800)
         self.db_manager = DatabaseManager()
+        self.import_worker = None
+
+        # Every database call from the window runs through here, off the GUI thread
+        self.data_access = DataAccess(self)
+        self.busy_indicators = {}
+        self.data_access.busy_changed.connect(self.on_busy_changed)
+
+        # Data versions each page was last loaded at; switching back to an unchanged page is a hit
+        self.page_versions = {}
+        self.page_refresh_stats = {'hits': 0, 'misses': 0}
+
+        # Only the dashboard is built at startup; the other pages are built when first opened
+        self.built_pages = {0}
+        # Chart canvases are created after the first paint, when matplotlib is imported
+        self.dashboard_charts_requested = False
+        self.canvas_grades = None
+        self.canvas_courses = None
+        self.canvas_trend = None
+        self.dashboard_snapshot = None
+        # Chart data last drawn, so an unchanged snapshot is not drawn again
+        self.drawn_chart_data = None
+        # The hovered bar is blitted over the grades chart as it was last drawn in full
+        self.hovered_bar = None
+        self.bars_background = None
 
         # Global Stylesheet
         self.setStyleSheet("""
@@ -551,11 +598,14 @@ class MainApp(QMainWindow):
             QPushButton#add_btn { background-color: rgb(192, 192, 255); color: #2b2b2b; border: none; }
             QPushButton#add_btn:hover { background-color: #a0a0ff; }
 
-            QTableWidget { background-color: white; border-radius: 10px; border: 1px solid #e0e0e0; gridline-color: #f0f0f0; font-size: 14px; }
+            QTableView { background-color: white; border-radius: 10px; border: 1px solid #e0e0e0; gridline-color: #f0f0f0; font-size: 14px; }
             QHeaderView::section { background-color: rgb(192, 192, 255); color: #2b2b2b; padding: 10px; font-weight: bold; border: none; }
-            QTableWidget::item:selected { background-color: #e6e6ff; color: black; }
+            QTableView::item:selected { background-color: #e6e6ff; color: black; }
         """)
 
+        # Attached before init_ui() so the first dashboard load is traced too
+        if profiler is not None:
+            profiler.attach(self)
         self.init_ui()
 
     def init_ui(self):
@@ -584,6 +634,7 @@ class MainApp(QMainWindow):
         self.btn_instructors = self.create_nav_btn("Instructors", "fa5s.chalkboard-teacher")
         self.btn_courses = self.create_nav_btn("Courses", "fa5s.book")
         self.btn_grades = self.create_nav_btn("Grades", "fa5s.clipboard-list")
+        self.btn_diagnostics = self.create_nav_btn("Diagnostics", "fa5s.stethoscope")
         
         self.btn_dashboard.setChecked(True)
         
@@ -593,6 +644,7 @@ class MainApp(QMainWindow):
         sidebar_layout.addWidget(self.btn_courses)
         sidebar_layout.addWidget(self.btn_grades)
         sidebar_layout.addStretch()
+        sidebar_layout.addWidget(self.btn_diagnostics)
 
         # --- Content Area Setup ---
         right_container = QWidget()
@@ -613,27 +665,25 @@ class MainApp(QMainWindow):
 
         self.content_area = QStackedWidget()
         
-        # Pages Setup
+        # Pages Setup (empty until ensure_page() builds them)
         self.dashboard_page = QWidget()
         self.setup_dashboard_ui() 
         self.content_area.addWidget(self.dashboard_page)
 
         self.students_page = QWidget()
-        self.setup_students_ui()
         self.content_area.addWidget(self.students_page)
 
         self.instructors_page = QWidget()
-        self.setup_instructors_ui()
         self.content_area.addWidget(self.instructors_page)
 
         self.courses_page = QWidget()
-        self.setup_courses_ui()
         self.content_area.addWidget(self.courses_page)
 
         self.grades_page = QWidget()
-        self.setup_grades_ui()
         self.content_area.addWidget(self.grades_page)
 
+        self.diagnostics_page = QWidget()
+        self.content_area.addWidget(self.diagnostics_page)
 
         right_layout.addWidget(self.header)
         right_layout.addWidget(self.content_area)
@@ -646,26 +696,66 @@ class MainApp(QMainWindow):
         self.btn_instructors.clicked.connect(lambda: self.switch_page(2, "Instructors Management"))
         self.btn_courses.clicked.connect(lambda: self.switch_page(3, "Courses Management"))
         self.btn_grades.clicked.connect(lambda: self.switch_page(4, "Grades & GPA"))
+        self.btn_diagnostics.clicked.connect(lambda: self.switch_page(5, "Diagnostics"))
+
+    PAGE_CHANNELS = ['dashboard', 'students', 'instructors', 'courses', 'grades', 'diagnostics']
+
+    # Tables whose contents each page shows
+    PAGE_TABLES = {
+        'dashboard': ('Student', 'Course', 'Instructor', 'Grade', 'Term'),
+        'students': ('Student',),
+        'instructors': ('Instructor',),
+        'courses': ('Course', 'Instructor'),
+        'grades': ('Grade', 'Student', 'Course'),
+        'diagnostics': (),
+    }
 
     def switch_page(self, index, title_text):
+        channel = self.PAGE_CHANNELS[index]
+        # The staleness check has its own channel, so fetching more rows on scroll cannot cancel it
+        versions_channel = f"{channel}-versions"
+        # Loads still running for the page being left are no longer wanted; a page
+        # whose load was cut short has no recorded versions, so it loads again next time
+        self.data_access.cancel_all(keep=(channel, versions_channel))
+        self.ensure_page(index)
         self.content_area.setCurrentIndex(index)
         self.header_title.setText(title_text)
-        if index == 0:
-            self.refresh_dashboard()
-        if index == 1:
-            self.load_students_table()
-        if index == 2:
-            self.load_instructors_table()
-        if index == 3:
-            self.load_courses_table()
-        if index == 4:
-            self.load_grades_table()
+        if index == 5:
+            # In-memory counters rather than tables, so always re-read
+            self.refresh_diagnostics()
+            return
+        loading = self.data_access.is_busy(channel) and channel not in self.page_versions
+        if loading or self.data_access.is_busy(versions_channel):
+            # Already (re)loading, or already checking whether it must; fetching more rows does not count
+            return
+        self.data_access.submit(self.db_manager.get_data_versions, self.PAGE_TABLES[channel], channel=versions_channel,
+                                on_result=lambda versions: self.on_page_versions(index, versions),
+                                on_error=lambda error: self.on_page_versions(index, None))
+
+    def ensure_page(self, index):
+        """ Builds a management page the first time it is opened. """
+        if index in self.built_pages:
+            return
+        self.built_pages.add(index)
+        [None, self.setup_students_ui, self.setup_instructors_ui,
+         self.setup_courses_ui, self.setup_grades_ui, self.setup_diagnostics_ui][index]()
+
+    def on_page_versions(self, index, versions):
+        """ Reloads the page unless none of its tables was written since it last loaded (None: unknown). """
+        channel = self.PAGE_CHANNELS[index]
+        if versions is not None and self.page_versions.get(channel) == versions:
+            self.page_refresh_stats['hits'] += 1
+            return
+        self.page_refresh_stats['misses'] += 1
+        [self.refresh_dashboard, self.load_students_table, self.load_instructors_table,
+         self.load_courses_table, self.load_grades_table][index]()
 
     # --- DASHBOARD LOGIC ---
     def setup_dashboard_ui(self):
         layout = QVBoxLayout()
         layout.setContentsMargins(20, 20, 20, 20)
         layout.setSpacing(20)
+        layout.addWidget(self.create_busy_indicator('dashboard'))
         cards_layout = QHBoxLayout()
         cards_layout.setSpacing(20)
         
@@ -680,62 +770,126 @@ class MainApp(QMainWindow):
         cards_layout.addWidget(self.card_gpa)
         
         layout.addLayout(cards_layout)
-        charts_layout = QHBoxLayout()
-        charts_layout.setSpacing(20)
+        # Filled in by setup_dashboard_charts()
+        self.charts_layout = QHBoxLayout()
+        self.charts_layout.setSpacing(20)
+        layout.addLayout(self.charts_layout, 1)
+        self.dashboard_page.setLayout(layout)
+        
+        self.refresh_dashboard()
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not self.dashboard_charts_requested:
+            self.dashboard_charts_requested = True
+            # Queued, so the first frame reaches the screen before matplotlib is imported
+            QTimer.singleShot(0, self.setup_dashboard_charts)
+
+    def setup_dashboard_charts(self):
+        if self.canvas_grades is not None:
+            return
+        from views.charts import MplCanvas
+
         self.canvas_grades = MplCanvas(self, width=5, height=4, dpi=100)
         self.bars = self.canvas_grades.axes.bar(['A', 'B', 'C', 'D', 'F'], [0, 0, 0, 0, 0], color='#c0c0ff')
         self.canvas_grades.axes.set_facecolor('#ffffff')
         self.canvas_grades.mpl_connect("motion_notify_event", self.on_bar_hover)
+        self.canvas_grades.mpl_connect("figure_leave_event", self.on_bar_hover)
+        self.canvas_grades.mpl_connect("draw_event", self.on_grades_chart_drawn)
         grades_card = ChartCard(self.canvas_grades, "Grades Distribution")
         self.canvas_courses = MplCanvas(self, width=5, height=4, dpi=100)
-        self.canvas_courses.axes.pie([1], labels=['No Data'], autopct='%1.1f%%', colors=['#e0e0e0'])
+        self.pie = tuple(self.canvas_courses.axes.pie([1], labels=['No Data'], autopct='%1.1f%%', colors=['#e0e0e0']))
         courses_card = ChartCard(self.canvas_courses, "Enrollment Share")
-        charts_layout.addWidget(grades_card)
-        charts_layout.addWidget(courses_card)
-        layout.addLayout(charts_layout)
-        self.dashboard_page.setLayout(layout)
-        
-        self.refresh_dashboard()
+        self.canvas_trend = MplCanvas(self, width=5, height=4, dpi=100)
+        self.trend_line, = self.canvas_trend.axes.plot([], [], marker='o', color='#8080ff')
+        self.canvas_trend.axes.tick_params(axis='x', labelrotation=30, labelsize=8)
+        # Room below the axes for the rotated term names
+        self.canvas_trend.figure.subplots_adjust(bottom=0.2)
+        trend_card = ChartCard(self.canvas_trend, "GPA by Term")
+        self.charts_layout.addWidget(grades_card)
+        self.charts_layout.addWidget(courses_card)
+        self.charts_layout.addWidget(trend_card)
+
+        if self.dashboard_snapshot is not None:
+            self.draw_dashboard_charts(self.dashboard_snapshot)
 
     def refresh_dashboard(self):
+        # Runs on a worker thread: database only, no widgets
+        self.submit_page_load('dashboard', self.db_manager.get_dashboard_snapshot,
+                              on_result=self.populate_dashboard,
+                              on_error=self.on_dashboard_load_error)
+
+    def on_dashboard_load_error(self, error):
+        print(f"Dashboard Refresh Error: {error}")
+
+    def populate_dashboard(self, snapshot):
+        self.dashboard_snapshot = snapshot
+        self.card_student.set_value(snapshot['students'])
+        self.card_course.set_value(snapshot['courses'])
+        self.card_instructor.set_value(snapshot['instructors'])
+        self.card_gpa.set_value(snapshot['avg_gpa'])
+        # Before the charts exist, setup_dashboard_charts() draws the snapshot kept above
+        if self.canvas_grades is not None:
+            self.draw_dashboard_charts(snapshot)
+
+    def draw_dashboard_charts(self, snapshot):
+        from views.charts import set_bar_heights, set_trend, update_pie
         try:
-            total_s, total_c, total_i, avg_g = self.db_manager.get_general_stats()
-            self.card_student.set_value(total_s)
-            self.card_course.set_value(total_c)
-            self.card_instructor.set_value(total_i)
-            self.card_gpa.set_value(avg_g)
-
-            # Update Grades Chart
-            dist = self.db_manager.get_grade_distribution()
-            self.canvas_grades.axes.clear()
-            labels = list(dist.keys())
-            values = list(dist.values())
-            self.bars = self.canvas_grades.axes.bar(labels, values, color='#c0c0ff')
-            self.canvas_grades.axes.set_title("")
+            dist = snapshot['distribution']
+            enroll_data = snapshot['enrollment']
+            trend = snapshot['gpa_trend']
+            if (dist, enroll_data, trend) == self.drawn_chart_data:
+                self.dashboard_ready.emit()
+                return
+
+            # Update Grades Chart: the five letter bars are kept and resized
+            set_bar_heights(self.canvas_grades.axes, self.bars, list(dist.values()))
             self.canvas_grades.draw()
 
-            # Update Enrollment Chart
-            enroll_data = self.db_manager.get_course_enrollment_stats()
-            self.canvas_courses.axes.clear()
-            if enroll_data:
-                labels = [x[0] for x in enroll_data]
-                sizes = [x[1] for x in enroll_data]
-                self.canvas_courses.axes.pie(sizes, labels=labels, autopct='%1.1f%%', colors=['#c0c0ff', '#8080ff', '#e0e0e0', '#a0a0ff'])
-            else:
-                self.canvas_courses.axes.pie([1], labels=['No Data'], autopct='%1.1f%%', colors=['#e0e0e0'])
+            # Update Enrollment Chart: wedges are re-angled in place unless the pie showed 'No Data'
+            # or the number of courses changed
+            labels = [x[0] for x in enroll_data]
+            sizes = [x[1] for x in enroll_data]
+            previous = self.drawn_chart_data
+            if not (previous and previous[1] and update_pie(self.pie, sizes, labels)):
+                self.canvas_courses.axes.clear()
+                if enroll_data:
+                    pie = self.canvas_courses.axes.pie(sizes, labels=labels, autopct='%1.1f%%', colors=['#c0c0ff', '#8080ff', '#e0e0e0', '#a0a0ff'])
+                else:
+                    pie = self.canvas_courses.axes.pie([1], labels=['No Data'], autopct='%1.1f%%', colors=['#e0e0e0'])
+                self.pie = tuple(pie)
             self.canvas_courses.draw()
 
+            # Update Trend Chart: GPA per term from the pre-aggregated TermGpaStats table
+            set_trend(self.canvas_trend.axes, self.trend_line, [x[0] for x in trend], [x[1] for x in trend])
+            self.canvas_trend.draw()
+            self.drawn_chart_data = (dist, enroll_data, trend)
+
         except Exception as e:
             print(f"Dashboard Refresh Error: {e}")
+        self.dashboard_ready.emit()
+
+    def on_grades_chart_drawn(self, event):
+        # A full draw paints every bar unhighlighted; keep that as the blitting background
+        self.bars_background = self.canvas_grades.copy_from_bbox(self.canvas_grades.axes.bbox)
+        self.hovered_bar = None
 
     def on_bar_hover(self, event):
-        if event.inaxes == self.canvas_grades.axes:
-            for bar in self.bars:
-                if bar.contains(event)[0]:
-                    bar.set_color('#8080ff')
-                else:
-                    bar.set_color('#c0c0ff')
-            self.canvas_grades.draw_idle()
+        hovered = None
+        if event.name == "motion_notify_event" and event.inaxes == self.canvas_grades.axes:
+            hovered = next((bar for bar in self.bars if bar.contains(event)[0]), None)
+        if hovered is self.hovered_bar or self.bars_background is None:
+            return
+        self.hovered_bar = hovered
+
+        canvas = self.canvas_grades
+        canvas.restore_region(self.bars_background)
+        if hovered is not None:
+            # Only the highlighted bar is drawn; its color is put back so full draws stay unhighlighted
+            hovered.set_color('#8080ff')
+            canvas.axes.draw_artist(hovered)
+            hovered.set_color('#c0c0ff')
+        canvas.blit(canvas.axes.bbox)
 
     # ---------------------------
     # STUDENTS LOGIC (Page 1)
@@ -747,9 +901,9 @@ class MainApp(QMainWindow):
 
         top_bar = QHBoxLayout()
         self.student_search = QLineEdit()
-        self.student_search.setPlaceholderText("Search by ID or Name...")
+        self.student_search.setPlaceholderText("Search by ID, Name or Email...")
         self.student_search.setFixedWidth(300)
-        self.student_search.textChanged.connect(self.filter_students)
+        self.create_search_timer(self.student_search, self.load_students_table)
         
         self.btn_add_student = QPushButton(" + Add Student")
         self.btn_add_student.setObjectName("add_btn") 
@@ -766,16 +920,26 @@ class MainApp(QMainWindow):
         self.btn_delete_student.setProperty("class", "action_btn")
         self.btn_delete_student.clicked.connect(self.delete_selected_student)
 
+        self.btn_import_students = QPushButton(" Import")
+        self.btn_import_students.setIcon(qta.icon("fa5s.file-import", color="#2b2b2b"))
+        self.btn_import_students.setProperty("class", "action_btn")
+        self.btn_import_students.clicked.connect(lambda: self.start_csv_import('students'))
+
         top_bar.addWidget(self.student_search)
+        top_bar.addWidget(self.create_busy_indicator('students'))
         top_bar.addStretch()
         top_bar.addWidget(self.btn_add_student)
         top_bar.addWidget(self.btn_edit_student)
         top_bar.addWidget(self.btn_delete_student)
+        top_bar.addWidget(self.btn_import_students)
         layout.addLayout(top_bar)
 
-        self.students_table = QTableWidget()
-        self.students_table.setColumnCount(4)
-        self.students_table.setHorizontalHeaderLabels(["ID", "Name", "Email", "GPA"])
+        # Rows are Student.get_students_page() tuples: (id, name, email, credit_hours, gpa)
+        self.students_model = PagedTableModel(
+            ["ID", "Name", "Email", "GPA"], [0, 1, 2, 4],
+            self.page_loader('students', Student.get_students_page, self.on_students_load_error), parent=self)
+        self.students_table = QTableView()
+        self.students_table.setModel(self.students_model)
         self.students_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.students_table.verticalHeader().setVisible(False)
         self.students_table.setAlternatingRowColors(True)
@@ -786,25 +950,12 @@ class MainApp(QMainWindow):
         self.students_page.setLayout(layout)
         
     def load_students_table(self):
-        self.students_table.setRowCount(0)
-        try:
-            students = Student.get_all_students() 
-            for row_idx, student_data in enumerate(students):
-                self.students_table.insertRow(row_idx)
-                
-                # Column 0: ID, 1: Name, 2: Email, 3: GPA
-                self.students_table.setItem(row_idx, 0, QTableWidgetItem(str(student_data[0])))
-                self.students_table.setItem(row_idx, 1, QTableWidgetItem(str(student_data[1])))
-                self.students_table.setItem(row_idx, 2, QTableWidgetItem(str(student_data[2])))
-                
-                gpa_val = student_data[4] if len(student_data) > 4 else 'N/A'
-                self.students_table.setItem(row_idx, 3, QTableWidgetItem(str(gpa_val)))
-                
-                for i in range(4):
-                    self.students_table.item(row_idx, i).setTextAlignment(Qt.AlignCenter)
-        except Exception as e:
-            print(f"Error loading students: {e}")
-            QMessageBox.critical(self, "DB Error", f"Failed to load students: {e}")
+        self.load_table('students', self.students_model, self.student_search,
+                        Student.search_students, self.on_students_load_error)
+
+    def on_students_load_error(self, error):
+        print(f"Error loading students: {error}")
+        QMessageBox.critical(self, "DB Error", f"Failed to load students: {error}")
 
 
     def open_add_student_dialog(self):
@@ -812,42 +963,41 @@ class MainApp(QMainWindow):
         if dialog.exec_() == QDialog.Accepted:
             name, email = dialog.get_data()
             if name and email:
-                try:
-                    new_student = Student(name=name, email=email, student_id=None)
-                    new_student.save_to_db() 
-                    self.load_students_table()
-                except Exception as e:
-                    QMessageBox.critical(self, "Error", f"Could not add student: {e}")
+                new_student = Student(name=name, email=email, student_id=None)
+                self.submit_page_write('students', new_student.save_to_db,
+                                       on_result=self.on_student_added,
+                                       on_error=lambda e: QMessageBox.critical(self, "Error", f"Could not add student: {e}"))
+
+    def on_student_added(self, row):
+        if row is None:
+            QMessageBox.warning(self, "Warning", "A student with this email already exists.")
+            return
+        self.show_saved_row('students', row)
 
     def open_edit_student_dialog(self):
-        row = self.students_table.currentRow()
-        if row == -1:
+        student = self.selected_record(self.students_table)
+        if student is None:
             QMessageBox.warning(self, "Warning", "Please select a student to edit.")
             return
             
-        sid = int(self.students_table.item(row, 0).text())
-        name = self.students_table.item(row, 1).text()
-        email = self.students_table.item(row, 2).text()
+        sid, name, email = student[0], student[1], student[2]
         
         dialog = AddStudentDialog(self, student_data={'name': name, 'email': email})
         if dialog.exec_() == QDialog.Accepted:
             new_name, new_email = dialog.get_data()
             if new_name and new_email:
-                try:
-                    student_to_update = Student(name=new_name, email=new_email, student_id=sid)
-                    student_to_update.save_to_db() 
-                    self.load_students_table()
-                except Exception as e:
-                    QMessageBox.critical(self, "Error", f"Could not update student: {e}")
+                student_to_update = Student(name=new_name, email=new_email, student_id=sid)
+                self.submit_page_write('students', student_to_update.save_to_db,
+                                       on_result=lambda row: self.show_saved_row('students', row),
+                                       on_error=lambda e: QMessageBox.critical(self, "Error", f"Could not update student: {e}"))
 
     def delete_selected_student(self):
-        row = self.students_table.currentRow()
-        if row == -1:
+        student = self.selected_record(self.students_table)
+        if student is None:
             QMessageBox.warning(self, "Warning", "Please select a student to delete.")
             return
             
-        sid = int(self.students_table.item(row, 0).text())
-        name = self.students_table.item(row, 1).text()
+        sid, name = student[0], student[1]
         
         confirm_box = QMessageBox(self)
         confirm_box.setWindowTitle("Confirm Delete")
@@ -877,11 +1027,9 @@ class MainApp(QMainWindow):
         confirm = confirm_box.exec_()
         
         if confirm == QMessageBox.Yes:
-            try:
-                self.db_manager.delete_student(sid) 
-                self.load_students_table()
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Could not delete student: {e}")
+            self.submit_page_write('students', self.db_manager.delete_student, sid,
+                                   on_result=lambda _: self.show_deleted_row('students', sid),
+                                   on_error=lambda e: QMessageBox.critical(self, "Error", f"Could not delete student: {e}"))
 
     # ---------------------------
     # INSTRUCTORS LOGIC (Page 2)
@@ -895,7 +1043,7 @@ class MainApp(QMainWindow):
         self.instructor_search = QLineEdit()
         self.instructor_search.setPlaceholderText("Search Instructor...")
         self.instructor_search.setFixedWidth(300)
-        self.instructor_search.textChanged.connect(self.filter_instructors)
+        self.create_search_timer(self.instructor_search, self.load_instructors_table)
         
         self.btn_add_instructor = QPushButton(" + Add Instructor")
         self.btn_add_instructor.setObjectName("add_btn")
@@ -913,15 +1061,20 @@ class MainApp(QMainWindow):
         self.btn_delete_instructor.clicked.connect(self.delete_selected_instructor)
 
         top_bar.addWidget(self.instructor_search)
+        top_bar.addWidget(self.create_busy_indicator('instructors'))
         top_bar.addStretch()
         top_bar.addWidget(self.btn_add_instructor)
         top_bar.addWidget(self.btn_edit_instructor)
         top_bar.addWidget(self.btn_delete_instructor)
         layout.addLayout(top_bar)
 
-        self.instructors_table = QTableWidget()
-        self.instructors_table.setColumnCount(3)
-        self.instructors_table.setHorizontalHeaderLabels(["ID", "Name", "Email"])
+        # Rows are Instructor.get_instructors_page() tuples: (id, name, email)
+        self.instructors_model = PagedTableModel(
+            ["ID", "Name", "Email"], [0, 1, 2],
+            self.page_loader('instructors', Instructor.get_instructors_page, self.on_instructors_load_error),
+            parent=self)
+        self.instructors_table = QTableView()
+        self.instructors_table.setModel(self.instructors_model)
         self.instructors_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.instructors_table.verticalHeader().setVisible(False)
         self.instructors_table.setAlternatingRowColors(True)
@@ -930,67 +1083,49 @@ class MainApp(QMainWindow):
         
         layout.addWidget(self.instructors_table)
         self.instructors_page.setLayout(layout)
-        
-        self.load_instructors_table()
 
     def load_instructors_table(self):
-        self.instructors_table.setRowCount(0)
-        try:
-            instructors = Instructor.get_all_instructors() 
-            for row_idx, instructor_data in enumerate(instructors):
-                self.instructors_table.insertRow(row_idx)
-                
-                self.instructors_table.setItem(row_idx, 0, QTableWidgetItem(str(instructor_data[0])))
-                self.instructors_table.setItem(row_idx, 1, QTableWidgetItem(str(instructor_data[1])))
-                self.instructors_table.setItem(row_idx, 2, QTableWidgetItem(str(instructor_data[2])))
-                
-                for i in range(3):
-                    self.instructors_table.item(row_idx, i).setTextAlignment(Qt.AlignCenter)
-        except Exception as e:
-            print(f"Error loading instructors: {e}")
-            QMessageBox.critical(self, "DB Error", f"Failed to load instructors: {e}")
+        self.load_table('instructors', self.instructors_model, self.instructor_search,
+                        Instructor.search_instructors, self.on_instructors_load_error)
+
+    def on_instructors_load_error(self, error):
+        print(f"Error loading instructors: {error}")
+        QMessageBox.critical(self, "DB Error", f"Failed to load instructors: {error}")
 
     def open_add_instructor_dialog(self):
         dialog = AddInstructorDialog(self)
         if dialog.exec_() == QDialog.Accepted:
             name, email = dialog.get_data()
             if name and email:
-                try:
-                    new_instructor = Instructor(name=name, email=email, instructor_id=None)
-                    new_instructor.save_to_db() 
-                    self.load_instructors_table()
-                except Exception as e:
-                    QMessageBox.critical(self, "Error", f"Could not add instructor: {e}")
+                new_instructor = Instructor(name=name, email=email, instructor_id=None)
+                self.submit_page_write('instructors', new_instructor.save_to_db,
+                                       on_result=lambda row: self.show_saved_row('instructors', row),
+                                       on_error=lambda e: QMessageBox.critical(self, "Error", f"Could not add instructor: {e}"))
 
     def open_edit_instructor_dialog(self):
-        row = self.instructors_table.currentRow()
-        if row == -1:
+        instructor = self.selected_record(self.instructors_table)
+        if instructor is None:
             QMessageBox.warning(self, "Warning", "Please select an instructor to edit.")
             return
             
-        iid = int(self.instructors_table.item(row, 0).text())
-        name = self.instructors_table.item(row, 1).text()
-        email = self.instructors_table.item(row, 2).text()
+        iid, name, email = instructor[0], instructor[1], instructor[2]
         
         dialog = AddInstructorDialog(self, instructor_data={'name': name, 'email': email})
         if dialog.exec_() == QDialog.Accepted:
             new_name, new_email = dialog.get_data()
             if new_name and new_email:
-                try:
-                    instructor_to_update = Instructor(name=new_name, email=new_email, instructor_id=iid)
-                    instructor_to_update.save_to_db()
-                    self.load_instructors_table()
-                except Exception as e:
-                    QMessageBox.critical(self, "Error", f"Could not update instructor: {e}")
+                instructor_to_update = Instructor(name=new_name, email=new_email, instructor_id=iid)
+                self.submit_page_write('instructors', instructor_to_update.save_to_db,
+                                       on_result=lambda row: self.show_saved_row('instructors', row),
+                                       on_error=lambda e: QMessageBox.critical(self, "Error", f"Could not update instructor: {e}"))
 
     def delete_selected_instructor(self):
-        row = self.instructors_table.currentRow()
-        if row == -1:
+        instructor = self.selected_record(self.instructors_table)
+        if instructor is None:
             QMessageBox.warning(self, "Warning", "Please select an instructor to delete.")
             return
             
-        iid = int(self.instructors_table.item(row, 0).text())
-        name = self.instructors_table.item(row, 1).text()
+        iid, name = instructor[0], instructor[1]
         
         # Use custom QMessageBox for styling delete buttons
         confirm_box = QMessageBox(self)
@@ -1021,11 +1156,9 @@ class MainApp(QMainWindow):
         confirm = confirm_box.exec_()
         
         if confirm == QMessageBox.Yes:
-            try:
-                Instructor.delete_instructor(iid) 
-                self.load_instructors_table()
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Could not delete instructor: {e}")
+            self.submit_page_write('instructors', Instructor.delete_instructor, iid,
+                                   on_result=lambda _: self.show_deleted_row('instructors', iid),
+                                   on_error=lambda e: QMessageBox.critical(self, "Error", f"Could not delete instructor: {e}"))
 
     # ---------------------------
     # COURSES LOGIC (Page 3)
@@ -1039,7 +1172,7 @@ class MainApp(QMainWindow):
         self.course_search = QLineEdit()
         self.course_search.setPlaceholderText("Search Course...")
         self.course_search.setFixedWidth(300)
-        self.course_search.textChanged.connect(self.filter_courses)
+        self.create_search_timer(self.course_search, self.load_courses_table)
         
         self.btn_add_course = QPushButton(" + Add Course")
         self.btn_add_course.setObjectName("add_btn")
@@ -1057,15 +1190,20 @@ class MainApp(QMainWindow):
         self.btn_delete_course.clicked.connect(self.delete_selected_course)
 
         top_bar.addWidget(self.course_search)
+        top_bar.addWidget(self.create_busy_indicator('courses'))
         top_bar.addStretch()
         top_bar.addWidget(self.btn_add_course)
         top_bar.addWidget(self.btn_edit_course)
         top_bar.addWidget(self.btn_delete_course)
         layout.addLayout(top_bar)
 
-        self.courses_table = QTableWidget()
-        self.courses_table.setColumnCount(4)
-        self.courses_table.setHorizontalHeaderLabels(["ID", "Course Name", "Credit Hours", "Instructor"])
+        # Rows are Course.get_courses_page() tuples: (id, name, credit_hours, instructor_name, instructor_id)
+        self.courses_model = PagedTableModel(
+            ["ID", "Course Name", "Credit Hours", "Instructor"], [0, 1, 2, 3],
+            self.page_loader('courses', Course.get_courses_page, self.on_courses_load_error),
+            parent=self)
+        self.courses_table = QTableView()
+        self.courses_table.setModel(self.courses_model)
         self.courses_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.courses_table.verticalHeader().setVisible(False)
         self.courses_table.setAlternatingRowColors(True)
@@ -1076,47 +1214,31 @@ class MainApp(QMainWindow):
         self.courses_page.setLayout(layout)
 
     def load_courses_table(self):
-        self.courses_table.setRowCount(0)
-        try:
-            courses = Course.get_all_courses()
-            for row_idx, data in enumerate(courses):
-                self.courses_table.insertRow(row_idx)
-                self.courses_table.setItem(row_idx, 0, QTableWidgetItem(str(data[0])))
-                self.courses_table.setItem(row_idx, 1, QTableWidgetItem(str(data[1])))
-                self.courses_table.setItem(row_idx, 2, QTableWidgetItem(str(data[2])))
-                self.courses_table.setItem(row_idx, 3, QTableWidgetItem(str(data[3]))) 
-                
-                self.courses_table.item(row_idx, 3).setData(Qt.UserRole, data[4])
-
-                for i in range(4):
-                    self.courses_table.item(row_idx, i).setTextAlignment(Qt.AlignCenter)
-        except Exception as e:
-            print(f"Error loading courses: {e}")
+        self.load_table('courses', self.courses_model, self.course_search,
+                        Course.search_courses, self.on_courses_load_error)
+
+    def on_courses_load_error(self, error):
+        print(f"Error loading courses: {error}")
 
     def open_add_course_dialog(self):
         dialog = AddCourseDialog(self)
         if dialog.exec_() == QDialog.Accepted:
             name, hours, inst_id = dialog.get_data()
             if name and hours and inst_id:
-                try:
-                    new_course = Course(course_name=name, credit_hours=hours, instructor_id=inst_id)
-                    new_course.save_to_db()
-                    self.load_courses_table()
-                except Exception as e:
-                    QMessageBox.critical(self, "Error", f"Failed to add course: {e}")
+                new_course = Course(course_name=name, credit_hours=hours, instructor_id=inst_id)
+                self.submit_page_write('courses', new_course.save_to_db,
+                                       on_result=lambda row: self.show_saved_row('courses', row),
+                                       on_error=lambda e: QMessageBox.critical(self, "Error", f"Failed to add course: {e}"))
             else:
                 QMessageBox.warning(self, "Missing Data", "Please fill all fields and select an instructor.")
 
     def open_edit_course_dialog(self):
-        row = self.courses_table.currentRow()
-        if row == -1:
+        course = self.selected_record(self.courses_table)
+        if course is None:
             QMessageBox.warning(self, "Warning", "Select a course to edit.")
             return
             
-        c_id = int(self.courses_table.item(row, 0).text())
-        name = self.courses_table.item(row, 1).text()
-        hours = self.courses_table.item(row, 2).text()
-        inst_name = self.courses_table.item(row, 3).text()
+        c_id, name, hours, inst_name = course[0], course[1], course[2], str(course[3])
         
         data = {'name': name, 'hours': hours, 'instructor_name': inst_name}
         
@@ -1124,22 +1246,19 @@ class MainApp(QMainWindow):
         if dialog.exec_() == QDialog.Accepted:
             new_name, new_hours, new_inst_id = dialog.get_data()
             if new_name and new_hours and new_inst_id:
-                try:
-                    course_obj = Course(course_name=new_name, credit_hours=new_hours, 
-                                      instructor_id=new_inst_id, course_id=c_id)
-                    course_obj.save_to_db()
-                    self.load_courses_table()
-                except Exception as e:
-                    QMessageBox.critical(self, "Error", f"Failed to update course: {e}")
+                course_obj = Course(course_name=new_name, credit_hours=new_hours, 
+                                  instructor_id=new_inst_id, course_id=c_id)
+                self.submit_page_write('courses', course_obj.save_to_db,
+                                       on_result=lambda row: self.show_saved_row('courses', row),
+                                       on_error=lambda e: QMessageBox.critical(self, "Error", f"Failed to update course: {e}"))
 
     def delete_selected_course(self):
-        row = self.courses_table.currentRow()
-        if row == -1:
+        course = self.selected_record(self.courses_table)
+        if course is None:
             QMessageBox.warning(self, "Warning", "Select a course to delete.")
             return
 
-        c_id = int(self.courses_table.item(row, 0).text())
-        name = self.courses_table.item(row, 1).text()
+        c_id, name = course[0], course[1]
         
         confirm_box = QMessageBox(self)
         confirm_box.setWindowTitle("Confirm Delete")
@@ -1167,11 +1286,9 @@ class MainApp(QMainWindow):
         no_btn.setStyleSheet(btn_style)
 
         if confirm_box.exec_() == QMessageBox.Yes:
-            try:
-                Course.delete_course(c_id)
-                self.load_courses_table()
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Could not delete course: {e}")
+            self.submit_page_write('courses', Course.delete_course, c_id,
+                                   on_result=lambda _: self.show_deleted_row('courses', c_id),
+                                   on_error=lambda e: QMessageBox.critical(self, "Error", f"Could not delete course: {e}"))
 
     # ---------------------------
     # GRADES LOGIC (Page 4)
@@ -1185,7 +1302,7 @@ class MainApp(QMainWindow):
         self.grade_search = QLineEdit()
         self.grade_search.setPlaceholderText("Search Grade...")
         self.grade_search.setFixedWidth(300)
-        self.grade_search.textChanged.connect(self.filter_grades)
+        self.create_search_timer(self.grade_search, self.load_grades_table)
         
         self.btn_add_grade = QPushButton(" + Assign Grade")
         self.btn_add_grade.setObjectName("add_btn")
@@ -1202,90 +1319,79 @@ class MainApp(QMainWindow):
         self.btn_delete_grade.setProperty("class", "action_btn")
         self.btn_delete_grade.clicked.connect(self.delete_selected_grade)
 
+        self.btn_import_grades = QPushButton(" Import")
+        self.btn_import_grades.setIcon(qta.icon("fa5s.file-import", color="#2b2b2b"))
+        self.btn_import_grades.setProperty("class", "action_btn")
+        self.btn_import_grades.clicked.connect(lambda: self.start_csv_import('grades'))
+
         top_bar.addWidget(self.grade_search)
+        top_bar.addWidget(self.create_busy_indicator('grades'))
         top_bar.addStretch()
         top_bar.addWidget(self.btn_add_grade)
         top_bar.addWidget(self.btn_edit_grade)
         top_bar.addWidget(self.btn_delete_grade)
+        top_bar.addWidget(self.btn_import_grades)
         layout.addLayout(top_bar)
 
-        self.grades_table = QTableWidget()
-        self.grades_table.setColumnCount(5)
-        self.grades_table.setHorizontalHeaderLabels(["Student", "Course", "Grade", "Student ID", "Course ID"])
+        # Rows are Grade.get_grades_page() tuples: (student_id, student_name, course_id, course_name, grade)
+        self.grades_model = PagedTableModel(
+            ["Student", "Course", "Grade"], [1, 3, 4],
+            self.page_loader('grades', Grade.get_grades_page, self.on_grades_load_error),
+            key_of=lambda row: (row[0], row[2]), parent=self)
+        self.grades_table = QTableView()
+        self.grades_table.setModel(self.grades_model)
         self.grades_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.grades_table.verticalHeader().setVisible(False)
         self.grades_table.setAlternatingRowColors(True)
         self.grades_table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.grades_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
-        self.grades_table.setColumnHidden(3, True) # Hide IDs
-        self.grades_table.setColumnHidden(4, True)
         
         layout.addWidget(self.grades_table)
         self.grades_page.setLayout(layout)
 
     def load_grades_table(self):
-        self.grades_table.setRowCount(0)
-        try:
-            grades = Grade.get_all_grades_info()
-            for row_idx, data in enumerate(grades):
-                self.grades_table.insertRow(row_idx)
-                self.grades_table.setItem(row_idx, 0, QTableWidgetItem(str(data[1]))) 
-                self.grades_table.setItem(row_idx, 1, QTableWidgetItem(str(data[3]))) 
-                self.grades_table.setItem(row_idx, 2, QTableWidgetItem(str(data[4]))) 
-                self.grades_table.setItem(row_idx, 3, QTableWidgetItem(str(data[0]))) 
-                self.grades_table.setItem(row_idx, 4, QTableWidgetItem(str(data[2]))) 
-
-                for i in range(3):
-                    self.grades_table.item(row_idx, i).setTextAlignment(Qt.AlignCenter)
-        except Exception as e:
-            print(f"Error loading grades: {e}")
+        self.load_table('grades', self.grades_model, self.grade_search,
+                        Grade.search_grades, self.on_grades_load_error)
+
+    def on_grades_load_error(self, error):
+        print(f"Error loading grades: {error}")
 
     def open_add_grade_dialog(self):
         dialog = AddGradeDialog(self)
         if dialog.exec_() == QDialog.Accepted:
             s_id, c_id, grade_val = dialog.get_data()
             if s_id and c_id:
-                try:
-                    new_grade = Grade(student_id=s_id, course_id=c_id, grade_value=grade_val)
-                    new_grade.assign_grade()
-                    self.load_grades_table()
-                except Exception as e:
-                    QMessageBox.critical(self, "Error", f"Failed to assign grade: {e}")
+                new_grade = Grade(student_id=s_id, course_id=c_id, grade_value=grade_val)
+                self.submit_page_write('grades', new_grade.save_to_db,
+                                       on_result=lambda row: self.show_saved_row('grades', row),
+                                       on_error=lambda e: QMessageBox.critical(self, "Error", f"Failed to assign grade: {e}"))
 
     def open_edit_grade_dialog(self):
-        row = self.grades_table.currentRow()
-        if row == -1:
+        grade = self.selected_record(self.grades_table)
+        if grade is None:
             QMessageBox.warning(self, "Warning", "Select a grade to edit.")
             return
 
-        s_name = self.grades_table.item(row, 0).text()
-        c_name = self.grades_table.item(row, 1).text()
-        grade_val = self.grades_table.item(row, 2).text()
-        s_id = int(self.grades_table.item(row, 3).text())
-        c_id = int(self.grades_table.item(row, 4).text())
+        s_id, s_name, c_id, c_name, grade_val = grade
 
-        data = {'student_name': s_name, 'course_name': c_name, 'grade': grade_val}
+        data = {'student_id': s_id, 'student_name': s_name, 'course_id': c_id, 'course_name': c_name,
+                'grade': grade_val}
         
         dialog = AddGradeDialog(self, grade_data=data)
         if dialog.exec_() == QDialog.Accepted:
             _, _, new_grade_val = dialog.get_data()
-            try:
-                grade_obj = Grade(student_id=s_id, course_id=c_id, grade_value=new_grade_val)
-                grade_obj.assign_grade()
-                self.load_grades_table()
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to update grade: {e}")
+            grade_obj = Grade(student_id=s_id, course_id=c_id, grade_value=new_grade_val)
+            self.submit_page_write('grades', grade_obj.save_to_db,
+                                   on_result=lambda row: self.show_saved_row('grades', row),
+                                   on_error=lambda e: QMessageBox.critical(self, "Error", f"Failed to update grade: {e}"))
 
     def delete_selected_grade(self):
-        row = self.grades_table.currentRow()
-        if row == -1:
+        grade = self.selected_record(self.grades_table)
+        if grade is None:
             QMessageBox.warning(self, "Warning", "Select a grade to delete.")
             return
 
-        s_name = self.grades_table.item(row, 0).text()
-        c_name = self.grades_table.item(row, 1).text()
-        s_id = int(self.grades_table.item(row, 3).text())
-        c_id = int(self.grades_table.item(row, 4).text())
+        s_id, s_name, c_id, c_name, _ = grade
         
         confirm_box = QMessageBox(self)
         confirm_box.setWindowTitle("Confirm Delete")
@@ -1313,54 +1419,265 @@ class MainApp(QMainWindow):
         no_btn.setStyleSheet(btn_style)
 
         if confirm_box.exec_() == QMessageBox.Yes:
-            try:
-                Grade.delete_grade(s_id, c_id)
-                self.load_grades_table()
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Could not delete grade: {e}")
+            self.submit_page_write('grades', Grade.delete_grade, s_id, c_id,
+                                   on_result=lambda _: self.show_deleted_row('grades', (s_id, c_id)),
+                                   on_error=lambda e: QMessageBox.critical(self, "Error", f"Could not delete grade: {e}"))
+
+    # ---------------------------
+    # DIAGNOSTICS LOGIC (Page 5)
+    # ---------------------------
+    def setup_diagnostics_ui(self):
+        layout = QVBoxLayout()
+        layout.setContentsMargins(20, 20, 20, 20)
+        layout.setSpacing(15)
+
+        top_bar = QHBoxLayout()
+        self.diagnostics_status = QLabel()
+        self.diagnostics_status.setStyleSheet("color: #2b2b2b; font-size: 14px;")
+        self.diagnostics_status.setWordWrap(True)
+
+        self.btn_refresh_diagnostics = QPushButton(" Refresh")
+        self.btn_refresh_diagnostics.setIcon(qta.icon("fa5s.sync", color="#2b2b2b"))
+        self.btn_refresh_diagnostics.setProperty("class", "action_btn")
+        self.btn_refresh_diagnostics.clicked.connect(self.refresh_diagnostics)
+
+        self.btn_reset_diagnostics = QPushButton(" Reset")
+        self.btn_reset_diagnostics.setIcon(qta.icon("fa5s.eraser", color="#2b2b2b"))
+        self.btn_reset_diagnostics.setProperty("class", "action_btn")
+        self.btn_reset_diagnostics.clicked.connect(self.reset_diagnostics)
+
+        top_bar.addWidget(self.diagnostics_status, 1)
+        top_bar.addWidget(self.btn_refresh_diagnostics)
+        top_bar.addWidget(self.btn_reset_diagnostics)
+        layout.addLayout(top_bar)
+
+        # Rows: (statement, count, total ms, mean ms, p95 ms, max ms, rows), slowest total first
+        self.diagnostics_model = RowTableModel(
+            ["Statement", "Count", "Total ms", "Mean ms", "p95 ms", "Max ms", "Rows"], list(range(7)), parent=self)
+        self.diagnostics_table = QTableView()
+        self.diagnostics_table.setModel(self.diagnostics_model)
+        header = self.diagnostics_table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(0, QHeaderView.Stretch)
+        self.diagnostics_table.verticalHeader().setVisible(False)
+        self.diagnostics_table.setAlternatingRowColors(True)
+        self.diagnostics_table.setWordWrap(False)
+        self.diagnostics_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+
+        layout.addWidget(self.diagnostics_table)
+        self.diagnostics_page.setLayout(layout)
+
+    def refresh_diagnostics(self):
+        pool = DatabaseManager.get_connection_stats()
+        cache = DatabaseManager.get_lookup_cache_stats()
+        pages = self.page_refresh_stats
+        summary = (f"Connections: {pool['open']} open, {pool['opened']} opened, {pool['reused']} reuses  |  "
+                   f"Lookup cache: {cache['hits']} hits, {cache['misses']} misses  |  "
+                   f"Page switches: {pages['hits']} unchanged, {pages['misses']} reloaded")
+
+        stats = DatabaseManager.get_query_stats()
+        if stats is None:
+            self.diagnostics_status.setText(
+                summary + "\nQuery statistics are off. Start the app with GRADING_QUERY_STATS=1 to record them.")
+            self.diagnostics_model.set_rows([])
+            return
+        commits = stats['commits']
+        self.diagnostics_status.setText(
+            summary + f"\n{len(stats['statements'])} statements, "
+            f"{commits['count']} commits ({commits['total_ms']:.1f} ms)")
+        self.diagnostics_model.set_rows([
+            (s['sql'], s['count'], round(s['total_ms'], 1), round(s['mean_ms'], 2), round(s['p95_ms'], 2),
+             round(s['max_ms'], 2), s['rows'])
+            for s in stats['statements']])
+
+    def reset_diagnostics(self):
+        DatabaseManager.reset_query_stats()
+        self.refresh_diagnostics()
+
+    # --- CSV IMPORT LOGIC ---
+    def start_csv_import(self, kind):
+        if self.import_worker is not None and self.import_worker.isRunning():
+            QMessageBox.warning(self, "Import Running", "Please wait for the current import to finish.")
+            return
+
+        if kind == 'students':
+            hint = "Students CSV (columns: name, email)"
+        else:
+            hint = "Grades CSV (columns: student_id, course_id, grade)"
+        path, _ = QFileDialog.getOpenFileName(self, f"Import {hint}", "", "CSV Files (*.csv)")
+        if not path:
+            return
+
+        self.import_progress = QProgressDialog(f"Importing {kind}...", "Cancel", 0, 100, self)
+        self.import_progress.setWindowTitle("Import CSV")
+        self.import_progress.setWindowModality(Qt.WindowModal)
+        self.import_progress.setMinimumDuration(0)
+        self.import_progress.setAutoClose(False)
+        self.import_progress.setAutoReset(False)
+
+        self.import_worker = CsvImportWorker(path, kind, self)
+        self.import_worker.progress.connect(self.import_progress.setValue)
+        self.import_worker.import_finished.connect(lambda report: self.on_csv_import_finished(kind, report))
+        self.import_worker.import_failed.connect(self.on_csv_import_failed)
+        self.import_progress.canceled.connect(self.import_worker.requestInterruption)
+        self.import_worker.start()
+
+    def on_csv_import_finished(self, kind, report):
+        self.import_progress.close()
+        failed_count = report['failed_count']
+        message = f"Imported {report['written']} of {report['rows']} rows."
+        if report.get('cancelled'):
+            message = "Import cancelled. " + message
+        if failed_count:
+            details = "\n".join(f"Line {line}: {reason}" for line, _, reason in report['failed'][:10])
+            more = f"\n... and {failed_count - 10} more" if failed_count > 10 else ""
+            message += f"\n\n{failed_count} rows skipped:\n{details}{more}"
+        QMessageBox.information(self, "Import Finished", message)
+
+        if kind == 'students':
+            self.load_students_table()
+        else:
+            self.load_grades_table()
+
+    def on_csv_import_failed(self, error):
+        self.import_progress.close()
+        QMessageBox.critical(self, "Import Failed", f"Could not import file: {error}")
 
     # --- SEARCH LOGIC ---
-    def filter_students(self):
-        text = self.student_search.text().lower()
-        for row in range(self.students_table.rowCount()):
-            match = False
-            for col in [0, 1]:
-                item = self.students_table.item(row, col)
-                if item and text in item.text().lower():
-                    match = True
-                    break
-            self.students_table.setRowHidden(row, not match)
-
-    def filter_instructors(self):
-        text = self.instructor_search.text().lower()
-        for row in range(self.instructors_table.rowCount()):
-            match = False
-            item = self.instructors_table.item(row, 1)
-            if item and text in item.text().lower():
-                match = True
-            self.instructors_table.setRowHidden(row, not match)
-
-    def filter_courses(self):
-        text = self.course_search.text().lower()
-        for row in range(self.courses_table.rowCount()):
-            match = False
-            item = self.courses_table.item(row, 1)
-            if item and text in item.text().lower():
-                match = True
-            self.courses_table.setRowHidden(row, not match)
-
-    def filter_grades(self):
-        text = self.grade_search.text().lower()
-        for row in range(self.grades_table.rowCount()):
-            match = False
-            for col in [0, 1]:
-                item = self.grades_table.item(row, col)
-                if item and text in item.text().lower():
-                    match = True
-                    break
-            self.grades_table.setRowHidden(row, not match)
+    def create_search_timer(self, search_box, run_search):
+        """ Runs run_search once typing in search_box pauses, rather than on every keystroke. """
+        timer = QTimer(self)
+        timer.setSingleShot(True)
+        timer.setInterval(SEARCH_DEBOUNCE_MS)
+        timer.timeout.connect(run_search)
+        search_box.textChanged.connect(lambda _: timer.start())
+        return timer
+
+    def load_table(self, channel, model, search_box, search, on_error):
+        """ Pages through the whole table, or shows the ranked matches for the search box text. """
+        text = search_box.text().strip()
+        if not text:
+            model.reload()
+            return
+
+        def load(on_rows, on_cancel):
+            def failed(error):
+                on_cancel()
+                on_error(error)
+            self.submit_page_load(channel, search, text, on_result=on_rows, on_error=failed, on_cancel=on_cancel)
+        model.show_results(load)
+
+    # --- IN-PLACE UPDATES ---
+    def page_table(self, channel):
+        """ (model, reload) for a management page's table. """
+        # Looked up by name: pages that were never opened have no model yet
+        return getattr(self, f"{channel}_model"), getattr(self, f"load_{channel}_table")
+
+    def show_saved_row(self, channel, row):
+        """ Puts the row a model write returned into the page's table instead of reloading it. """
+        model, reload = self.page_table(channel)
+        if row is None or not model.put_row(row):
+            reload()
+
+    def show_deleted_row(self, channel, key):
+        model, _ = self.page_table(channel)
+        model.remove_row(key)
+
+    def submit_page_write(self, channel, fn, *args, on_result=None, on_error=None):
+        """
+        Runs a model write on the write thread, reading the page's data versions
+        just before and after it there. channel names the page the write was made
+        from; the write is not submitted on it, so page loads and writes never
+        cancel each other.
+        """
+        tables = self.PAGE_TABLES[channel]
+
+        def write():
+            before = self.db_manager.get_data_versions(tables)
+            result = fn(*args)
+            return result, before, self.db_manager.get_data_versions(tables)
+
+        def written(outcome):
+            result, before, after = outcome
+            if on_result is not None:
+                on_result(result)
+            self.keep_page_current(channel, before, after)
+        self.data_access.submit(write, write=True, on_result=written, on_error=on_error)
+
+    def keep_page_current(self, channel, before, after):
+        # A page that was current before its own write and showed the write in place is still current,
+        # so switching back should not reload it. Not while an import is running: its rows have not been loaded.
+        if self.import_worker is not None and self.import_worker.isRunning():
+            self.page_versions.pop(channel, None)
+        elif self.page_versions.get(channel) == before:
+            self.page_versions[channel] = after
 
     # --- HELPERS ---
+    def page_loader(self, channel, fetch_page, on_error):
+        """ Feeds a PagedTableModel from a model's keyset page query, run on the page's channel. """
+        def load(after_key, limit, on_page, on_cancel):
+            def failed(error):
+                on_cancel()
+                on_error(error)
+            if after_key is None:
+                # The first page is what (re)loads the table
+                self.submit_page_load(channel, fetch_page, after_key, limit,
+                                      on_result=on_page, on_error=failed, on_cancel=on_cancel)
+            else:
+                self.data_access.submit(fetch_page, after_key, limit, channel=channel,
+                                        on_result=on_page, on_error=failed, on_cancel=on_cancel)
+        return load
+
+    def submit_page_load(self, channel, fn, *args, on_result=None, on_error=None, on_cancel=None):
+        """
+        Runs a page's load on its channel. The page's data versions are read on the
+        same worker just before the load, so writes that land during it still mark
+        the page stale; they are recorded only once the load has been delivered.
+        """
+        tables = self.PAGE_TABLES[channel]
+        self.page_versions.pop(channel, None)
+
+        def load():
+            return self.db_manager.get_data_versions(tables), fn(*args)
+
+        def loaded(outcome):
+            versions, result = outcome
+            self.page_versions[channel] = versions
+            if on_result is not None:
+                on_result(result)
+        self.data_access.submit(load, channel=channel, on_result=loaded, on_error=on_error, on_cancel=on_cancel)
+
+    def selected_record(self, table):
+        """ The row tuple behind the table's current row, or None if nothing is selected. """
+        index = table.currentIndex()
+        if not index.isValid():
+            return None
+        return table.model().row_at(index.row())
+
+    def create_busy_indicator(self, channel):
+        indicator = QProgressBar()
+        indicator.setRange(0, 0)  # Indeterminate "busy" animation
+        indicator.setTextVisible(False)
+        indicator.setFixedSize(120, 6)
+        indicator.setVisible(False)
+        self.busy_indicators[channel] = indicator
+        return indicator
+
+    def on_busy_changed(self, channel, busy):
+        indicator = self.busy_indicators.get(channel)
+        if indicator is not None:
+            indicator.setVisible(busy)
+
+    def closeEvent(self, event):
+        if self.import_worker is not None and self.import_worker.isRunning():
+            # Nobody is left to show the report; the import stops once its current chunk has committed
+            self.import_worker.import_finished.disconnect()
+            self.import_worker.import_failed.disconnect()
+            self.import_worker.requestInterruption()
+            self.import_worker.wait()
+        self.data_access.shutdown()
+        super().closeEvent(event)
+
     def create_nav_btn(self, text, icon_name):
         btn = QPushButton(text)
         btn.setIcon(qta.icon(icon_name, color="white"))
@@ -0,0 +1,83 @@
+from PyQt5.QtCore import Qt, QTimer, QStringListModel, pyqtSignal
+from PyQt5.QtWidgets import QCompleter, QLineEdit
+
+# Pause in typing (ms) before a picker runs its search
+PICKER_DEBOUNCE_MS = 200
+
+class RecordPicker(QLineEdit):
+    """
+    Type-ahead picker for one database record. Typing runs search(text, limit)
+    in the background once the user pauses and offers the top matches; choosing
+    one stores its ID. search must return (record_id, label) pairs with unique labels.
+    Opening the picker costs nothing, however many records there are.
+    """
+    record_chosen = pyqtSignal(int)
+
+    def __init__(self, search, data_access=None, limit=20, parent=None):
+        super().__init__(parent)
+        self.search = search
+        self.data_access = data_access
+        self.limit = limit
+        self.channel = f"picker-{id(self)}"
+        self._labels = {}  # label -> record_id for the matches on offer
+        self._record_id = None
+
+        self.matches_model = QStringListModel(self)
+        self.completer = QCompleter(self.matches_model, self)
+        # The search has already filtered and ranked the matches
+        self.completer.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
+        self.completer.setCaseSensitivity(Qt.CaseInsensitive)
+        self.completer.activated[str].connect(self.choose_label)
+        self.setCompleter(self.completer)
+
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(PICKER_DEBOUNCE_MS)
+        self.search_timer.timeout.connect(self.run_search)
+        self.textEdited.connect(self.on_text_edited)
+
+    def record_id(self):
+        """ ID of the chosen record, or None until a match has been picked. """
+        return self._record_id
+
+    def set_record(self, record_id, label):
+        self._record_id = record_id
+        self._labels = {label: record_id}
+        self.setText(label)
+
+    def on_text_edited(self, text):
+        # An offered label typed out in full counts as picking it
+        self._record_id = self._labels.get(text)
+        self.search_timer.start()
+
+    def run_search(self):
+        text = self.text().strip()
+        if not text:
+            self.show_matches([])
+            return
+        if self.data_access is None:
+            self.show_matches(self.search(text, self.limit))
+        else:
+            self.data_access.submit(self.search, text, self.limit, channel=self.channel,
+                                    on_result=self.show_matches,
+                                    on_error=lambda e: print(f"Picker search error: {e}"))
+
+    def show_matches(self, matches):
+        self._labels = {label: record_id for record_id, label in matches}
+        self.matches_model.setStringList([label for _, label in matches])
+        self._record_id = self._labels.get(self.text(), self._record_id)
+        if matches and self.hasFocus():
+            self.completer.complete()
+
+    def choose_label(self, label):
+        record_id = self._labels.get(label)
+        if record_id is not None:
+            self._record_id = record_id
+            self.record_chosen.emit(record_id)
+
+    def hideEvent(self, event):
+        # A search finishing after the dialog closed has no one to show its matches to
+        self.search_timer.stop()
+        if self.data_access is not None:
+            self.data_access.cancel(self.channel)
+        super().hideEvent(event)
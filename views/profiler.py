@@ -0,0 +1,200 @@
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from collections import deque
+
+from PyQt5.QtCore import QEvent, QObject, Qt, QTimer
+from PyQt5.QtWidgets import QApplication
+
+# MainApp handlers timed as their own slices in the trace
+PROFILED_METHODS = (
+    'switch_page', 'ensure_page', 'refresh_dashboard', 'populate_dashboard', 'setup_dashboard_charts',
+    'draw_dashboard_charts', 'load_students_table', 'load_instructors_table', 'load_courses_table',
+    'load_grades_table', 'show_saved_row', 'show_deleted_row', 'refresh_diagnostics', 'on_csv_import_finished',
+)
+
+# Trace events kept; the oldest are dropped first so a long session cannot grow without bound
+MAX_TRACE_EVENTS = 200_000
+
+EVENT_NAMES = {int(value): name for name, value in vars(QEvent).items() if isinstance(value, QEvent.Type)}
+
+class TraceRecorder:
+    """ Collects Chrome trace-format events (chrome://tracing, Perfetto) with microsecond timestamps. """
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.pid = os.getpid()
+        self._events = deque(maxlen=MAX_TRACE_EVENTS)
+        self._threads = {}  # thread ident -> small trace tid
+        self._lock = threading.Lock()
+
+    def _tid(self):
+        ident = threading.get_ident()
+        tid = self._threads.get(ident)
+        if tid is None:
+            with self._lock:
+                tid = self._threads.setdefault(ident, len(self._threads) + 1)
+        return tid
+
+    def _us(self, at):
+        return round((at - self.origin) * 1_000_000, 1)
+
+    def complete(self, name, start, end, category, args=None):
+        event = {'name': name, 'cat': category, 'ph': 'X', 'ts': self._us(start),
+                 'dur': round((end - start) * 1_000_000, 1), 'pid': self.pid, 'tid': self._tid()}
+        if args:
+            event['args'] = args
+        self._events.append(event)
+
+    def save(self, path):
+        names = {tid: ("GUI thread" if tid == 1 else f"thread {tid}") for tid in self._threads.values()}
+        metadata = [{'name': 'thread_name', 'ph': 'M', 'pid': self.pid, 'tid': tid, 'args': {'name': name}}
+                    for tid, name in names.items()]
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': metadata + list(self._events), 'displayTimeUnit': 'ms'}, f)
+
+def stall_ms_from_environment(default=50):
+    """ GRADING_UI_STALL_MS: event-loop delay reported as a stall (default 50 ms). """
+    value = os.environ.get('GRADING_UI_STALL_MS')
+    if not value:
+        return default
+    try:
+        stall_ms = float(value)
+    except ValueError:
+        stall_ms = None
+    # Read at startup, so a typo must not stop the app from starting
+    if stall_ms is None or not stall_ms > 0:
+        print(f"Ignoring GRADING_UI_STALL_MS={value!r}: not a positive number of milliseconds", file=sys.stderr)
+        return default
+    return stall_ms
+
+class ProfilingApplication(QApplication):
+    """
+    QApplication that times every event it dispatches and records those slower
+    than min_event_ms, e.g. a repaint (frame time), a click running a handler,
+    or a queued result from a worker thread. Set recorder before exec_().
+    """
+    def __init__(self, argv, min_event_ms=2.0):
+        super().__init__(argv)
+        self.min_event_seconds = min_event_ms / 1000
+        self.recorder = None
+
+    def notify(self, receiver, event):
+        if self.recorder is None:
+            return super().notify(receiver, event)
+        # Taken up front: the receiver may be deleted by the event itself
+        event_type = int(event.type())
+        target = type(receiver).__name__
+        start = time.perf_counter()
+        try:
+            return super().notify(receiver, event)
+        finally:
+            end = time.perf_counter()
+            if end - start >= self.min_event_seconds:
+                name = EVENT_NAMES.get(event_type, f"Event {event_type}")
+                self.recorder.complete(f"{name} -> {target}", start, end, 'event')
+
+class UiProfiler(QObject):
+    """
+    Opt-in GUI profiler. Times MainApp's handlers and the dashboard's
+    matplotlib draw() calls, and runs a watchdog timer that records an
+    event-loop stall whenever a tick arrives more than stall_ms late. The
+    trace is written to trace_path when the application quits.
+    """
+    def __init__(self, trace_path, stall_ms=50, tick_ms=10, parent=None):
+        super().__init__(parent)
+        self.trace_path = trace_path
+        self.stall_seconds = stall_ms / 1000
+        self.tick_seconds = tick_ms / 1000
+        self.recorder = TraceRecorder()
+        self.stalls = []  # Stall durations in seconds
+
+        self.watchdog = QTimer(self)
+        self.watchdog.setTimerType(Qt.PreciseTimer)
+        self.watchdog.setInterval(tick_ms)
+        self.watchdog.timeout.connect(self.on_tick)
+        self._last_tick = None
+
+    def start(self, app):
+        if isinstance(app, ProfilingApplication):
+            app.recorder = self.recorder
+        app.aboutToQuit.connect(self.stop)
+        self._last_tick = time.perf_counter()
+        self.watchdog.start()
+
+    def on_tick(self):
+        now = time.perf_counter()
+        late = now - self._last_tick - self.tick_seconds
+        if late > self.stall_seconds:
+            self.stalls.append(late)
+            self.recorder.complete("event loop stall", self._last_tick + self.tick_seconds, now, 'stall',
+                                   {'ms': round(late * 1000, 1)})
+        self._last_tick = now
+
+    def attach(self, window):
+        """
+        Times window's PROFILED_METHODS and its DataAccess tasks from now on. Call it
+        before the window's first load, as MainApp(profiler=...) does.
+        """
+        for name in PROFILED_METHODS:
+            method = getattr(window, name, None)
+            if method is not None:
+                setattr(window, name, self.timed(method, f"MainApp.{name}", 'handler'))
+        # The chart canvases only exist once the dashboard charts are set up, so they are wrapped on first draw
+        draw_charts = window.draw_dashboard_charts
+
+        @functools.wraps(draw_charts)
+        def draw_timed_charts(*args, **kwargs):
+            for canvas_name in ('canvas_grades', 'canvas_courses', 'canvas_trend'):
+                canvas = getattr(window, canvas_name, None)
+                if canvas is not None and not hasattr(canvas.draw, 'profiled'):
+                    canvas.draw = self.timed(canvas.draw, f"{canvas_name}.draw", 'draw')
+            return draw_charts(*args, **kwargs)
+        window.draw_dashboard_charts = draw_timed_charts
+
+        data_access = getattr(window, 'data_access', None)
+        if data_access is not None:
+            self.trace_data_access(data_access)
+
+    def trace_data_access(self, data_access):
+        """
+        Times each submitted task twice: its work on the worker thread, and the
+        delivery of its result (or error) back on the GUI thread. A handler that
+        only submits a task shows up as a short slice; these show the rest.
+        """
+        submit = data_access.submit
+
+        @functools.wraps(submit)
+        def traced_submit(fn, *args, on_result=None, on_error=None, **kwargs):
+            name = getattr(fn, '__qualname__', type(fn).__name__)
+            fn = self.timed(fn, f"task {name}", 'task')
+            if on_result is not None:
+                on_result = self.timed(on_result, f"result {name}", 'result')
+            if on_error is not None:
+                on_error = self.timed(on_error, f"error {name}", 'result')
+            return submit(fn, *args, on_result=on_result, on_error=on_error, **kwargs)
+        data_access.submit = traced_submit
+
+    def timed(self, fn, name, category):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self.recorder.complete(name, start, time.perf_counter(), category)
+        wrapper.profiled = True
+        return wrapper
+
+    def stop(self):
+        self.watchdog.stop()
+        try:
+            self.recorder.save(self.trace_path)
+        except OSError as e:
+            print(f"Could not write UI trace: {e}", file=sys.stderr)
+            return
+        worst = f", worst {max(self.stalls) * 1000:.0f} ms" if self.stalls else ""
+        print(f"UI trace written to {self.trace_path}: {len(self.stalls)} event-loop stalls over "
+              f"{self.stall_seconds * 1000:.0f} ms{worst}", file=sys.stderr)
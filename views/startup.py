@@ -0,0 +1,48 @@
+import sys
+import time
+
+from PyQt5.QtCore import QEvent, QObject, QTimer
+from PyQt5.QtWidgets import QApplication
+
+class StartupReport(QObject):
+    """
+    Records startup milestones (imports, window construction, first paint,
+    dashboard charts ready) and prints them on stderr once the dashboard is
+    usable. Enabled with main.py --startup-report.
+    """
+    def __init__(self, begin, quit_when_done=False, parent=None):
+        super().__init__(parent)
+        self.begin = begin
+        self.quit_when_done = quit_when_done
+        self.marks = []  # (label, perf_counter time)
+        self._painted = False
+        self._done = False
+
+    def mark(self, label, at=None):
+        self.marks.append((label, time.perf_counter() if at is None else at))
+
+    def watch(self, window):
+        window.installEventFilter(self)
+        window.dashboard_ready.connect(self.on_dashboard_ready)
+
+    def eventFilter(self, obj, event):
+        if not self._painted and event.type() == QEvent.Paint:
+            self._painted = True
+            self.mark("first paint")
+        return False
+
+    def on_dashboard_ready(self):
+        if self._done:
+            return
+        self._done = True
+        self.mark("dashboard charts ready")
+        self.print_report()
+        if self.quit_when_done:
+            QTimer.singleShot(0, QApplication.quit)
+
+    def print_report(self):
+        print("Startup timing (ms)      step    since start", file=sys.stderr)
+        previous = self.begin
+        for label, at in self.marks:
+            print(f"  {label:<22} {(at - previous) * 1000:7.1f}  {(at - self.begin) * 1000:9.1f}", file=sys.stderr)
+            previous = at
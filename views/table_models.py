@@ -0,0 +1,170 @@
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex
+
+class RowTableModel(QAbstractTableModel):
+    """
+    Read-only table model backed directly by the row tuples the models return.
+    Cells are formatted only when the view asks for them in data(), so only the
+    visible rows cost anything, instead of one QTableWidgetItem per cell.
+    """
+    def __init__(self, headers, source_columns, parent=None):
+        super().__init__(parent)
+        self._headers = headers
+        # Index into each row tuple for every visible column
+        self._source_columns = source_columns
+        self._rows = []
+
+    # ---------- Qt Model Interface ----------
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return str(self._rows[index.row()][self._source_columns[index.column()]])
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        if role == Qt.UserRole:
+            return self._rows[index.row()][self._source_columns[index.column()]]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._headers[section]
+        return None
+
+    # ---------- Row Access ----------
+    def set_rows(self, rows):
+        self.beginResetModel()
+        self._rows = rows if isinstance(rows, list) else list(rows)
+        self.endResetModel()
+
+    def row_at(self, row):
+        return self._rows[row]
+
+    def rows(self):
+        return self._rows
+
+class PagedTableModel(RowTableModel):
+    """
+    RowTableModel that loads rows one keyset page at a time as the view scrolls,
+    through Qt's canFetchMore()/fetchMore(). Opening a table costs one page no
+    matter how large the underlying table is.
+
+    page_loader(after_key, limit, on_page, on_cancel) must fetch the rows after
+    after_key and call on_page(rows), or on_cancel() if the fetch is abandoned.
+    key_of(row) returns the keyset key of a loaded row.
+    """
+    def __init__(self, headers, source_columns, page_loader, key_of=lambda row: row[0],
+                 page_size=200, parent=None):
+        super().__init__(headers, source_columns, parent)
+        self.page_loader = page_loader
+        self.key_of = key_of
+        self.page_size = page_size
+        self._exhausted = True
+        self._loading = False
+        self._generation = 0  # Bumped on reload so late pages from an older load are ignored
+        self._results = False  # Showing a fixed result set (show_results) instead of key-ordered pages
+
+    def reload(self):
+        self._generation += 1
+        self._results = False
+        self.set_rows([])
+        self._exhausted = False
+        self._request_page(None)
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and not self._exhausted and not self._loading
+
+    def fetchMore(self, parent=QModelIndex()):
+        if self.canFetchMore(parent):
+            self._request_page(self.key_of(self._rows[-1]) if self._rows else None)
+
+    def _request_page(self, after_key):
+        self._loading = True
+        generation = self._generation
+        self.page_loader(after_key, self.page_size,
+                         lambda rows: self._on_page(generation, rows),
+                         lambda: self._on_cancel(generation))
+
+    def _on_page(self, generation, rows):
+        if generation != self._generation:
+            return
+        self._loading = False
+        self._exhausted = len(rows) < self.page_size
+        if rows:
+            first = len(self._rows)
+            self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+            self._rows.extend(rows)
+            self.endInsertRows()
+
+    def show_results(self, loader):
+        """
+        Replaces the rows with one fixed result set, such as search hits.
+        loader(on_rows, on_cancel) must deliver the rows or report the fetch abandoned.
+        Paging stays off until the next reload().
+        """
+        self._generation += 1
+        self._results = True
+        self._exhausted = True
+        self._loading = True
+        generation = self._generation
+        loader(lambda rows: self._on_results(generation, rows),
+               lambda: self._on_cancel(generation))
+
+    def _on_results(self, generation, rows):
+        if generation == self._generation:
+            self._loading = False
+            self.set_rows(rows)
+
+    def _on_cancel(self, generation):
+        if generation == self._generation:
+            self._loading = False
+
+    # ---------- In-Place Edits ----------
+    def put_row(self, row):
+        """
+        Shows a row that was just written without reloading: replaces the loaded
+        row with the same key, or inserts it at its key position. Qt keeps the
+        scroll position and selection across both. Returns False if the row is
+        new and the model shows a fixed result set, so the caller must re-query.
+        """
+        key = self.key_of(row)
+        position = self._find(key)
+        if position < len(self._rows) and self.key_of(self._rows[position]) == key:
+            self._rows[position] = row
+            self.dataChanged.emit(self.index(position, 0), self.index(position, self.columnCount() - 1))
+            return True
+        if self._results:
+            return False
+        if position == len(self._rows) and not self._exhausted:
+            # Sorts after everything loaded so far; a later page will bring it in
+            return True
+        self.beginInsertRows(QModelIndex(), position, position)
+        self._rows.insert(position, row)
+        self.endInsertRows()
+        return True
+
+    def remove_row(self, key):
+        position = self._find(key)
+        if position < len(self._rows) and self.key_of(self._rows[position]) == key:
+            self.beginRemoveRows(QModelIndex(), position, position)
+            del self._rows[position]
+            self.endRemoveRows()
+
+    def _find(self, key):
+        """ Index of the row with key, else where it would be inserted (len(rows) for a result set). """
+        if self._results:
+            return next((i for i, row in enumerate(self._rows) if self.key_of(row) == key), len(self._rows))
+        # Paged rows are in key order
+        low, high = 0, len(self._rows)
+        while low < high:
+            middle = (low + high) // 2
+            if self.key_of(self._rows[middle]) < key:
+                low = middle + 1
+            else:
+                high = middle
+        return low
@@ -0,0 +1,165 @@
+import threading
+
+from PyQt5.QtCore import QObject, QRunnable, QThread, QThreadPool, pyqtSignal
+
+from models.csv_importer import import_csv
+from models.database_manager import DatabaseManager
+
+class CsvImportWorker(QThread):
+    """
+    Streams a CSV import on a background thread so the Qt event loop stays
+    responsive. Each chunk is committed in its own transaction.
+    """
+    progress = pyqtSignal(int)          # Percent of the file processed
+    import_finished = pyqtSignal(dict)  # Final report from models.csv_importer.import_csv
+    import_failed = pyqtSignal(str)
+
+    def __init__(self, path, kind, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.kind = kind
+
+    def run(self):
+        report = {'rows': 0, 'written': 0, 'failed_count': 0, 'failed': []}
+        try:
+            for bytes_read, total_bytes, report in import_csv(self.path, self.kind):
+                self.progress.emit(int(bytes_read * 100 / total_bytes) if total_bytes else 100)
+                if self.isInterruptionRequested():
+                    report['cancelled'] = True
+                    break
+            self.import_finished.emit(report)
+        except Exception as e:
+            self.import_failed.emit(str(e))
+        finally:
+            # This thread's pooled connection would otherwise outlive the thread
+            DatabaseManager.pool.close_thread_connections()
+
+class DbTaskSignals(QObject):
+    # task_id, result, error message (None on success)
+    finished = pyqtSignal(int, object, object)
+
+class DbTask(QRunnable):
+    """ One model call executed on a QThreadPool thread. """
+    def __init__(self, task_id, fn, args, kwargs):
+        super().__init__()
+        self.setAutoDelete(False)  # DataAccess owns the task until its result is delivered
+        self.task_id = task_id
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = DbTaskSignals()
+        self.cancelled = False
+        self.connection = None
+        # cancel() runs on the GUI thread while run() sets and clears the connection on a pool thread
+        self._lock = threading.Lock()
+
+    def run(self):
+        with self._lock:
+            if not self.cancelled:
+                # The models reuse this thread's pooled connection, so this is the one to interrupt on cancel
+                self.connection = DatabaseManager().connect()
+        if self.connection is None:
+            # Cancelled after the pool took the task but before it ran; DataAccess still waits for this
+            self.signals.finished.emit(self.task_id, None, None)
+            return
+        try:
+            result, error = self.fn(*self.args, **self.kwargs), None
+        except Exception as e:
+            result, error = None, str(e)
+        finally:
+            with self._lock:
+                # The thread's connection moves on to other tasks; stop targeting it
+                self.connection = None
+        self.signals.finished.emit(self.task_id, result, error)
+
+    def cancel(self):
+        with self._lock:
+            self.cancelled = True
+            if self.connection is not None:
+                # Aborts a query that is still running; a no-op once it has finished
+                self.connection.interrupt()
+
+class DataAccess(QObject):
+    """
+    Runs model calls off the GUI thread and delivers their results back on it.
+    Reads go to a small thread pool; writes go to a single thread so they keep
+    their order. Tasks submitted on a channel (e.g. a page name) replace and
+    cancel any earlier task on the same channel.
+    """
+    busy_changed = pyqtSignal(str, bool)  # channel, busy
+
+    def __init__(self, parent=None, read_threads=2):
+        super().__init__(parent)
+        # Threads never expire, so each keeps its long-lived pooled connection
+        self.read_pool = QThreadPool(self)
+        self.read_pool.setMaxThreadCount(read_threads)
+        self.read_pool.setExpiryTimeout(-1)
+        self.write_pool = QThreadPool(self)
+        self.write_pool.setMaxThreadCount(1)
+        self.write_pool.setExpiryTimeout(-1)
+
+        self._next_id = 0
+        self._tasks = {}     # task_id -> (task, on_result, on_error, on_cancel, channel)
+        self._channels = {}  # channel -> task_id
+
+    def submit(self, fn, *args, channel=None, write=False, on_result=None, on_error=None, on_cancel=None,
+               **kwargs):
+        if channel is not None:
+            self.cancel(channel)
+
+        self._next_id += 1
+        task = DbTask(self._next_id, fn, args, kwargs)
+        task.signals.finished.connect(self._on_task_finished)
+        self._tasks[task.task_id] = (task, on_result, on_error, on_cancel, channel)
+        if channel is not None:
+            self._channels[channel] = task.task_id
+            self.busy_changed.emit(channel, True)
+
+        (self.write_pool if write else self.read_pool).start(task)
+        return task.task_id
+
+    def cancel(self, channel):
+        task_id = self._channels.pop(channel, None)
+        if task_id is None:
+            return
+        task, _, _, on_cancel, _ = self._tasks[task_id]
+        task.cancel()
+        if self.read_pool.tryTake(task) or self.write_pool.tryTake(task):
+            # Never started, so no finished signal will arrive for it
+            del self._tasks[task_id]
+        self.busy_changed.emit(channel, False)
+        if on_cancel is not None:
+            on_cancel()
+
+    def cancel_all(self, keep=()):
+        """ Cancels every channel except those in keep. """
+        for channel in list(self._channels):
+            if channel not in keep:
+                self.cancel(channel)
+
+    def is_busy(self, channel):
+        return channel in self._channels
+
+    def shutdown(self, timeout_ms=3000):
+        self.cancel_all()
+        self.read_pool.waitForDone(timeout_ms)
+        self.write_pool.waitForDone(timeout_ms)
+
+    def _on_task_finished(self, task_id, result, error):
+        entry = self._tasks.pop(task_id, None)
+        if entry is None:
+            return
+        task, on_result, on_error, _, channel = entry
+        if channel is not None and self._channels.get(channel) == task_id:
+            del self._channels[channel]
+            self.busy_changed.emit(channel, False)
+
+        if task.cancelled:
+            return
+        if error is not None:
+            if on_error is not None:
+                on_error(error)
+            else:
+                print(f"Background task error: {error}")
+        elif on_result is not None:
+            on_result(result)